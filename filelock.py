@@ -30,8 +30,10 @@ A platform independent file lock that supports the with-statement.
 
 # Modules
 # ------------------------------------------------
+import json
 import logging
 import os
+import socket
 import threading
 import time
 try:
@@ -71,6 +73,10 @@ __all__ = [
 
 __version__ = "3.0.12"
 
+#: Free-form description of what this process is doing, recorded in every lock
+#: file it holds so that waiters can tell who they are waiting for.
+holder_note = ""
+
 
 _logger = None
 def logger():
@@ -131,7 +137,7 @@ class BaseFileLock(object):
     Implements the base class of a file lock.
     """
 
-    def __init__(self, lock_file, timeout = -1):
+    def __init__(self, lock_file, timeout = -1, report_after = 5):
         """
         """
         # The path to the lock file.
@@ -153,6 +159,15 @@ class BaseFileLock(object):
         # mechanism. Whenever the lock is acquired, the counter is increased and
         # the lock is only released, when this value is 0 again.
         self._lock_counter = 0
+
+        # After waiting this many seconds for the lock, log who holds it.
+        # None disables the report.
+        self.report_after = report_after
+
+        #: Total seconds spent in :meth:`acquire` and the number of attempts
+        #: made to take the lock, over the lifetime of this object.
+        self.wait_time = 0.0
+        self.attempts = 0
         return None
 
     @property
@@ -202,6 +217,68 @@ class BaseFileLock(object):
         """
         raise NotImplementedError()
 
+    def _write_holder(self, fd):
+        """
+        Records this process as the holder in the lock file.
+        """
+        info = {
+            "pid": os.getpid(),
+            "host": socket.gethostname(),
+            "since": time.time(),
+            "note": holder_note,
+        }
+        try:
+            os.ftruncate(fd, 0)
+            os.write(fd, (json.dumps(info) + "\n").encode("utf-8", "surrogateescape"))
+        except OSError:
+            # The lock itself still works.
+            pass
+        return None
+
+    def holder(self):
+        """
+        Returns the holder information recorded in the lock file as a dict,
+        or None if there is none.
+
+        A holder on this host whose process no longer exists is marked with
+        ``"stale": True``. The lock then was inherited by a child of that
+        process, which keeps it until it exits.
+        """
+        try:
+            with open(self._lock_file, "r") as f:
+                info = json.loads(f.readline())
+            pid = int(info["pid"])
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+        info["stale"] = False
+        if info.get("host") == socket.gethostname():
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                info["stale"] = True
+            except OSError:
+                pass
+        return info
+
+    def _report_holder(self, waited):
+        info = self.holder()
+        if info is None:
+            logger().warning('Waited %.1f seconds for lock on %s, holder unknown',
+                             waited, self._lock_file)
+        elif info["stale"]:
+            logger().error(
+                'Waited %.1f seconds for lock on %s, held since %s by pid %s (%s) '
+                'which has exited; one of its child processes still holds the lock',
+                waited, self._lock_file, time.ctime(info.get("since", 0)),
+                info["pid"], info.get("note", ""))
+        else:
+            logger().warning(
+                'Waited %.1f seconds for lock on %s, held since %s by pid %s on %s (%s)',
+                waited, self._lock_file, time.ctime(info.get("since", 0)),
+                info["pid"], info.get("host", "?"), info.get("note", ""))
+        return None
+
     # Platform independent methods
     # --------------------------------------------
 
@@ -263,20 +340,26 @@ class BaseFileLock(object):
         lock_id = id(self)
         lock_filename = self._lock_file
         start_time = time.time()
+        reported = False
         try:
             while True:
                 with self._thread_lock:
                     if not self.is_locked:
                         logger().debug('Attempting to acquire lock %s on %s', lock_id, lock_filename)
+                        self.attempts += 1
                         self._acquire()
 
+                waited = time.time() - start_time
                 if self.is_locked:
                     logger().info('Lock %s acquired on %s', lock_id, lock_filename)
                     break
-                elif timeout >= 0 and time.time() - start_time > timeout:
+                elif timeout >= 0 and waited > timeout:
                     logger().debug('Timeout on acquiring lock %s on %s', lock_id, lock_filename)
                     raise Timeout(self._lock_file)
                 else:
+                    if not reported and self.report_after is not None and waited >= self.report_after:
+                        self._report_holder(waited)
+                        reported = True
                     logger().debug(
                         'Lock %s not acquired on %s, waiting %s seconds ...',
                         lock_id, lock_filename, poll_intervall
@@ -288,6 +371,8 @@ class BaseFileLock(object):
                 self._lock_counter = max(0, self._lock_counter - 1)
 
             raise
+        finally:
+            self.wait_time += time.time() - start_time
         return _Acquire_ReturnProxy(lock = self)
 
     def release(self, force = False):
@@ -380,7 +465,8 @@ class UnixFileLock(BaseFileLock):
     """
 
     def _acquire(self):
-        open_mode = os.O_RDWR | os.O_CREAT | os.O_TRUNC
+        # Don't truncate here, the file holds the current holder's information.
+        open_mode = os.O_RDWR | os.O_CREAT
         fd = os.open(self._lock_file, open_mode)
 
         try:
@@ -388,6 +474,7 @@ class UnixFileLock(BaseFileLock):
         except (IOError, OSError):
             os.close(fd)
         else:
+            self._write_holder(fd)
             self._lock_file_fd = fd
         return None
 
@@ -398,6 +485,10 @@ class UnixFileLock(BaseFileLock):
         #   https://stackoverflow.com/questions/17708885/flock-removing-locked-file-without-race-condition
         fd = self._lock_file_fd
         self._lock_file_fd = None
+        try:
+            os.ftruncate(fd, 0)
+        except OSError:
+            pass
         fcntl.flock(fd, fcntl.LOCK_UN)
         os.close(fd)
         return None
@@ -417,6 +508,7 @@ class SoftFileLock(BaseFileLock):
         except (IOError, OSError):
             pass
         else:
+            self._write_holder(fd)
             self._lock_file_fd = fd
         return None
 
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+
+# usage: fozdb.py list|compact|discard-transcoded|merge|trim ...
+
+"""
+Tools for the Fossilize StreamArchive databases written by media-converter
+(see media-converter/src/fossilize.rs for the format). Entries are streamed
+from disk; only their headers are kept in memory.
+"""
+
+import collections
+import os
+import sys
+import zlib
+
+FOSSILIZE_MAGIC = b"\x81FOSSILIZEDB"
+FOSSILIZE_MIN_COMPAT_VERSION = 5
+FOSSILIZE_VERSION = 6
+MAGIC_LEN_BYTES = 12 + 4
+
+PAYLOAD_NAME_LEN_BYTES = 40
+PAYLOAD_HEADER_LEN_BYTES = 4 * 4
+ENTRY_HEADER_LEN_BYTES = PAYLOAD_NAME_LEN_BYTES + PAYLOAD_HEADER_LEN_BYTES
+TAG_ASCII_LEN = 8
+
+FOSSILIZE_COMPRESSION_NONE = 1
+
+BUFFER_COPY_BYTES = 8 * 1024 * 1024
+
+# tags used by media-converter/src/audioconv/imp.rs
+AUDIOCONV_FOZ_TAG_STREAM = 0
+AUDIOCONV_FOZ_TAG_CODECINFO = 1
+AUDIOCONV_FOZ_TAG_AUDIODATA = 2
+AUDIOCONV_FOZ_TAG_PTNADATA = 3
+
+# tags used by media-converter/src/videoconv/imp.rs
+VIDEOCONV_FOZ_TAG_VIDEODATA = 0
+VIDEOCONV_FOZ_TAG_OGVDATA = 1
+VIDEOCONV_FOZ_TAG_STREAM = 2
+VIDEOCONV_FOZ_TAG_MKVDATA = 3
+
+# (stream tag, tags of the chunks a stream lists) for the dump databases
+STREAM_TAGS = {
+    "audio": (AUDIOCONV_FOZ_TAG_STREAM, (AUDIOCONV_FOZ_TAG_AUDIODATA, AUDIOCONV_FOZ_TAG_CODECINFO)),
+    "video": (VIDEOCONV_FOZ_TAG_STREAM, (VIDEOCONV_FOZ_TAG_VIDEODATA,)),
+}
+
+class CorruptDatabase(Exception):
+    pass
+
+Entry = collections.namedtuple("Entry", ["tag", "hash", "offset", "size", "flags", "crc", "full_size"])
+Entry.__doc__ = "An archive entry. offset is that of the entry header, the payload follows it."
+
+def entry_disk_size(entry):
+    return ENTRY_HEADER_LEN_BYTES + entry.size
+
+def read_header(fd):
+    magic_and_version = os.pread(fd, MAGIC_LEN_BYTES, 0)
+    if len(magic_and_version) == 0:
+        return False
+    if len(magic_and_version) != MAGIC_LEN_BYTES or magic_and_version[0:12] != FOSSILIZE_MAGIC or \
+            not FOSSILIZE_MIN_COMPAT_VERSION <= magic_and_version[15] <= FOSSILIZE_VERSION:
+        raise CorruptDatabase()
+    return True
+
+def iter_entries(fd):
+    '''Yields the complete entries in the archive open as fd, in file order. A
+    truncated entry at the end of the file is not fatal and ends the iteration.'''
+    if not read_header(fd):
+        return
+    file_size = os.fstat(fd).st_size
+    offset = MAGIC_LEN_BYTES
+    while offset + ENTRY_HEADER_LEN_BYTES <= file_size:
+        dat = os.pread(fd, ENTRY_HEADER_LEN_BYTES, offset)
+        try:
+            tag = int(dat[0:TAG_ASCII_LEN], 16)
+            hash_ = int(dat[TAG_ASCII_LEN:PAYLOAD_NAME_LEN_BYTES], 16)
+        except ValueError:
+            raise CorruptDatabase()
+        size, flags, crc, full_size = (int.from_bytes(dat[i:i + 4], "little")
+                for i in range(PAYLOAD_NAME_LEN_BYTES, ENTRY_HEADER_LEN_BYTES, 4))
+        entry = Entry(tag, hash_, offset, size, flags, crc, full_size)
+        if offset + entry_disk_size(entry) > file_size:
+            break
+        yield entry
+        offset += entry_disk_size(entry)
+
+def iter_payload(fd, entry):
+    "Yields the payload of entry in pieces of at most BUFFER_COPY_BYTES"
+    pos = entry.offset + ENTRY_HEADER_LEN_BYTES
+    end = pos + entry.size
+    while pos < end:
+        buf = os.pread(fd, min(end - pos, BUFFER_COPY_BYTES), pos)
+        if len(buf) == 0:
+            raise CorruptDatabase()
+        pos += len(buf)
+        yield buf
+
+def read_payload(fd, entry):
+    "Reads a whole payload. Only used for stream entries, which are small lists of chunk hashes"
+    return b"".join(iter_payload(fd, entry))
+
+def check_crc(fd, entry):
+    if entry.crc == 0:
+        return True
+    crc = 0
+    for buf in iter_payload(fd, entry):
+        crc = zlib.crc32(buf, crc)
+    return crc == entry.crc
+
+def stream_chunks(payload):
+    "Chunk hashes listed in a stream entry, each a little-endian u128"
+    return [int.from_bytes(payload[i:i + 16], "little") for i in range(0, len(payload) - 15, 16)]
+
+def index(fd):
+    "Maps (tag, hash) to the first entry with that name"
+    ret = {}
+    for entry in iter_entries(fd):
+        ret.setdefault((entry.tag, entry.hash), entry)
+    return ret
+
+def copy_range(fd_in, fd_out, src, dst, length):
+    while length > 0:
+        buf = os.pread(fd_in, min(length, BUFFER_COPY_BYTES), src)
+        if len(buf) == 0:
+            raise CorruptDatabase()
+        os.pwrite(fd_out, buf, dst)
+        src += len(buf)
+        dst += len(buf)
+        length -= len(buf)
+
+def rewrite(path, discard=frozenset()):
+    '''Rewrites the archive in place, dropping entries named in discard,
+    duplicate entries and a truncated trailing entry. Like
+    StreamArchive::discard_entries, entries only ever move towards the start of
+    the file, so no temporary copy is needed. Returns the number of bytes freed.'''
+    fd = os.open(path, os.O_RDWR)
+    try:
+        old_size = os.fstat(fd).st_size
+        if not read_header(fd):
+            return 0
+        seen = set()
+        write_pos = MAGIC_LEN_BYTES
+        for entry in iter_entries(fd):
+            name = (entry.tag, entry.hash)
+            if name in discard or name in seen:
+                continue
+            seen.add(name)
+            if entry.offset != write_pos:
+                copy_range(fd, fd, entry.offset, write_pos, entry_disk_size(entry))
+            write_pos += entry_disk_size(entry)
+        os.ftruncate(fd, write_pos)
+        return old_size - write_pos
+    finally:
+        os.close(fd)
+
+def rewrite_copy(path, discard=frozenset()):
+    '''Like rewrite, but writes the entries it keeps to a temporary file and
+    renames that over path. An interrupted rewrite leaves path as it was, and a
+    writer still appending to path goes on with the old file rather than
+    corrupting the new one. Returns the number of bytes freed.'''
+    tmp_path = path + ".tmp"
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        st = os.fstat(fd)
+        if not read_header(fd):
+            return 0
+        tmp_fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, st.st_mode & 0o777)
+        try:
+            copy_range(fd, tmp_fd, 0, 0, MAGIC_LEN_BYTES)
+            seen = set()
+            write_pos = MAGIC_LEN_BYTES
+            for entry in iter_entries(fd):
+                name = (entry.tag, entry.hash)
+                if name in discard or name in seen:
+                    continue
+                seen.add(name)
+                copy_range(fd, tmp_fd, entry.offset, write_pos, entry_disk_size(entry))
+                write_pos += entry_disk_size(entry)
+            os.fsync(tmp_fd)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        finally:
+            os.close(tmp_fd)
+        os.replace(tmp_path, path)
+        return st.st_size - write_pos
+    finally:
+        os.close(fd)
+
+def transcoded_entries(kind, dump_path, transcoded_path):
+    '''Returns the names of the entries in the dump database which are no longer
+    needed because the transcoded database has a conversion for them, using the
+    same rules as discard_transcoded() in media-converter.'''
+    dump_fd = os.open(dump_path, os.O_RDONLY)
+    transcoded_fd = os.open(transcoded_path, os.O_RDONLY)
+    try:
+        transcoded = set(index(transcoded_fd))
+        to_discard = set()
+        to_keep = set()
+        for entry in index(dump_fd).values():
+            if kind == "audio" and entry.tag == AUDIOCONV_FOZ_TAG_STREAM:
+                chunks = stream_chunks(read_payload(dump_fd, entry))
+                has_all = all((AUDIOCONV_FOZ_TAG_PTNADATA, c) in transcoded for c in chunks)
+                dst = to_discard if has_all else to_keep
+                for c in chunks:
+                    dst.add((AUDIOCONV_FOZ_TAG_AUDIODATA, c))
+                    dst.add((AUDIOCONV_FOZ_TAG_CODECINFO, c))
+                if has_all:
+                    to_discard.add((entry.tag, entry.hash))
+            elif kind == "video" and entry.tag == VIDEOCONV_FOZ_TAG_STREAM:
+                if (VIDEOCONV_FOZ_TAG_MKVDATA, entry.hash) in transcoded:
+                    for c in stream_chunks(read_payload(dump_fd, entry)):
+                        to_discard.add((VIDEOCONV_FOZ_TAG_VIDEODATA, c))
+                    to_discard.add((entry.tag, entry.hash))
+        return to_discard - to_keep
+    finally:
+        os.close(dump_fd)
+        os.close(transcoded_fd)
+
+def merge(dst_path, src_paths):
+    '''Appends the entries of src_paths which dst_path doesn't have yet.
+    Returns the number of entries added.'''
+    fd = os.open(dst_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if read_header(fd):
+            names = set(index(fd))
+            #drop a truncated trailing entry rather than appending after it
+            write_pos = MAGIC_LEN_BYTES
+            for entry in iter_entries(fd):
+                write_pos = entry.offset + entry_disk_size(entry)
+        else:
+            os.pwrite(fd, FOSSILIZE_MAGIC + bytes((0, 0, 0, FOSSILIZE_VERSION)), 0)
+            names = set()
+            write_pos = MAGIC_LEN_BYTES
+        os.ftruncate(fd, write_pos)
+
+        added = 0
+        for src_path in src_paths:
+            src_fd = os.open(src_path, os.O_RDONLY)
+            try:
+                for entry in iter_entries(src_fd):
+                    if (entry.tag, entry.hash) in names:
+                        continue
+                    names.add((entry.tag, entry.hash))
+                    copy_range(src_fd, fd, entry.offset, write_pos, entry_disk_size(entry))
+                    write_pos += entry_disk_size(entry)
+                    added += 1
+            finally:
+                os.close(src_fd)
+        return added
+    finally:
+        os.close(fd)
+
+def eviction_set(kind, path, budget):
+    '''Picks whole streams to drop from a dump database until it fits in budget
+    bytes. The format records no access times, so streams are evicted in the
+    order they were recorded, oldest first. Chunks shared with a stream which is
+    kept are kept too, and chunks no stream refers to go first.'''
+    stream_tag, chunk_tags = STREAM_TAGS[kind]
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        entries = index(fd)
+        total = MAGIC_LEN_BYTES + sum(entry_disk_size(e) for e in entries.values())
+        if total <= budget:
+            return set()
+
+        streams = []
+        refcount = collections.Counter()
+        for name, entry in sorted(entries.items(), key=lambda i: i[1].offset):
+            if entry.tag == stream_tag:
+                chunks = set()
+                for c in stream_chunks(read_payload(fd, entry)):
+                    for t in chunk_tags:
+                        if (t, c) in entries:
+                            chunks.add((t, c))
+                streams.append((name, chunks))
+                refcount.update(chunks)
+    finally:
+        os.close(fd)
+
+    evict = set()
+    for name, entry in entries.items():
+        if entry.tag in chunk_tags and refcount[name] == 0:
+            evict.add(name)
+            total -= entry_disk_size(entry)
+
+    for name, chunks in streams:
+        if total <= budget:
+            break
+        evict.add(name)
+        total -= entry_disk_size(entries[name])
+        for c in chunks:
+            refcount[c] -= 1
+            if refcount[c] == 0:
+                evict.add(c)
+                total -= entry_disk_size(entries[c])
+
+    return evict
+
+def trim(kind, path, budget):
+    '''Evicts streams from the dump database at path until it fits in budget
+    bytes. Returns bytes freed. Works on a copy, as media-converter may write
+    to the database at any time.'''
+    return rewrite_copy(path, eviction_set(kind, path, budget))
+
+def list_entries(path):
+    "Returns {tag: (count, payload bytes)} for the archive at path"
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        ret = {}
+        for entry in index(fd).values():
+            count, size = ret.get(entry.tag, (0, 0))
+            ret[entry.tag] = (count + 1, size + entry.size)
+        return ret
+    finally:
+        os.close(fd)
+
+def usage():
+    sys.stderr.write("usage: fozdb.py list <db.foz>...\n"
+                     "       fozdb.py compact <db.foz>...\n"
+                     "       fozdb.py discard-transcoded audio|video <dump.foz> <transcoded.foz>\n"
+                     "       fozdb.py merge <dst.foz> <src.foz>...\n"
+                     "       fozdb.py trim audio|video <dump.foz> <max bytes>\n")
+    return 1
+
+def main(argv):
+    if len(argv) < 2:
+        return usage()
+    verb, args = argv[0], argv[1:]
+
+    if verb == "list":
+        for path in args:
+            print(path + ":")
+            for tag, (count, size) in sorted(list_entries(path).items()):
+                print(f"    tag {tag}: {count} entries, {size} bytes")
+    elif verb == "compact":
+        for path in args:
+            print(f"{path}: freed {rewrite(path)} bytes")
+    elif verb == "discard-transcoded" and len(args) == 3 and args[0] in STREAM_TAGS:
+        discard = transcoded_entries(args[0], args[1], args[2])
+        print(f"{args[1]}: discarded {len(discard)} entries, freed {rewrite(args[1], discard)} bytes")
+    elif verb == "merge" and len(args) >= 2:
+        print(f"{args[0]}: added {merge(args[0], args[1:])} entries")
+    elif verb == "trim" and len(args) == 3 and args[0] in STREAM_TAGS:
+        print(f"{args[1]}: freed {trim(args[0], args[1], int(args[2]))} bytes")
+    else:
+        return usage()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,7 +1,7 @@
 extern UGCQueryHandle_t cppISteamUGC_STEAMUGC_INTERFACE_VERSION001_CreateQueryUserUGCRequest(void *, AccountID_t, EUserUGCList, EUGCMatchingUGCType, EUserUGCListSortOrder, AppId_t, AppId_t, uint32);
 extern UGCQueryHandle_t cppISteamUGC_STEAMUGC_INTERFACE_VERSION001_CreateQueryAllUGCRequest(void *, EUGCQuery, EUGCMatchingUGCType, AppId_t, AppId_t, uint32);
 extern SteamAPICall_t cppISteamUGC_STEAMUGC_INTERFACE_VERSION001_SendQueryUGCRequest(void *, UGCQueryHandle_t);
-extern bool cppISteamUGC_STEAMUGC_INTERFACE_VERSION001_GetQueryUGCResult(void *, UGCQueryHandle_t, uint32, winSteamUGCDetails_t_128 *);
+extern bool cppISteamUGC_STEAMUGC_INTERFACE_VERSION001_GetQueryUGCResult(void *, UGCQueryHandle_t, uint32, winSteamUGCDetails_t_129 *);
 extern bool cppISteamUGC_STEAMUGC_INTERFACE_VERSION001_ReleaseQueryUGCRequest(void *, UGCQueryHandle_t);
 extern bool cppISteamUGC_STEAMUGC_INTERFACE_VERSION001_AddRequiredTag(void *, UGCQueryHandle_t, const char *);
 extern bool cppISteamUGC_STEAMUGC_INTERFACE_VERSION001_AddExcludedTag(void *, UGCQueryHandle_t, const char *);
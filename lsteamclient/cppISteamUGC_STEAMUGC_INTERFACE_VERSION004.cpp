@@ -26,12 +26,12 @@ SteamAPICall_t cppISteamUGC_STEAMUGC_INTERFACE_VERSION004_SendQueryUGCRequest(vo
     return ((ISteamUGC*)linux_side)->SendQueryUGCRequest((UGCQueryHandle_t)handle);
 }
 
-bool cppISteamUGC_STEAMUGC_INTERFACE_VERSION004_GetQueryUGCResult(void *linux_side, UGCQueryHandle_t handle, uint32 index, winSteamUGCDetails_t_132x * pDetails)
+bool cppISteamUGC_STEAMUGC_INTERFACE_VERSION004_GetQueryUGCResult(void *linux_side, UGCQueryHandle_t handle, uint32 index, winSteamUGCDetails_t_158 * pDetails)
 {
     SteamUGCDetails_t lin_pDetails;
-    win_to_lin_struct_SteamUGCDetails_t_132x(pDetails, &lin_pDetails);
+    win_to_lin_struct_SteamUGCDetails_t_158(pDetails, &lin_pDetails);
     bool retval = ((ISteamUGC*)linux_side)->GetQueryUGCResult((UGCQueryHandle_t)handle, (uint32)index, &lin_pDetails);
-    lin_to_win_struct_SteamUGCDetails_t_132x(&lin_pDetails, pDetails);
+    lin_to_win_struct_SteamUGCDetails_t_158(&lin_pDetails, pDetails);
     return retval;
 }
 
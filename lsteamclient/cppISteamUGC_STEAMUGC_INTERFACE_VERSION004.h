@@ -1,7 +1,7 @@
 extern UGCQueryHandle_t cppISteamUGC_STEAMUGC_INTERFACE_VERSION004_CreateQueryUserUGCRequest(void *, AccountID_t, EUserUGCList, EUGCMatchingUGCType, EUserUGCListSortOrder, AppId_t, AppId_t, uint32);
 extern UGCQueryHandle_t cppISteamUGC_STEAMUGC_INTERFACE_VERSION004_CreateQueryAllUGCRequest(void *, EUGCQuery, EUGCMatchingUGCType, AppId_t, AppId_t, uint32);
 extern SteamAPICall_t cppISteamUGC_STEAMUGC_INTERFACE_VERSION004_SendQueryUGCRequest(void *, UGCQueryHandle_t);
-extern bool cppISteamUGC_STEAMUGC_INTERFACE_VERSION004_GetQueryUGCResult(void *, UGCQueryHandle_t, uint32, winSteamUGCDetails_t_132x *);
+extern bool cppISteamUGC_STEAMUGC_INTERFACE_VERSION004_GetQueryUGCResult(void *, UGCQueryHandle_t, uint32, winSteamUGCDetails_t_158 *);
 extern bool cppISteamUGC_STEAMUGC_INTERFACE_VERSION004_ReleaseQueryUGCRequest(void *, UGCQueryHandle_t);
 extern bool cppISteamUGC_STEAMUGC_INTERFACE_VERSION004_AddRequiredTag(void *, UGCQueryHandle_t, const char *);
 extern bool cppISteamUGC_STEAMUGC_INTERFACE_VERSION004_AddExcludedTag(void *, UGCQueryHandle_t, const char *);
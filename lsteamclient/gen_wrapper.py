@@ -7,13 +7,29 @@ from __future__ import print_function
 
 CLANG_PATH='/usr/lib/clang/16'
 
-from clang.cindex import CursorKind, Index, Type, TypeKind
-from collections import namedtuple
+#the generated code for each SDK version is kept here and reused for as long as
+#the SDK headers, libclang and this script don't change. <version>-layouts.json
+#has the struct layouts the generated code is based on.
+CACHE_DIR='.gen_cache'
+
+from clang.cindex import Cursor, CursorKind, Index, Type, TypeKind, conf, _CXString
+from collections import Counter, namedtuple
+import argparse
+import contextlib
+import glob
+import gzip
+import hashlib
+import io
+import json
+import multiprocessing
+import pickle
 import pprint
+import random
 import sys
 import os
 import re
 import math
+import time
 
 sdk_versions = [
     "158",
@@ -280,7 +296,12 @@ manual_param_converters = [
 #}
 struct_conversion_cache = {}
 
-converted_structs = []
+#(sdkver, struct name) -> name of the converter it uses
+converted_structs = {}
+#layout and generated code of a converted struct -> name of its converter
+struct_fingerprints = {}
+#converter name -> SDK versions using it and its declarations in struct_converters.h
+struct_converter_decls = {}
 
 # callback classes for which we have a linux wrapper
 wrapped_classes = [
@@ -602,60 +623,117 @@ path_conversions = [
 def strip_const(typename):
     return typename.replace("const ", "", 1)
 
-windows_structs32 = {}
-def find_windows_struct(struct):
-    return windows_structs32.get(strip_const(struct.spelling), None)
-
-windows_structs64 = {}
-def find_windows64_struct(struct):
-    return windows_structs64.get(strip_const(struct.spelling), None)
-
-linux_structs64 = {}
-def find_linux64_struct(struct):
-    return linux_structs64.get(strip_const(struct.spelling), None)
+#the layout of every struct and class in an SDK, for each of the four ABIs, is
+#read from libclang once by read_struct_layouts(). everything that compares
+#layouts afterwards works on these.
+StructLayout = namedtuple('StructLayout', ['spelling', 'size', 'align', 'fields'])
+FieldLayout = namedtuple('FieldLayout', ['spelling', 'offset', 'type', 'is_record'])
+
+abis = ["linux32", "linux64", "windows32", "windows64"]
+
+#{abi: {struct name: StructLayout}} for the SDK being parsed
+struct_layouts = {}
+
+def read_struct_layouts(build):
+    layouts = {}
+    seen = set()
+    for child in build.cursor.get_children():
+        if not child.kind in [CursorKind.STRUCT_DECL, CursorKind.CLASS_DECL,
+                              CursorKind.UNION_DECL, CursorKind.TYPEDEF_DECL]:
+            continue
+        #the first declaration of a name wins
+        if child.spelling in seen:
+            continue
+        seen.add(child.spelling)
+        struct = child.type.get_canonical()
+        if struct.kind != TypeKind.RECORD:
+            continue
+        fields = tuple(FieldLayout(field.spelling, struct.get_offset(field.spelling),
+                                   field.type.spelling, field.type.kind == TypeKind.RECORD)
+                       for field in struct.get_fields())
+        layouts[child.spelling] = StructLayout(child.spelling, struct.get_size(),
+                                               struct.get_align(), fields)
+    return layouts
+
+def find_struct_layout(abi, struct):
+    return struct_layouts[abi].get(strip_const(struct.spelling), None)
+
+def layouts_differ(lin_struct, win_struct):
+    win_offsets = dict((field.spelling, field.offset) for field in win_struct.fields)
+    for field in lin_struct.fields:
+        if field.offset != win_offsets.get(field.spelling, None):
+            return True
+        if field.is_record and \
+                struct_needs_conversion_by_name(strip_const(field.type)):
+            return True
+    return False
 
-def struct_needs_conversion_nocache(struct):
-    if strip_const(struct.spelling) in exempt_structs:
+def struct_needs_conversion_nocache(name):
+    if name in exempt_structs:
         return False
-    if strip_const(struct.spelling) in manually_handled_structs:
+    if name in manually_handled_structs:
         return True
 
     #check 32-bit compat
-    windows_struct = find_windows_struct(struct)
+    windows_struct = struct_layouts["windows32"].get(name, None)
     if windows_struct is None:
-        print("Couldn't find windows struct for " + struct.spelling)
+        print("Couldn't find windows struct for " + name)
     assert(not windows_struct is None) #must find windows_struct
-    for field in struct.get_fields():
-        if struct.get_offset(field.spelling) != windows_struct.get_offset(field.spelling):
-            return True
-        if field.type.kind == TypeKind.RECORD and \
-                struct_needs_conversion(field.type):
-            return True
+    lin_struct = struct_layouts["linux32"].get(name, None)
+    assert(not lin_struct is None) #must find lin_struct
+    if layouts_differ(lin_struct, windows_struct):
+        return True
 
     #check 64-bit compat
-    windows_struct = find_windows64_struct(struct)
+    windows_struct = struct_layouts["windows64"].get(name, None)
     assert(not windows_struct is None) #must find windows_struct
-    lin64_struct = find_linux64_struct(struct)
+    lin64_struct = struct_layouts["linux64"].get(name, None)
     assert(not lin64_struct is None) #must find lin64_struct
-    for field in lin64_struct.get_fields():
-        if lin64_struct.get_offset(field.spelling) != windows_struct.get_offset(field.spelling):
-            return True
-        if field.type.kind == TypeKind.RECORD and \
-                struct_needs_conversion(field.type):
-            return True
+    if layouts_differ(lin64_struct, windows_struct):
+        return True
 
     #check if any members need path conversion
-    path_conv = get_path_converter(struct)
+    path_conv = get_path_converter(lin_struct)
     if path_conv:
         return True
     return False
 
-def struct_needs_conversion(struct):
+def struct_needs_conversion_by_name(name):
     if not sdkver in struct_conversion_cache:
         struct_conversion_cache[sdkver] = {}
-    if not strip_const(struct.spelling) in struct_conversion_cache[sdkver]:
-        struct_conversion_cache[sdkver][strip_const(struct.spelling)] = struct_needs_conversion_nocache(struct)
-    return struct_conversion_cache[sdkver][strip_const(struct.spelling)]
+    if not name in struct_conversion_cache[sdkver]:
+        struct_conversion_cache[sdkver][name] = struct_needs_conversion_nocache(name)
+    return struct_conversion_cache[sdkver][name]
+
+def struct_needs_conversion(struct):
+    return struct_needs_conversion_by_name(strip_const(struct.spelling))
+
+#structs that need conversion get a win<name>_<sdkver> type and converter
+#functions, but SDK versions where the struct is the same share them. the
+#generated code uses a placeholder for the name, which merge_sdk() replaces
+#with the name of the shared converter.
+def converted_struct_name(name):
+    return f"@{name}@"
+
+def dump_struct_layouts(filename):
+    '''Writes the layouts and conversion decisions of the SDK being parsed as
+    JSON, so they can be looked up or diffed against another SDK version.'''
+    db = {}
+    for abi in abis:
+        for name, layout in struct_layouts[abi].items():
+            db.setdefault(name, {})[abi] = {
+                "size": layout.size,
+                "align": layout.align,
+                "fields": [field._asdict() for field in layout.fields],
+            }
+    for name, needs_conversion in struct_conversion_cache.get(sdkver, {}).items():
+        if name in db:
+            db[name]["needs_conversion"] = needs_conversion
+    #one struct per line, for diffing
+    with open(filename, "w") as f:
+        f.write("{\n")
+        f.write(",\n".join(f"{json.dumps(name)}: {json.dumps(db[name], sort_keys=True)}" for name in sorted(db)))
+        f.write("\n}\n")
 
 def handle_destructor(cfile, classname, winclassname, method):
     cfile.write(f"DEFINE_THISCALL_WRAPPER({winclassname}_destructor, 4)\n")
@@ -669,6 +747,8 @@ def get_path_converter(parent):
                 return conv
             if type(parent) == Type:
                 children = list(parent.get_fields())
+            elif type(parent) == StructLayout:
+                children = parent.fields
             else:
                 children = list(parent.get_children())
             for child in children:
@@ -753,7 +833,7 @@ def handle_method(cfile, classname, winclassname, cppname, method, cpp, cpp_h, e
                     struct_needs_conversion(real_type):
                 need_convert.append(param)
                 #preserve pointers
-                win_name = typename.replace(real_type.spelling, f"win{real_type.spelling}_{sdkver}")
+                win_name = typename.replace(real_type.spelling, f"win{converted_struct_name(real_type.spelling)}")
             elif real_type.spelling in manual_type_converters:
                 manual_convert.append(param)
             elif param.spelling in manual_param_converters:
@@ -801,11 +881,11 @@ def handle_method(cfile, classname, winclassname, cppname, method, cpp, cpp_h, e
             assert(param.type.get_pointee().kind == TypeKind.RECORD or \
                     strip_const(real_type.spelling) in manually_handled_structs)
             cpp.write(f"    {strip_const(param.type.get_pointee().spelling)} lin_{param.spelling};\n")
-            cpp.write(f"    win_to_lin_struct_{strip_const(real_type.spelling)}_{sdkver}({param.spelling}, &lin_{param.spelling});\n")
+            cpp.write(f"    win_to_lin_struct_{converted_struct_name(strip_const(real_type.spelling))}({param.spelling}, &lin_{param.spelling});\n")
         else:
             #raw structs
             cpp.write(f"    {param.type.spelling} lin_{param.spelling};\n")
-            cpp.write(f"    win_to_lin_struct_{param.type.spelling}_{sdkver}(&{param.spelling}, &lin_{param.spelling});\n")
+            cpp.write(f"    win_to_lin_struct_{converted_struct_name(param.type.spelling)}(&{param.spelling}, &lin_{param.spelling});\n")
     for param in manual_convert:
         if param.spelling in manual_param_converters:
             cpp.write(f"    {param.spelling} = manual_convert_{param.spelling}({param.spelling});\n")
@@ -904,9 +984,9 @@ def handle_method(cfile, classname, winclassname, cppname, method, cpp, cpp_h, e
                 real_type = param.type
                 while real_type.kind == TypeKind.POINTER:
                     real_type = real_type.get_pointee()
-                cpp.write(f"    lin_to_win_struct_{real_type.spelling}_{sdkver}(&lin_{param.spelling}, {param.spelling});\n")
+                cpp.write(f"    lin_to_win_struct_{converted_struct_name(real_type.spelling)}(&lin_{param.spelling}, {param.spelling});\n")
         else:
-            cpp.write(f"    lin_to_win_struct_{param.type.spelling}_{sdkver}(&lin_{param.spelling}, &{param.spelling});\n")
+            cpp.write(f"    lin_to_win_struct_{converted_struct_name(param.type.spelling)}(&lin_{param.spelling}, &{param.spelling});\n")
     if method.result_type.kind != TypeKind.VOID and \
             len(need_convert) > 0:
         cpp.write("    return retval;\n")
@@ -923,46 +1003,24 @@ def get_iface_version(classname):
             ver = iface_versions[defname]
         else:
             ver = "UNVERSIONED"
-    if classname in class_versions.keys() and ver in class_versions[classname]:
-        return (ver, True)
-    if not classname in class_versions.keys():
-        class_versions[classname] = []
-    class_versions[classname].append(ver)
-    return (ver, False)
+    return ver
 
+#the generated code for a class is returned rather than written out, an older
+#SDK may have the same interface version and then merge_class() drops it
 def handle_class(sdkver, classnode, file):
     children = list(classnode.get_children())
     if len(children) == 0:
-        return
-    (iface_version, already_generated) = get_iface_version(classnode.spelling)
-    if already_generated:
-        return
+        return None
+    iface_version = get_iface_version(classnode.spelling)
     winname = f"win{classnode.spelling}"
     cppname = f"cpp{classnode.spelling}_{iface_version}"
 
-    file_exists = os.path.isfile(f"{winname}.c")
-    cfile = open(f"{winname}.c", "a")
-    if not file_exists:
-        cfile.write("""/* This file is auto-generated, do not edit. */
-#include <stdarg.h>
-
-#include "windef.h"
-#include "winbase.h"
-#include "wine/debug.h"
+    cfile = io.StringIO()
+    cpp = io.StringIO()
+    cpp_h = io.StringIO()
+    constructors = io.StringIO()
+    constructors_table = io.StringIO()
 
-#include "cxx.h"
-
-#include "steam_defs.h"
-
-#include "steamclient_private.h"
-
-#include "struct_converters.h"
-
-WINE_DEFAULT_DEBUG_CHANNEL(steamclient);
-
-""")
-
-    cpp = open(f"{cppname}.cpp", "w")
     cpp.write("#include \"steam_defs.h\"\n")
     cpp.write("#pragma push_macro(\"__cdecl\")\n")
     cpp.write("#undef __cdecl\n")
@@ -979,8 +1037,6 @@ WINE_DEFAULT_DEBUG_CHANNEL(steamclient);
     cpp.write("#include \"struct_converters.h\"\n")
     cpp.write(f"#include \"{cppname}.h\"\n")
 
-    cpp_h = open(f"{cppname}.h", "w")
-
     winclassname = f"win{classnode.spelling}_{iface_version}"
     cfile.write(f"#include \"{cppname}.h\"\n\n")
     cfile.write(f"typedef struct __{winclassname} {{\n")
@@ -1018,35 +1074,50 @@ WINE_DEFAULT_DEBUG_CHANNEL(steamclient);
 
     cpp.write("#ifdef __cplusplus\n}\n#endif\n")
 
-    constructors = open("win_constructors.h", "a")
     constructors.write(f"extern void *create_{winclassname}(void *);\n")
 
-    constructors = open("win_constructors_table.dat", "a")
-    constructors.write(f"    {{\"{iface_version}\", &create_{winclassname}}},\n")
+    constructors_table.write(f"    {{\"{iface_version}\", &create_{winclassname}}},\n")
     if iface_version in aliases.keys():
         for alias in aliases[iface_version]:
-            constructors.write(f"    {{\"{alias}\", &create_{winclassname}}}, /* alias */\n")
-
-
-generated_cb_handlers = []
-generated_cb_ids = []
+            constructors_table.write(f"    {{\"{alias}\", &create_{winclassname}}}, /* alias */\n")
+
+    return {
+        "kind": "class",
+        "class": classnode.spelling,
+        "version": iface_version,
+        "winname": winname,
+        "cppname": cppname,
+        "c": cfile.getvalue(),
+        "cpp": cpp.getvalue(),
+        "cpp_h": cpp_h.getvalue(),
+        "constructors": constructors.getvalue(),
+        "constructors_table": constructors_table.getvalue(),
+    }
+
+
+generated_cb_handlers = set()
+generated_cb_ids = set()
 cpp_files_need_close_brace = []
 cb_table = {}
 cb_table64 = {}
+cb_converter_table = {"__i386__": [], "__x86_64__": []}
 
 def get_field_attribute_str(field):
     if field.type.kind != TypeKind.RECORD:
         return ""
-    win_struct = find_windows_struct(field.type)
+    win_struct = find_struct_layout("windows32", field.type)
     if win_struct is None:
         align = field.type.get_align()
     else:
-        align = win_struct.get_align()
+        align = win_struct.align
     return " __attribute__((aligned(" + str(align) + ")))"
 
 #because of struct packing differences between win32 and linux, we
 #need to convert these structs from their linux layout to the win32
 #layout.
+#
+#like handle_class(), this returns the generated code and leaves it to
+#merge_struct() or merge_callback() to decide whether it is still needed.
 def handle_struct(sdkver, struct):
     members = struct.get_children()
     cb_num = None
@@ -1062,6 +1133,8 @@ def handle_struct(sdkver, struct):
 
     w2l_handler_name = None
     l2w_handler_name = None
+    hfile = io.StringIO()
+    cppfile = io.StringIO()
 
     def dump_win_struct(to_file, name):
         to_file.write("#pragma pack( push, 8 )\n")
@@ -1072,7 +1145,7 @@ def handle_struct(sdkver, struct):
                     to_file.write(f"    {m.type.element_type.spelling} {m.displayname}[{m.type.element_count}];\n")
                 elif m.type.kind == TypeKind.RECORD and \
                         struct_needs_conversion(m.type):
-                    to_file.write(f"    win{m.type.spelling}_{sdkver} {m.displayname};\n")
+                    to_file.write(f"    win{converted_struct_name(m.type.spelling)} {m.displayname};\n")
                 else:
                     if m.type.kind == TypeKind.POINTER and \
                             (m.type.get_pointee().kind == TypeKind.UNEXPOSED or m.type.get_pointee().kind == TypeKind.FUNCTIONPROTO):
@@ -1083,91 +1156,62 @@ def handle_struct(sdkver, struct):
         to_file.write("#pragma pack( pop )\n")
 
     if cb_num is None:
-        hfile = open("struct_converters.h", "a")
-
         if not has_fields:
-            return
+            return None
         if struct.spelling == "":
-            return
+            return None
         if not struct_needs_conversion(struct.type):
-            return
-
-        struct_name = f"{struct.displayname}_{sdkver}"
+            return None
 
-        if struct_name in converted_structs:
-            return
-        converted_structs.append(struct_name)
+        struct_name = converted_struct_name(struct.displayname)
 
         w2l_handler_name = f"win_to_lin_struct_{struct_name}"
         l2w_handler_name = f"lin_to_win_struct_{struct_name}"
         l2w_handler_name64 = None
 
-        hfile.write(f"#if defined(SDKVER_{sdkver}) || !defined(__cplusplus)\n")
         dump_win_struct(hfile, struct_name)
         hfile.write(f"typedef struct win{struct_name} win{struct_name};\n")
         hfile.write(f"struct {struct.displayname};\n")
 
         if strip_const(struct.spelling) in manually_handled_structs:
             hfile.write("#endif\n\n")
-            return
+            return {
+                "kind": "struct",
+                "name": struct.displayname,
+                "layouts": None,
+                "h": hfile.getvalue(),
+                "cpp": None,
+            }
 
         hfile.write(f"extern void {w2l_handler_name}(const struct win{struct_name} *w, struct {struct.displayname} *l);\n")
         hfile.write(f"extern void {l2w_handler_name}(const struct {struct.displayname} *l, struct win{struct_name} *w);\n")
         hfile.write("#endif\n\n")
     else:
         #for callbacks, we use the windows struct size in the cb dispatch switch
-        windows_struct = find_windows_struct(struct.type)
-        windows_struct64 = find_windows64_struct(struct.type)
-        struct64 = find_linux64_struct(struct.type)
-        struct_name = f"{struct.displayname}_{windows_struct.get_size()}"
+        windows_struct = find_struct_layout("windows32", struct.type)
+        windows_struct64 = find_struct_layout("windows64", struct.type)
+        struct64 = find_struct_layout("linux64", struct.type)
+        struct_name = f"{struct.displayname}_{windows_struct.size}"
         l2w_handler_name = f"cb_{struct_name}"
-        if windows_struct64.get_size() != windows_struct.get_size():
-            struct_name64 = f"{struct.displayname}_{windows_struct64.get_size()}"
+        if windows_struct64.size != windows_struct.size:
+            struct_name64 = f"{struct.displayname}_{windows_struct64.size}"
             l2w_handler_name64 = f"cb_{struct_name64}"
         else:
             l2w_handler_name64 = None
-        if l2w_handler_name in generated_cb_handlers:
-            # we already have a handler for the callback struct of this size
-            return
         if not struct_needs_conversion(struct.type):
-            return
+            return None
 
         cb_id = cb_num | (struct.type.get_size() << 16)
-        cb_id64 = cb_num | (struct64.get_size() << 16)
-        if cb_id in generated_cb_ids:
-            # either this cb changed name, or steam used the same ID for different structs
-            return
+        cb_id64 = cb_num | (struct64.size << 16)
 
-        generated_cb_ids.append(cb_id)
-
-        datfile = open("cb_converters.dat", "a")
+        #(arch, cb_id, windows size, converter) for the Steam_BGetCallback table
         if l2w_handler_name64:
-            datfile.write("#ifdef __i386__\n")
-            datfile.write(f"case 0x{cb_id:08x}: win_msg->m_cubParam = {windows_struct.get_size()}; win_msg->m_pubParam = HeapAlloc(GetProcessHeap(), 0, win_msg->m_cubParam); {l2w_handler_name}((void*)lin_msg.m_pubParam, (void*)win_msg->m_pubParam); break;\n")
-            datfile.write("#endif\n")
-
-            datfile.write("#ifdef __x86_64__\n")
-            datfile.write(f"case 0x{cb_id64:08x}: win_msg->m_cubParam = {windows_struct64.get_size()}; win_msg->m_pubParam = HeapAlloc(GetProcessHeap(), 0, win_msg->m_cubParam); {l2w_handler_name64}((void*)lin_msg.m_pubParam, (void*)win_msg->m_pubParam); break;\n")
-            datfile.write("#endif\n")
+            converters = [("__i386__", cb_id, windows_struct.size, l2w_handler_name),
+                          ("__x86_64__", cb_id64, windows_struct64.size, l2w_handler_name64)]
         else:
-            datfile.write(f"case 0x{cb_id:08x}: win_msg->m_cubParam = {windows_struct.get_size()}; win_msg->m_pubParam = HeapAlloc(GetProcessHeap(), 0, win_msg->m_cubParam); {l2w_handler_name}((void*)lin_msg.m_pubParam, (void*)win_msg->m_pubParam); break;\n")
-
-        generated_cb_handlers.append(l2w_handler_name)
+            converters = [(arch, cb_id, windows_struct.size, l2w_handler_name)
+                          for arch in ("__i386__", "__x86_64__")]
 
-        if not cb_num in cb_table.keys():
-            # latest SDK linux size, list of windows struct sizes and names
-            cb_table[cb_num] = (struct.type.get_size(), [])
-            if l2w_handler_name64:
-                cb_table64[cb_num] = (struct64.get_size(), [])
-            else:
-                cb_table64[cb_num] = (struct.type.get_size(), [])
-        cb_table[cb_num][1].append((windows_struct.get_size(), struct_name))
-        if l2w_handler_name64:
-            cb_table64[cb_num][1].append((windows_struct64.get_size(), struct_name64))
-        else:
-            cb_table64[cb_num][1].append((windows_struct.get_size(), struct_name))
-
-        hfile = open("cb_converters.h", "a")
         hfile.write(f"struct {struct.displayname};\n")
         if l2w_handler_name64:
             hfile.write("#ifdef __i386__\n")
@@ -1182,31 +1226,6 @@ def handle_struct(sdkver, struct):
             hfile.write(f"struct win{struct_name};\n")
             hfile.write(f"extern void {l2w_handler_name}(const struct {struct.displayname} *l, struct win{struct_name} *w);\n\n")
 
-    cppname = f"struct_converters_{sdkver}.cpp"
-    file_exists = os.path.isfile(cppname)
-    cppfile = open(cppname, "a")
-    if not file_exists:
-        cppfile.write("#include \"steam_defs.h\"\n")
-        cppfile.write("#pragma push_macro(\"__cdecl\")\n")
-        cppfile.write("#undef __cdecl\n")
-        cppfile.write("#define __cdecl\n")
-        cppfile.write(f"#include \"steamworks_sdk_{sdkver}/steam_api.h\"\n")
-        cppfile.write(f"#include \"steamworks_sdk_{sdkver}/isteamgameserver.h\"\n")
-        if os.path.isfile(f"steamworks_sdk_{sdkver}/isteamnetworkingsockets.h"):
-            cppfile.write(f"#include \"steamworks_sdk_{sdkver}/isteamnetworkingsockets.h\"\n")
-        if os.path.isfile(f"steamworks_sdk_{sdkver}/isteamgameserverstats.h"):
-            cppfile.write(f"#include \"steamworks_sdk_{sdkver}/isteamgameserverstats.h\"\n")
-        if os.path.isfile(f"steamworks_sdk_{sdkver}/isteamgamecoordinator.h"):
-            cppfile.write(f"#include \"steamworks_sdk_{sdkver}/isteamgamecoordinator.h\"\n")
-        if os.path.isfile(f"steamworks_sdk_{sdkver}/steamnetworkingtypes.h"):
-            cppfile.write(f"#include \"steamworks_sdk_{sdkver}/steamnetworkingtypes.h\"\n")
-        cppfile.write("#pragma pop_macro(\"__cdecl\")\n")
-        cppfile.write("#include \"steamclient_private.h\"\n")
-        cppfile.write("extern \"C\" {\n")
-        cppfile.write(f"#define SDKVER_{sdkver}\n")
-        cppfile.write("#include \"struct_converters.h\"\n")
-        cpp_files_need_close_brace.append(cppname)
-
     path_conv = get_path_converter(struct.type)
 
     def handle_field(m, src, dst):
@@ -1217,7 +1236,7 @@ def handle_struct(sdkver, struct):
                 cppfile.write(f"    memcpy({dst}->{m.displayname}, {src}->{m.displayname}, sizeof({dst}->{m.displayname}));\n")
             elif m.type.kind == TypeKind.RECORD and \
                     struct_needs_conversion(m.type):
-                cppfile.write(f"    {src}_to_{dst}_struct_{m.type.spelling}_{sdkver}(&{src}->{m.displayname}, &{dst}->{m.displayname});\n")
+                cppfile.write(f"    {src}_to_{dst}_struct_{converted_struct_name(m.type.spelling)}(&{src}->{m.displayname}, &{dst}->{m.displayname});\n")
             elif path_conv and m.displayname in path_conv["l2w_names"]:
                 for i in range(len(path_conv["l2w_names"])):
                     if path_conv["l2w_names"][i] == m.displayname:
@@ -1265,108 +1284,804 @@ def handle_struct(sdkver, struct):
         else:
             cppfile.write("\n")
 
+    if cb_num is None:
+        return {
+            "kind": "struct",
+            "name": struct.displayname,
+            "layouts": tuple(find_struct_layout(abi, struct.type) for abi in abis),
+            "h": hfile.getvalue(),
+            "cpp": cppfile.getvalue(),
+        }
+
+    if l2w_handler_name64:
+        cb_entry64 = (windows_struct64.size, struct_name64)
+        linux_size64 = struct64.size
+    else:
+        cb_entry64 = (windows_struct.size, struct_name)
+        linux_size64 = struct.type.get_size()
+    return {
+        "kind": "callback",
+        "handler": l2w_handler_name,
+        "cb_id": cb_id,
+        "cb_num": cb_num,
+        "linux_size": struct.type.get_size(),
+        "linux_size64": linux_size64,
+        "cb_entry": (windows_struct.size, struct_name),
+        "cb_entry64": cb_entry64,
+        "converters": converters,
+        "h": hfile.getvalue(),
+        "cpp": cppfile.getvalue(),
+    }
+
+#everything that is generated, gen.sh used to delete these before running us
+generated_file_patterns = ["win*.h", "win*.c", "win*.dat", "cpp*.cpp", "cpp*.h",
+                           "struct*.h", "struct*.cpp", "struct*.dat", "cb*.dat", "cb*.h"]
+
+class OutputFiles(object):
+    '''The generated files are collected here and written out by flush() at the
+    end, so files whose contents don't change keep their timestamps and don't
+    cause a rebuild.'''
+
+    def __init__(self):
+        self.files = {}
+
+    def __contains__(self, name):
+        return name in self.files
+
+    def open(self, name, mode):
+        if mode == "w" or not name in self.files:
+            self.files[name] = io.StringIO()
+        return self.files[name]
+
+    def flush(self):
+        written = 0
+        for name, contents in self.files.items():
+            data = contents.getvalue().encode()
+            try:
+                with open(name, "rb") as f:
+                    if f.read() == data:
+                        continue
+            except FileNotFoundError:
+                pass
+            with open(f"{name}.tmp", "wb") as f:
+                f.write(data)
+            os.replace(f"{name}.tmp", name)
+            written += 1
+
+        removed = 0
+        for pattern in generated_file_patterns:
+            for name in glob.glob(pattern):
+                if not name in self.files:
+                    os.remove(name)
+                    removed += 1
+
+        print(f"{written} of {len(self.files)} files changed, {removed} removed")
+
+outputs = OutputFiles()
+
+def resolve_struct_names(sdkver, text, keep=None):
+    def resolve(match):
+        if match.group(1) == keep:
+            return match.group(0)
+        return converted_structs.get((sdkver, match.group(1)), f"{match.group(1)}_{sdkver}")
+    return re.sub("@([^@\n]+)@", resolve, text)
+
+def merge_class(sdkver, chunk):
+    versions = class_versions.setdefault(chunk["class"], set())
+    if chunk["version"] in versions:
+        return
+    versions.add(chunk["version"])
+
+    winname = chunk["winname"]
+    cppname = chunk["cppname"]
+
+    file_exists = f"{winname}.c" in outputs
+    cfile = outputs.open(f"{winname}.c", "a")
+    if not file_exists:
+        cfile.write("""/* This file is auto-generated, do not edit. */
+#include <stdarg.h>
+
+#include "windef.h"
+#include "winbase.h"
+#include "wine/debug.h"
+
+#include "cxx.h"
+
+#include "steam_defs.h"
+
+#include "steamclient_private.h"
+
+#include "struct_converters.h"
+
+WINE_DEFAULT_DEBUG_CHANNEL(steamclient);
+
+""")
+    cfile.write(resolve_struct_names(sdkver, chunk["c"]))
+
+    outputs.open(f"{cppname}.cpp", "w").write(resolve_struct_names(sdkver, chunk["cpp"]))
+    outputs.open(f"{cppname}.h", "w").write(resolve_struct_names(sdkver, chunk["cpp_h"]))
+
+    outputs.open("win_constructors.h", "a").write(chunk["constructors"])
+    outputs.open("win_constructors_table.dat", "a").write(chunk["constructors_table"])
+
+def write_struct_converters(sdkver, text):
+    cppname = f"struct_converters_{sdkver}.cpp"
+    file_exists = cppname in outputs
+    cppfile = outputs.open(cppname, "a")
+    if not file_exists:
+        cppfile.write("#include \"steam_defs.h\"\n")
+        cppfile.write("#pragma push_macro(\"__cdecl\")\n")
+        cppfile.write("#undef __cdecl\n")
+        cppfile.write("#define __cdecl\n")
+        cppfile.write(f"#include \"steamworks_sdk_{sdkver}/steam_api.h\"\n")
+        cppfile.write(f"#include \"steamworks_sdk_{sdkver}/isteamgameserver.h\"\n")
+        if os.path.isfile(f"steamworks_sdk_{sdkver}/isteamnetworkingsockets.h"):
+            cppfile.write(f"#include \"steamworks_sdk_{sdkver}/isteamnetworkingsockets.h\"\n")
+        if os.path.isfile(f"steamworks_sdk_{sdkver}/isteamgameserverstats.h"):
+            cppfile.write(f"#include \"steamworks_sdk_{sdkver}/isteamgameserverstats.h\"\n")
+        if os.path.isfile(f"steamworks_sdk_{sdkver}/isteamgamecoordinator.h"):
+            cppfile.write(f"#include \"steamworks_sdk_{sdkver}/isteamgamecoordinator.h\"\n")
+        if os.path.isfile(f"steamworks_sdk_{sdkver}/steamnetworkingtypes.h"):
+            cppfile.write(f"#include \"steamworks_sdk_{sdkver}/steamnetworkingtypes.h\"\n")
+        cppfile.write("#pragma pop_macro(\"__cdecl\")\n")
+        cppfile.write("#include \"steamclient_private.h\"\n")
+        cppfile.write("extern \"C\" {\n")
+        cppfile.write(f"#define SDKVER_{sdkver}\n")
+        cppfile.write("#include \"struct_converters.h\"\n")
+        cpp_files_need_close_brace.append(cppname)
+    cppfile.write(text)
+
+#picks the converter for a struct, returns whether it is a new one
+def name_struct_converter(sdkver, chunk):
+    name = chunk["name"]
+    if (sdkver, name) in converted_structs:
+        return False
+
+    converter = f"{name}_{sdkver}"
+    #the hand written converters are per SDK version
+    if chunk["layouts"] is not None:
+        fingerprint = (name, chunk["layouts"],
+                       resolve_struct_names(sdkver, chunk["h"], name),
+                       resolve_struct_names(sdkver, chunk["cpp"], name))
+        converter = struct_fingerprints.setdefault(fingerprint, converter)
+    converted_structs[(sdkver, name)] = converter
+
+    decl = struct_converter_decls.setdefault(converter, {"sdkvers": [], "h": None})
+    decl["sdkvers"].append(sdkver)
+    return converter == f"{name}_{sdkver}"
+
+def merge_struct(sdkver, chunk):
+    converter = converted_structs[(sdkver, chunk["name"])]
+    struct_converter_decls[converter]["h"] = resolve_struct_names(sdkver, chunk["h"])
+    if chunk["cpp"] is not None:
+        write_struct_converters(sdkver, resolve_struct_names(sdkver, chunk["cpp"]))
+
+def write_struct_converters_h():
+    hfile = outputs.open("struct_converters.h", "w")
+    for decl in struct_converter_decls.values():
+        conditions = [f"defined(SDKVER_{sdkver})" for sdkver in decl["sdkvers"]]
+        conditions.append("!defined(__cplusplus)")
+        lines = [" || ".join(conditions[i:i + 4]) for i in range(0, len(conditions), 4)]
+        hfile.write("#if " + " || \\\n    ".join(lines) + "\n")
+        hfile.write(decl["h"])
+
+def merge_callback(sdkver, chunk):
+    if chunk["handler"] in generated_cb_handlers:
+        # we already have a handler for the callback struct of this size
+        return
+    if chunk["cb_id"] in generated_cb_ids:
+        # either this cb changed name, or steam used the same ID for different structs
+        return
+    generated_cb_ids.add(chunk["cb_id"])
+    generated_cb_handlers.add(chunk["handler"])
+
+    cb_num = chunk["cb_num"]
+    if not cb_num in cb_table.keys():
+        # latest SDK linux size, list of windows struct sizes and names
+        cb_table[cb_num] = (chunk["linux_size"], [])
+        cb_table64[cb_num] = (chunk["linux_size64"], [])
+    cb_table[cb_num][1].append(chunk["cb_entry"])
+    cb_table64[cb_num][1].append(chunk["cb_entry64"])
+
+    for arch, cb_id, size, handler in chunk["converters"]:
+        cb_converter_table[arch].append((cb_id, size, handler))
+    outputs.open("cb_converters.h", "a").write(chunk["h"])
+    write_struct_converters(sdkver, resolve_struct_names(sdkver, chunk["cpp"]))
+
+#the output of the SDKs is merged in sdk_versions order, so the generated
+#files come out the same as when the SDKs are processed one after the other
+def merge_sdk(sdkver, chunks):
+    #converters are named first, classes may use a struct declared after them
+    new_converters = [chunk["kind"] == "struct" and name_struct_converter(sdkver, chunk)
+                      for chunk in chunks]
+
+    for chunk, new_converter in zip(chunks, new_converters):
+        if chunk["kind"] == "class":
+            merge_class(sdkver, chunk)
+        elif chunk["kind"] == "struct":
+            if new_converter:
+                merge_struct(sdkver, chunk)
+        else:
+            merge_callback(sdkver, chunk)
+
 prog = re.compile("^#define\s*(\w*)\s*\"(.*)\"")
-for sdkver in sdk_versions:
+
+windows_args = ["-D_WIN32", "-fms-extensions", "-Wno-ignored-attributes",
+                "-mms-bitfields", "-U__linux__", "-Wno-incompatible-ms-struct"]
+windows_args += ['-I' + CLANG_PATH + '/include/']
+linux_args = ["-DGNUC"]
+linux_args += ['-I' + CLANG_PATH + '/include/']
+
+#runs in a worker process. the parsed SDK is only used to set up the globals
+#that the handle_* functions look at, nothing from it is sent back.
+def parse_sdk(version):
+    global sdkver, iface_versions, struct_layouts
+
+    sdkver = version
     print(f"parsing SDK version {sdkver}...")
     sdkdir = f"steamworks_sdk_{sdkver}"
 
-    sources = {}
-    iface_versions = {}
-    for file in os.listdir(sdkdir):
-        # Some files from Valve have non-UTF-8 stuff in the comments
-        # (typically the copyright symbol); therefore we ignore UTF-8
-        # encoding errors
-        lines = open(f"{sdkdir}/{file}", "r", errors="replace").readlines()
-        if file == "isteammasterserverupdater.h":
-            if """#error "This file isn't used any more"\n""" in lines:
-                sources[f"{sdkdir}/isteammasterserverupdater.h"] = ""
-
-        for line in lines:
-            if "define STEAM" in line and "_VERSION" in line:
-                result = prog.match(line)
-                if result:
-                    iface, version = result.group(1, 2)
-                    iface_versions[iface] = version
-
-    source = [f"""#if __has_include("{sdkdir}/{file}")
-                  #include "{sdkdir}/{file}"
-                  #endif""" for file, _ in files]
-    sources["source.cpp"] = "\n".join(source)
-    windows_args = ["-D_WIN32", "-fms-extensions", "-Wno-ignored-attributes",
-                    "-mms-bitfields", "-U__linux__", "-Wno-incompatible-ms-struct"]
-    windows_args += ['-I' + CLANG_PATH + '/include/']
-    linux_args = ["-DGNUC"]
-    linux_args += ['-I' + CLANG_PATH + '/include/']
+    with profile_phase("scan_headers"):
+        sources = {}
+        iface_versions = {}
+        for file in os.listdir(sdkdir):
+            # Some files from Valve have non-UTF-8 stuff in the comments
+            # (typically the copyright symbol); therefore we ignore UTF-8
+            # encoding errors
+            lines = open(f"{sdkdir}/{file}", "r", errors="replace").readlines()
+            if file == "isteammasterserverupdater.h":
+                if """#error "This file isn't used any more"\n""" in lines:
+                    sources[f"{sdkdir}/isteammasterserverupdater.h"] = ""
+
+            for line in lines:
+                if "define STEAM" in line and "_VERSION" in line:
+                    result = prog.match(line)
+                    if result:
+                        iface, version = result.group(1, 2)
+                        iface_versions[iface] = version
+
+        source = [f"""#if __has_include("{sdkdir}/{file}")
+                      #include "{sdkdir}/{file}"
+                      #endif""" for file, _ in files]
+        sources["source.cpp"] = "\n".join(source)
 
     index = Index.create()
 
-    linux_build32 = index.parse("source.cpp", args=linux_args + ["-m32"], unsaved_files=sources.items())
-    diagnostics = list(linux_build32.diagnostics)
+    with profile_phase("parse_linux32"):
+        linux_build32 = index.parse("source.cpp", args=linux_args + ["-m32"], unsaved_files=sources.items())
+        diagnostics = list(linux_build32.diagnostics)
     for diag in diagnostics: print(diag)
     assert len(diagnostics) == 0
 
-    linux_build64 = index.parse("source.cpp", args=linux_args + ["-m64"], unsaved_files=sources.items())
-    diagnostics = list(linux_build64.diagnostics)
+    with profile_phase("parse_linux64"):
+        linux_build64 = index.parse("source.cpp", args=linux_args + ["-m64"], unsaved_files=sources.items())
+        diagnostics = list(linux_build64.diagnostics)
     for diag in diagnostics: print(diag)
     assert len(diagnostics) == 0
 
-    windows_build32 = index.parse("source.cpp", args=windows_args + ["-m32"], unsaved_files=sources.items())
-    diagnostics = list(windows_build32.diagnostics)
+    with profile_phase("parse_windows32"):
+        windows_build32 = index.parse("source.cpp", args=windows_args + ["-m32"], unsaved_files=sources.items())
+        diagnostics = list(windows_build32.diagnostics)
     for diag in diagnostics: print(diag)
     assert len(diagnostics) == 0
 
-    windows_build64 = index.parse("source.cpp", args=windows_args + ["-m64"], unsaved_files=sources.items())
-    diagnostics = list(windows_build64.diagnostics)
+    with profile_phase("parse_windows64"):
+        windows_build64 = index.parse("source.cpp", args=windows_args + ["-m64"], unsaved_files=sources.items())
+        diagnostics = list(windows_build64.diagnostics)
     for diag in diagnostics: print(diag)
     assert len(diagnostics) == 0
 
-    linux_structs64 = dict(reversed([(child.spelling, child.type) for child
-                                     in linux_build64.cursor.get_children()]))
-    windows_structs32 = dict(reversed([(child.spelling, child.type) for child
-                                       in windows_build32.cursor.get_children()]))
-    windows_structs64 = dict(reversed([(child.spelling, child.type) for child
-                                       in windows_build64.cursor.get_children()]))
+    with profile_phase("read_struct_layouts"):
+        struct_layouts = {
+            "linux32": read_struct_layouts(linux_build32),
+            "linux64": read_struct_layouts(linux_build64),
+            "windows32": read_struct_layouts(windows_build32),
+            "windows64": read_struct_layouts(windows_build64),
+        }
 
+    chunks = []
     classes = dict([(klass, file) for file, classes in files for klass in classes])
     for child in linux_build32.cursor.get_children():
         if child.kind == CursorKind.CLASS_DECL and child.displayname in classes:
-            handle_class(sdkver, child, classes[child.displayname])
+            with profile_phase("handle_class"):
+                chunks.append(handle_class(sdkver, child, classes[child.displayname]))
         if child.kind in [CursorKind.STRUCT_DECL, CursorKind.CLASS_DECL]:
-            handle_struct(sdkver, child)
+            with profile_phase("handle_struct"):
+                chunks.append(handle_struct(sdkver, child))
         if child.displayname in print_sizes:
             print("size of %s is %u" % (child.displayname, child.type.get_size()))
 
+    sdk_profile["struct_needs_conversion_cache_misses"] = len(struct_conversion_cache.get(sdkver, {}))
+
+    return [chunk for chunk in chunks if chunk is not None]
+
+def clang_version():
+    #not wrapped by clang.cindex
+    func = conf.lib.clang_getClangVersion
+    func.restype = _CXString
+    func.errcheck = _CXString.from_result
+    return func()
+
+def generator_hash():
+    #adding an SDK to sdk_versions doesn't change the output for the others
+    script = open(os.path.realpath(__file__), "rb").read()
+    start = script.index(b"sdk_versions = [")
+    end = script.index(b"]", start)
+    return hashlib.sha256(script[:start] + script[end:]).hexdigest()
+
+def sdk_cache_key(sdkdir):
+    h = hashlib.sha256()
+    h.update(clang_version().encode())
+    h.update(repr((linux_args, windows_args)).encode())
+    h.update(script_hash.encode())
+    for file in sorted(os.listdir(sdkdir)):
+        h.update(file.encode() + b"\0")
+        h.update(open(f"{sdkdir}/{file}", "rb").read())
+    return h.hexdigest()
+
+def parse_sdk_cached(version):
+    global sdk_profile
+
+    sdk_profile = {"cached": False, "phases": {}}
+    libclang_calls.clear()
+
+    with profile_phase("cache_key"):
+        key = sdk_cache_key(f"steamworks_sdk_{version}")
+    cache_file = f"{CACHE_DIR}/{version}-{key}.pickle.gz"
+
+    try:
+        with profile_phase("load_cache"):
+            with gzip.open(cache_file, "rb") as f:
+                chunks = pickle.load(f)
+        sdk_profile["cached"] = True
+        return chunks, sdk_profile
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    chunks = parse_sdk(version)
+
+    with profile_phase("save_cache"):
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        for old in os.listdir(CACHE_DIR):
+            if old.startswith(f"{version}-"):
+                os.remove(f"{CACHE_DIR}/{old}")
+        with gzip.open(f"{cache_file}.tmp", "wb") as f:
+            pickle.dump(chunks, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(f"{cache_file}.tmp", cache_file)
+        dump_struct_layouts(f"{CACHE_DIR}/{version}-layouts.json")
+
+    sdk_profile["libclang_calls"] = dict(libclang_calls)
+    return chunks, sdk_profile
+
+#--profile: where the time goes for each SDK version, and how many calls into
+#libclang it takes. the SDKs are parsed in worker processes, which send their
+#sdk_profile back along with the generated code.
+sdk_profile = None
+libclang_calls = Counter()
+libclang_call_kinds = {}
+
+@contextlib.contextmanager
+def profile_phase(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases = sdk_profile["phases"]
+        phases[name] = phases.get(name, 0) + time.perf_counter() - start
+
+def count_libclang_calls():
+    def counted(name, func):
+        def call(*args):
+            libclang_calls[name] += 1
+            return func(*args)
+        return call
+
+    #clang.cindex calls everything through the functions it registered on conf.lib
+    lib = conf.lib
+    for name, func in list(vars(lib).items()):
+        if name.startswith("clang_"):
+            argtypes = func.argtypes or [None]
+            if argtypes[0] is Cursor:
+                libclang_call_kinds[name] = "cursor"
+            elif argtypes[0] is Type:
+                libclang_call_kinds[name] = "type"
+            else:
+                libclang_call_kinds[name] = "other"
+            setattr(lib, name, counted(name, func))
+
+def write_profile(filename, profile):
+    total_calls = Counter()
+    for sdk in profile["sdks"].values():
+        sdk["phases"] = {name: round(t, 4) for name, t in sdk["phases"].items()}
+        if "libclang_calls" in sdk:
+            calls = sdk["libclang_calls"]
+            total_calls.update(calls)
+            sdk["libclang_calls"] = {kind: sum(n for name, n in calls.items() if libclang_call_kinds[name] == kind)
+                                     for kind in ("cursor", "type", "other")}
+    profile["phases"] = {name: round(t, 4) for name, t in profile["phases"].items()}
+    profile["libclang_calls"] = dict(total_calls.most_common())
+
+    with open(filename, "w") as f:
+        json.dump(profile, f, indent=1)
+    print(f"profile written to {filename}")
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--profile", nargs="?", const=f"{CACHE_DIR}/profile.json", metavar="FILE",
+                    help="write the time spent in each phase of each SDK version and the number of "
+                    "libclang calls as JSON to FILE (default: %(const)s). SDK versions loaded from "
+                    f"{CACHE_DIR} are not parsed again, remove it to profile parsing all of them.")
+args = parser.parse_args()
+
+if args.profile:
+    count_libclang_calls()
+
+start_time = time.perf_counter()
+profile = {"sdks": {}, "phases": {}}
+
+script_hash = generator_hash()
+with multiprocessing.get_context("fork").Pool() as pool:
+    for sdkver, (chunks, parse_profile) in zip(sdk_versions, pool.imap(parse_sdk_cached, sdk_versions)):
+        merge_start = time.perf_counter()
+        merge_sdk(sdkver, chunks)
+        parse_profile["phases"]["merge"] = time.perf_counter() - merge_start
+        profile["sdks"][sdkver] = parse_profile
+
+tables_start = time.perf_counter()
+
+write_struct_converters_h()
+
 for f in cpp_files_need_close_brace:
-    m = open(f, "a")
+    m = outputs.open(f, "a")
     m.write("\n}\n")
 
-getapifile = open("cb_getapi_table.dat", "w")
-cbsizefile = open("cb_getapi_sizes.dat", "w")
-
-cbsizefile.write("#ifdef __i386__\n")
-getapifile.write("#ifdef __i386__\n")
-for cb in sorted(cb_table.keys()):
-    cbsizefile.write(f"case {cb}: /* {cb_table[cb][1][0][1]} */\n")
-    cbsizefile.write(f"    return {cb_table[cb][0]};\n")
-    getapifile.write(f"case {cb}:\n")
-    getapifile.write("    switch(callback_len){\n")
-    getapifile.write("    default:\n") # the first one should be the latest, should best support future SDK versions
-    for (size, name) in cb_table[cb][1]:
-        getapifile.write(f"    case {size}: cb_{name}(lin_callback, callback); break;\n")
-    getapifile.write("    }\n    break;\n")
-cbsizefile.write("#endif\n")
-getapifile.write("#endif\n")
-
-cbsizefile.write("#ifdef __x86_64__\n")
-getapifile.write("#ifdef __x86_64__\n")
-for cb in sorted(cb_table64.keys()):
-    cbsizefile.write(f"case {cb}: /* {cb_table64[cb][1][0][1]} */\n")
-    cbsizefile.write(f"    return {cb_table64[cb][0]};\n")
-    getapifile.write(f"case {cb}:\n")
-    getapifile.write("    switch(callback_len){\n")
-    getapifile.write("    default:\n") # the first one should be the latest, should best support future SDK versions
-    for (size, name) in cb_table64[cb][1]:
-        getapifile.write(f"    case {size}: cb_{name}(lin_callback, callback); break;\n")
-    getapifile.write("    }\n    break;\n")
-cbsizefile.write("#endif\n")
-getapifile.write("#endif\n")
+#the callback tables are hash tables with linear probing, looked up by
+#steamclient_cb_tables.h. Of a few multipliers for the hash, we take the one
+#with the shortest probe sequences; the seed is fixed, so the tables only
+#change when the callbacks do.
+def hash_cb_table(entries):
+    bits = (2 * len(entries) - 1).bit_length()
+    rng = random.Random(0)
+    best = None
+    for i in range(256):
+        mult = rng.getrandbits(32) | 1
+        slots = [None] * (1 << bits)
+        longest = 0
+        for entry in entries:
+            slot = ((entry[0] * mult) & 0xffffffff) >> (32 - bits)
+            probes = 0
+            while slots[slot] is not None:
+                slot = (slot + 1) % len(slots)
+                probes += 1
+            slots[slot] = entry
+            longest = max(longest, probes)
+        if best is None or longest < best[0]:
+            best = (longest, mult, slots)
+        if longest == 0:
+            break
+    return best[1], bits, best[2]
+
+def write_cb_hash_table(f, name, entries):
+    mult, bits, slots = hash_cb_table(sorted(entries))
+    f.write(f"#define {name.upper()}_HASH_MULT 0x{mult:08x}u\n")
+    f.write(f"#define {name.upper()}_HASH_BITS {bits}\n")
+    f.write(f"static const struct cb_entry {name}[1 << {name.upper()}_HASH_BITS] =\n{{\n")
+    for i, entry in enumerate(slots):
+        if entry is not None:
+            f.write(f"    [{i}] = {{0x{entry[0]:08x}, {entry[1]}, {entry[2]}, {entry[4]}, (cb_converter){entry[3]}}},\n")
+    f.write("};\n")
+
+#the buffers for converted callbacks are allocated from pools of power of two
+#sizes, starting at CB_BUFFER_MIN_SIZE
+CB_BUFFER_MIN_SIZE = 64
+
+def cb_buffer_size_class(size):
+    return max(0, math.ceil(math.log2(size / CB_BUFFER_MIN_SIZE)))
+
+#cb_converters is keyed by k_iCallback | linux size << 16, for Steam_BGetCallback.
+#cb_getapi_table is keyed by k_iCallback for the latest windows struct and by
+#k_iCallback | windows size << 16 for older ones, for GetAPICallResult.
+#the last field is the size class of the buffer we need, for the windows struct
+#of a callback and the linux one of an API call result.
+def get_cb_tables():
+    tables = {}
+    for arch, table in (("__i386__", cb_table), ("__x86_64__", cb_table64)):
+        converters = [(cb_id, cb_id >> 16, size, handler, cb_buffer_size_class(size))
+                      for cb_id, size, handler in cb_converter_table[arch]]
+        assert(len(set(entry[0] for entry in converters)) == len(converters))
+
+        getapi = []
+        for cb in sorted(table.keys()):
+            assert(cb < 0x10000)
+            # the first one should be the latest, should best support future SDK versions
+            for i, (size, name) in enumerate(table[cb][1]):
+                getapi.append((cb if i == 0 else cb | (size << 16), table[cb][0], size, f"cb_{name}",
+                               cb_buffer_size_class(table[cb][0])))
+        assert(len(set(entry[0] for entry in getapi)) == len(getapi))
+
+        tables[arch] = (converters, getapi)
+    return tables
+
+def write_cb_tables(tables):
+    convfile = outputs.open("cb_converters.dat", "w")
+    getapifile = outputs.open("cb_getapi_table.dat", "w")
+    for arch, (converters, getapi) in tables.items():
+        size_classes = max(entry[4] for entry in converters + getapi) + 1
+        convfile.write(f"#ifdef {arch}\n")
+        convfile.write(f"#define CB_BUFFER_MIN_SIZE {CB_BUFFER_MIN_SIZE}\n")
+        convfile.write(f"#define CB_BUFFER_SIZE_CLASSES {size_classes}\n")
+        write_cb_hash_table(convfile, "cb_converters", converters)
+        convfile.write("#endif\n")
+
+        getapifile.write(f"#ifdef {arch}\n")
+        write_cb_hash_table(getapifile, "cb_getapi_table", getapi)
+        getapifile.write("#endif\n")
+
+#the tests don't link the converters, these stubs record which one was called
+def write_cb_converter_stubs(f, tables):
+    f.write("""
+typedef void (*cb_converter)(const void *lin, void *win);
+static const char *last_converter;
+""")
+    for arch, (converters, getapi) in tables.items():
+        f.write(f"\n#ifdef {arch}\n")
+        for handler in sorted(set(entry[3] for entry in converters + getapi)):
+            f.write(f"static void {handler}(const void *lin, void *win) {{ last_converter = \"{handler}\"; }}\n")
+        f.write("#endif\n")
+
+#checks the table lookups against the switch statements we used to generate
+#for the same callbacks, build with gcc -m32 and -m64 -I.. and run
+def write_cb_tables_test(tables):
+    f = outputs.open("tests/cb_tables_tests_autogen.c", "w")
+    f.write("""/* This file is auto-generated, do not edit. */
+#include <stdio.h>
+""")
+    write_cb_converter_stubs(f, tables)
+
+    f.write("""
+#include "steamclient_cb_tables.h"
+
+static cb_converter switch_converter(int id, int *win_size)
+{
+    switch(id){
+""")
+    for arch, (converters, getapi) in tables.items():
+        f.write(f"#ifdef {arch}\n")
+        for cb_id, lin_size, size, handler, size_class in converters:
+            f.write(f"    case 0x{cb_id:08x}: *win_size = {size}; return (cb_converter){handler};\n")
+        f.write("#endif\n")
+    f.write("""    }
+    return NULL;
+}
+
+static int switch_callback_len(int cb)
+{
+    switch(cb){
+""")
+    for arch, table in (("__i386__", cb_table), ("__x86_64__", cb_table64)):
+        f.write(f"#ifdef {arch}\n")
+        for cb in sorted(table.keys()):
+            f.write(f"    case {cb}: return {table[cb][0]};\n")
+        f.write("#endif\n")
+    f.write("""    }
+    return 0;
+}
+
+static cb_converter switch_getapi(int cb, int callback_len)
+{
+    switch(cb){
+""")
+    for arch, table in (("__i386__", cb_table), ("__x86_64__", cb_table64)):
+        f.write(f"#ifdef {arch}\n")
+        for cb in sorted(table.keys()):
+            f.write(f"    case {cb}:\n")
+            f.write("        switch(callback_len){\n")
+            f.write("        default:\n")
+            for (size, name) in table[cb][1]:
+                f.write(f"        case {size}: return (cb_converter)cb_{name};\n")
+            f.write("        }\n")
+        f.write("#endif\n")
+    f.write("""    }
+    return NULL;
+}
+""")
+
+    #every callback id, its neighbours and ids that only match in the low
+    #bits, with every struct size we know of
+    cb_nums = {-1, 0}
+    sizes = {-1, 0}
+    for converters, getapi in tables.values():
+        for cb_id, lin_size, size, handler, size_class in converters + getapi:
+            cb = cb_id & 0xffff
+            cb_nums.update((cb - 1, cb, cb + 1, cb | 0x10000))
+            sizes.update((lin_size, size, size | 0x10000))
+
+    f.write("\nstatic const int cb_nums[] =\n{\n")
+    for cb in sorted(cb_nums):
+        f.write(f"    {cb},\n")
+    f.write("};\n\nstatic const int sizes[] =\n{\n")
+    for size in sorted(sizes):
+        f.write(f"    {size},\n")
+    f.write("""};
+
+int main(void)
+{
+    const struct cb_entry *entry;
+    unsigned int i, j, tests = 0, failures = 0;
+    cb_converter expected;
+    int id, win_size;
+
+    for (i = 0; i < sizeof(cb_nums) / sizeof(cb_nums[0]); ++i)
+    {
+        for (j = 0; j < sizeof(sizes) / sizeof(sizes[0]); ++j)
+        {
+            id = cb_nums[i] | (sizes[j] << 16);
+            win_size = 0;
+            expected = switch_converter(id, &win_size);
+            entry = find_cb_converter(id);
+            if (entry ? entry->convert != expected || entry->win_size != win_size : expected != NULL)
+            {
+                printf("callback %d size %d: wrong converter\\n", cb_nums[i], sizes[j]);
+                ++failures;
+            }
+
+            expected = switch_getapi(cb_nums[i], sizes[j]);
+            entry = find_cb_getapi_entry(cb_nums[i], sizes[j]);
+            if (entry ? entry->convert != expected || entry->lin_size != switch_callback_len(cb_nums[i])
+                    : expected != NULL || switch_callback_len(cb_nums[i]) != 0)
+            {
+                printf("API call result %d size %d: wrong converter\\n", cb_nums[i], sizes[j]);
+                ++failures;
+            }
+            tests += 2;
+        }
+    }
+
+    printf("%u tests, %u failures\\n", tests, failures);
+    return failures != 0;
+}
+""")
+
+#counts the heap allocations for 10000 callbacks, each of them followed by an
+#API call result, with a HeapAlloc per message as we used to do and with the
+#buffer pool. build with gcc -m32 and -m64 -I.. and run
+def write_cb_buffers_test(tables):
+    f = outputs.open("tests/cb_buffers_tests_autogen.c", "w")
+    f.write("""/* This file is auto-generated, do not edit. */
+#include <stdio.h>
+#include <stdlib.h>
+
+static unsigned int heap_allocs;
+
+#define GetProcessHeap() NULL
+
+static void *HeapAlloc(void *heap, unsigned int flags, size_t size)
+{
+    ++heap_allocs;
+    return malloc(size);
+}
+
+static int HeapFree(void *heap, unsigned int flags, void *mem)
+{
+    free(mem);
+    return 1;
+}
+
+static void *InterlockedExchangePointer(void *volatile *dest, void *value)
+{
+    return __atomic_exchange_n(dest, value, __ATOMIC_SEQ_CST);
+}
+
+static void *InterlockedCompareExchangePointer(void *volatile *dest, void *value, void *compare)
+{
+    __atomic_compare_exchange_n(dest, &compare, value, 0, __ATOMIC_SEQ_CST, __ATOMIC_SEQ_CST);
+    return compare;
+}
+""")
+    write_cb_converter_stubs(f, tables)
+
+    f.write("""
+#include "steamclient_cb_tables.h"
+#include "steamclient_cb_buffers.h"
+
+struct message
+{
+    int id;
+    int cb;
+    int callback_len;
+};
+
+static const struct message messages[] =
+{
+""")
+    for arch, (converters, getapi) in tables.items():
+        f.write(f"#ifdef {arch}\n")
+        converters = sorted(converters)
+        getapi = sorted(getapi)
+        for i in range(max(len(converters), len(getapi))):
+            cb_id = converters[i % len(converters)][0]
+            getapi_entry = getapi[i % len(getapi)]
+            f.write(f"    {{0x{cb_id:08x}, {getapi_entry[0] & 0xffff}, {getapi_entry[2]}}},\n")
+        f.write("#endif\n")
+    f.write("""};
+
+static void check_size_classes(const struct cb_entry *table, unsigned int count, unsigned int *failures)
+{
+    unsigned int i;
+
+    for (i = 0; i < count; ++i)
+    {
+        if (table[i].id && (table[i].size_class >= CB_BUFFER_SIZE_CLASSES ||
+                CB_BUFFER_MIN_SIZE << table[i].size_class < (table == cb_converters ? table[i].win_size : table[i].lin_size)))
+        {
+            printf("id %#x: size class %d is too small\\n", table[i].id, table[i].size_class);
+            ++*failures;
+        }
+    }
+}
+
+int main(void)
+{
+    const struct cb_entry *callback, *result;
+    const struct message *msg;
+    unsigned int i, before, after, failures = 0;
+    void *callback_buffer, *result_buffer;
+
+    check_size_classes(cb_converters, sizeof(cb_converters) / sizeof(cb_converters[0]), &failures);
+    check_size_classes(cb_getapi_table, sizeof(cb_getapi_table) / sizeof(cb_getapi_table[0]), &failures);
+
+    heap_allocs = 0;
+    for (i = 0; i < 10000; ++i)
+    {
+        msg = &messages[i % (sizeof(messages) / sizeof(messages[0]))];
+        callback = find_cb_converter(msg->id);
+        result = find_cb_getapi_entry(msg->cb, msg->callback_len);
+
+        callback_buffer = HeapAlloc(GetProcessHeap(), 0, callback->win_size);
+        callback->convert(NULL, callback_buffer);
+        result_buffer = HeapAlloc(GetProcessHeap(), 0, result->lin_size);
+        result->convert(result_buffer, NULL);
+        HeapFree(GetProcessHeap(), 0, result_buffer);
+        HeapFree(GetProcessHeap(), 0, callback_buffer);
+    }
+    before = heap_allocs;
+
+    heap_allocs = 0;
+    for (i = 0; i < 10000; ++i)
+    {
+        msg = &messages[i % (sizeof(messages) / sizeof(messages[0]))];
+        callback = find_cb_converter(msg->id);
+        result = find_cb_getapi_entry(msg->cb, msg->callback_len);
+
+        callback_buffer = alloc_cb_buffer(callback->size_class);
+        callback->convert(NULL, callback_buffer);
+        result_buffer = alloc_cb_buffer(result->size_class);
+        result->convert(result_buffer, NULL);
+        free_cb_buffer(result_buffer, result->size_class);
+        free_cb_buffer(callback_buffer, callback->size_class);
+    }
+    after = heap_allocs;
+
+    printf("heap allocations per 10000 callbacks: %u before, %u after\\n", before, after);
+    if (after > CB_BUFFER_SIZE_CLASSES * CB_BUFFER_POOL_SLOTS)
+    {
+        printf("the buffer pool allocated more than it can hold\\n");
+        ++failures;
+    }
+
+    return failures != 0;
+}
+""")
+
+cb_tables = get_cb_tables()
+write_cb_tables(cb_tables)
+write_cb_tables_test(cb_tables)
+write_cb_buffers_test(cb_tables)
+profile["phases"]["generate_tables"] = time.perf_counter() - tables_start
+
+flush_start = time.perf_counter()
+outputs.flush()
+profile["phases"]["flush"] = time.perf_counter() - flush_start
+
+if args.profile:
+    profile["phases"]["total"] = time.perf_counter() - start_time
+    write_profile(args.profile, profile)
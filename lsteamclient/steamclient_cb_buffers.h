@@ -0,0 +1,40 @@
+/* Buffers for converted callbacks. Games poll for callbacks every frame, so
+ * instead of a heap allocation per callback we keep a few freed buffers of
+ * each size class around. The size classes of the structs come from the
+ * tables generated by gen_wrapper.py, see steamclient_cb_tables.h. */
+
+#define CB_BUFFER_POOL_SLOTS 4
+
+static void *cb_buffer_pool[CB_BUFFER_SIZE_CLASSES][CB_BUFFER_POOL_SLOTS];
+
+static inline void *alloc_cb_buffer(int size_class)
+{
+    void *buffer;
+    unsigned int i;
+
+    for (i = 0; i < CB_BUFFER_POOL_SLOTS; ++i)
+    {
+        if (cb_buffer_pool[size_class][i] &&
+                (buffer = InterlockedExchangePointer(&cb_buffer_pool[size_class][i], NULL)))
+            return buffer;
+    }
+
+    return HeapAlloc(GetProcessHeap(), 0, CB_BUFFER_MIN_SIZE << size_class);
+}
+
+static inline void free_cb_buffer(void *buffer, int size_class)
+{
+    unsigned int i;
+
+    if (!buffer)
+        return;
+
+    for (i = 0; i < CB_BUFFER_POOL_SLOTS; ++i)
+    {
+        if (!cb_buffer_pool[size_class][i] &&
+                !InterlockedCompareExchangePointer(&cb_buffer_pool[size_class][i], buffer, NULL))
+            return;
+    }
+
+    HeapFree(GetProcessHeap(), 0, buffer);
+}
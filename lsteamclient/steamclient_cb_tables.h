@@ -0,0 +1,56 @@
+/* Lookups in the callback tables generated by gen_wrapper.py. These are hash
+ * tables with linear probing, an entry with id 0 ends the probe sequence. */
+
+typedef void (*cb_converter)(const void *lin, void *win);
+
+struct cb_entry
+{
+    int id;
+    int lin_size;
+    int win_size;
+    int size_class; /* of the buffer we convert into or out of, see steamclient_cb_buffers.h */
+    cb_converter convert;
+};
+
+#include "cb_converters.dat"
+#include "cb_getapi_table.dat"
+
+static inline const struct cb_entry *find_cb_entry(const struct cb_entry *table,
+        unsigned int mult, unsigned int bits, int id)
+{
+    unsigned int slot = ((unsigned int)id * mult) >> (32 - bits);
+
+    while (table[slot].id)
+    {
+        if (table[slot].id == id)
+            return &table[slot];
+        slot = (slot + 1) & ((1u << bits) - 1);
+    }
+    return NULL;
+}
+
+/* returns the converter for callback messages with the given
+ * k_iCallback | linux size << 16, or NULL if the structs are compatible */
+static inline const struct cb_entry *find_cb_converter(int id)
+{
+    return find_cb_entry(cb_converters, CB_CONVERTERS_HASH_MULT, CB_CONVERTERS_HASH_BITS, id);
+}
+
+/* returns the converter for an API call result into a windows struct of
+ * callback_len bytes. For sizes we don't know, that is the one of the latest
+ * SDK. Returns NULL if the structs are compatible. */
+static inline const struct cb_entry *find_cb_getapi_entry(int cb, int callback_len)
+{
+    const struct cb_entry *latest, *entry;
+
+    if ((unsigned int)cb >= 0x10000)
+        return NULL;
+
+    latest = find_cb_entry(cb_getapi_table, CB_GETAPI_TABLE_HASH_MULT, CB_GETAPI_TABLE_HASH_BITS, cb);
+    if (!latest || latest->win_size == callback_len || (unsigned int)callback_len >= 0x10000)
+        return latest;
+
+    entry = find_cb_entry(cb_getapi_table, CB_GETAPI_TABLE_HASH_MULT, CB_GETAPI_TABLE_HASH_BITS,
+            cb | (callback_len << 16));
+    return entry ? entry : latest;
+}
@@ -907,6 +907,8 @@ void *CDECL CreateInterface(const char *name, int *return_code)
 }
 
 #include "cb_converters.h"
+#include "steamclient_cb_tables.h"
+#include "steamclient_cb_buffers.h"
 
 #pragma pack( push, 8 )
 struct winCallbackMsg_t
@@ -919,11 +921,13 @@ struct winCallbackMsg_t
 #pragma pack( pop )
 
 static void *last_cb = NULL;
+static int last_cb_size_class;
 
 bool CDECL Steam_BGetCallback(HSteamPipe pipe, struct winCallbackMsg_t *win_msg, int32 *ignored)
 {
     bool ret;
     CallbackMsg_t lin_msg;
+    const struct cb_entry *conv;
 
     TRACE("%u, %p, %p\n", pipe, win_msg, ignored);
 
@@ -961,40 +965,37 @@ next_event:
             }
         }
 
-        switch(win_msg->m_iCallback | (lin_msg.m_cubParam << 16)){
-#include "cb_converters.dat"
-            default:
-                /* structs are compatible */
-                need_free = FALSE;
-                win_msg->m_cubParam = lin_msg.m_cubParam;
-                win_msg->m_pubParam = lin_msg.m_pubParam;
-                break;
+        conv = find_cb_converter(win_msg->m_iCallback | (lin_msg.m_cubParam << 16));
+        if(conv){
+            win_msg->m_cubParam = conv->win_size;
+            win_msg->m_pubParam = alloc_cb_buffer(conv->size_class);
+            conv->convert(lin_msg.m_pubParam, win_msg->m_pubParam);
+        }else{
+            /* structs are compatible */
+            need_free = FALSE;
+            win_msg->m_cubParam = lin_msg.m_cubParam;
+            win_msg->m_pubParam = lin_msg.m_pubParam;
         }
-        if(need_free)
+        if(need_free){
             last_cb = win_msg->m_pubParam;
+            last_cb_size_class = conv->size_class;
+        }
     }
 
     return ret;
 }
 
-static int get_callback_len(int cb)
-{
-    switch(cb){
-#include "cb_getapi_sizes.dat"
-    }
-    return 0;
-}
-
 bool do_cb_wrap(HSteamPipe pipe, void *linux_side,
         bool (*cpp_func)(void *, SteamAPICall_t, void *, int, int, bool *),
         SteamAPICall_t call, void *callback, int callback_len, int cb_expected, bool *failed)
 {
+    const struct cb_entry *conv;
     void *lin_callback = NULL;
     int lin_callback_len;
     bool ret;
 
-    lin_callback_len = get_callback_len(cb_expected);
-    if(!lin_callback_len){
+    conv = find_cb_getapi_entry(cb_expected, callback_len);
+    if(!conv){
         /* structs are compatible, pass on through */
         if(!cpp_func){
             if(!load_steamclient())
@@ -1005,7 +1006,8 @@ bool do_cb_wrap(HSteamPipe pipe, void *linux_side,
     }
 
     /* structs require conversion */
-    lin_callback = HeapAlloc(GetProcessHeap(), 0, lin_callback_len);
+    lin_callback_len = conv->lin_size;
+    lin_callback = alloc_cb_buffer(conv->size_class);
 
     if(!cpp_func){
         if(!load_steamclient())
@@ -1014,13 +1016,10 @@ bool do_cb_wrap(HSteamPipe pipe, void *linux_side,
     }else
         ret = cpp_func(linux_side, call, lin_callback, lin_callback_len, cb_expected, failed);
 
-    if(ret){
-        switch(cb_expected){
-#include "cb_getapi_table.dat"
-        }
-    }
+    if(ret)
+        conv->convert(lin_callback, callback);
 
-    HeapFree(GetProcessHeap(), 0, lin_callback);
+    free_cb_buffer(lin_callback, conv->size_class);
 
     return ret;
 }
@@ -1039,7 +1038,7 @@ bool CDECL Steam_FreeLastCallback(HSteamPipe pipe)
     if(!load_steamclient())
         return 0;
 
-    HeapFree(GetProcessHeap(), 0, last_cb);
+    free_cb_buffer(last_cb, last_cb_size_class);
     last_cb = NULL;
 
     return steamclient_FreeLastCallback(pipe);
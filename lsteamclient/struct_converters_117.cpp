@@ -51,23 +51,5 @@ void cb_RemoteStorageGetPublishedFileDetailsResult_t_1744(const struct RemoteSto
     memcpy(win->m_pchFileName, lin->m_pchFileName, sizeof(win->m_pchFileName));
 }
 
-void win_to_lin_struct_LeaderboardEntry_t_117(const struct winLeaderboardEntry_t_117 *win, struct LeaderboardEntry_t *lin)
-{
-    lin->m_steamIDUser = win->m_steamIDUser;
-    lin->m_nGlobalRank = win->m_nGlobalRank;
-    lin->m_nScore = win->m_nScore;
-    lin->m_cDetails = win->m_cDetails;
-    lin->m_hUGC = win->m_hUGC;
-}
-
-void lin_to_win_struct_LeaderboardEntry_t_117(const struct LeaderboardEntry_t *lin, struct winLeaderboardEntry_t_117 *win)
-{
-    win->m_steamIDUser = lin->m_steamIDUser;
-    win->m_nGlobalRank = lin->m_nGlobalRank;
-    win->m_nScore = lin->m_nScore;
-    win->m_cDetails = lin->m_cDetails;
-    win->m_hUGC = lin->m_hUGC;
-}
-
 
 }
@@ -53,23 +53,5 @@ void cb_RemoteStorageEnumerateWorkshopFilesResult_t_616(const struct RemoteStora
     memcpy(win->m_rgScore, lin->m_rgScore, sizeof(win->m_rgScore));
 }
 
-void win_to_lin_struct_LeaderboardEntry_t_124(const struct winLeaderboardEntry_t_124 *win, struct LeaderboardEntry_t *lin)
-{
-    lin->m_steamIDUser = win->m_steamIDUser;
-    lin->m_nGlobalRank = win->m_nGlobalRank;
-    lin->m_nScore = win->m_nScore;
-    lin->m_cDetails = win->m_cDetails;
-    lin->m_hUGC = win->m_hUGC;
-}
-
-void lin_to_win_struct_LeaderboardEntry_t_124(const struct LeaderboardEntry_t *lin, struct winLeaderboardEntry_t_124 *win)
-{
-    win->m_steamIDUser = lin->m_steamIDUser;
-    win->m_nGlobalRank = lin->m_nGlobalRank;
-    win->m_nScore = lin->m_nScore;
-    win->m_cDetails = lin->m_cDetails;
-    win->m_hUGC = lin->m_hUGC;
-}
-
 
 }
@@ -11,24 +11,6 @@
 extern "C" {
 #define SDKVER_129
 #include "struct_converters.h"
-void win_to_lin_struct_LeaderboardEntry_t_129(const struct winLeaderboardEntry_t_129 *win, struct LeaderboardEntry_t *lin)
-{
-    lin->m_steamIDUser = win->m_steamIDUser;
-    lin->m_nGlobalRank = win->m_nGlobalRank;
-    lin->m_nScore = win->m_nScore;
-    lin->m_cDetails = win->m_cDetails;
-    lin->m_hUGC = win->m_hUGC;
-}
-
-void lin_to_win_struct_LeaderboardEntry_t_129(const struct LeaderboardEntry_t *lin, struct winLeaderboardEntry_t_129 *win)
-{
-    win->m_steamIDUser = lin->m_steamIDUser;
-    win->m_nGlobalRank = lin->m_nGlobalRank;
-    win->m_nScore = lin->m_nScore;
-    win->m_cDetails = lin->m_cDetails;
-    win->m_hUGC = lin->m_hUGC;
-}
-
 void win_to_lin_struct_SteamUGCDetails_t_129(const struct winSteamUGCDetails_t_129 *win, struct SteamUGCDetails_t *lin)
 {
     lin->m_nPublishedFileId = win->m_nPublishedFileId;
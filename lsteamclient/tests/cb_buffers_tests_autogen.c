@@ -0,0 +1,432 @@
+/* This file is auto-generated, do not edit. */
+#include <stdio.h>
+#include <stdlib.h>
+
+static unsigned int heap_allocs;
+
+#define GetProcessHeap() NULL
+
+static void *HeapAlloc(void *heap, unsigned int flags, size_t size)
+{
+    ++heap_allocs;
+    return malloc(size);
+}
+
+static int HeapFree(void *heap, unsigned int flags, void *mem)
+{
+    free(mem);
+    return 1;
+}
+
+static void *InterlockedExchangePointer(void *volatile *dest, void *value)
+{
+    return __atomic_exchange_n(dest, value, __ATOMIC_SEQ_CST);
+}
+
+static void *InterlockedCompareExchangePointer(void *volatile *dest, void *value, void *compare)
+{
+    __atomic_compare_exchange_n(dest, &compare, value, 0, __ATOMIC_SEQ_CST, __ATOMIC_SEQ_CST);
+    return compare;
+}
+
+typedef void (*cb_converter)(const void *lin, void *win);
+static const char *last_converter;
+
+#ifdef __i386__
+static void cb_AddAppDependencyResult_t_24(const void *lin, void *win) { last_converter = "cb_AddAppDependencyResult_t_24"; }
+static void cb_AddUGCDependencyResult_t_24(const void *lin, void *win) { last_converter = "cb_AddUGCDependencyResult_t_24"; }
+static void cb_CreateBeaconCallback_t_16(const void *lin, void *win) { last_converter = "cb_CreateBeaconCallback_t_16"; }
+static void cb_CreateItemResult_t_24(const void *lin, void *win) { last_converter = "cb_CreateItemResult_t_24"; }
+static void cb_DeleteItemResult_t_16(const void *lin, void *win) { last_converter = "cb_DeleteItemResult_t_16"; }
+static void cb_DownloadItemResult_t_24(const void *lin, void *win) { last_converter = "cb_DownloadItemResult_t_24"; }
+static void cb_EndGameResultCallback_t_16(const void *lin, void *win) { last_converter = "cb_EndGameResultCallback_t_16"; }
+static void cb_FileDetailsResult_t_40(const void *lin, void *win) { last_converter = "cb_FileDetailsResult_t_40"; }
+static void cb_GSReputation_t_40(const void *lin, void *win) { last_converter = "cb_GSReputation_t_40"; }
+static void cb_GetAppDependenciesResult_t_152(const void *lin, void *win) { last_converter = "cb_GetAppDependenciesResult_t_152"; }
+static void cb_HTML_ChangedTitle_t_8(const void *lin, void *win) { last_converter = "cb_HTML_ChangedTitle_t_8"; }
+static void cb_HTML_ComboNeedsPaint_t_16(const void *lin, void *win) { last_converter = "cb_HTML_ComboNeedsPaint_t_16"; }
+static void cb_HTML_FileOpenDialog_t_12(const void *lin, void *win) { last_converter = "cb_HTML_FileOpenDialog_t_12"; }
+static void cb_HTML_FinishedRequest_t_12(const void *lin, void *win) { last_converter = "cb_HTML_FinishedRequest_t_12"; }
+static void cb_HTML_JSAlert_t_8(const void *lin, void *win) { last_converter = "cb_HTML_JSAlert_t_8"; }
+static void cb_HTML_JSConfirm_t_8(const void *lin, void *win) { last_converter = "cb_HTML_JSConfirm_t_8"; }
+static void cb_HTML_LinkAtPosition_t_20(const void *lin, void *win) { last_converter = "cb_HTML_LinkAtPosition_t_20"; }
+static void cb_HTML_NeedsPaint_t_48(const void *lin, void *win) { last_converter = "cb_HTML_NeedsPaint_t_48"; }
+static void cb_HTML_NewWindow_t_24(const void *lin, void *win) { last_converter = "cb_HTML_NewWindow_t_24"; }
+static void cb_HTML_NewWindow_t_28(const void *lin, void *win) { last_converter = "cb_HTML_NewWindow_t_28"; }
+static void cb_HTML_OpenLinkInNewTab_t_8(const void *lin, void *win) { last_converter = "cb_HTML_OpenLinkInNewTab_t_8"; }
+static void cb_HTML_ShowToolTip_t_8(const void *lin, void *win) { last_converter = "cb_HTML_ShowToolTip_t_8"; }
+static void cb_HTML_StartRequest_t_20(const void *lin, void *win) { last_converter = "cb_HTML_StartRequest_t_20"; }
+static void cb_HTML_StatusText_t_8(const void *lin, void *win) { last_converter = "cb_HTML_StatusText_t_8"; }
+static void cb_HTML_URLChanged_t_24(const void *lin, void *win) { last_converter = "cb_HTML_URLChanged_t_24"; }
+static void cb_HTML_UpdateToolTip_t_8(const void *lin, void *win) { last_converter = "cb_HTML_UpdateToolTip_t_8"; }
+static void cb_HTTPRequestCompleted_t_24(const void *lin, void *win) { last_converter = "cb_HTTPRequestCompleted_t_24"; }
+static void cb_HTTPRequestCompleted_t_32(const void *lin, void *win) { last_converter = "cb_HTTPRequestCompleted_t_32"; }
+static void cb_HTTPRequestDataReceived_t_24(const void *lin, void *win) { last_converter = "cb_HTTPRequestDataReceived_t_24"; }
+static void cb_HTTPRequestHeadersReceived_t_16(const void *lin, void *win) { last_converter = "cb_HTTPRequestHeadersReceived_t_16"; }
+static void cb_ItemInstalled_t_16(const void *lin, void *win) { last_converter = "cb_ItemInstalled_t_16"; }
+static void cb_JoinPartyCallback_t_280(const void *lin, void *win) { last_converter = "cb_JoinPartyCallback_t_280"; }
+static void cb_LeaderboardScoreUploaded_t_32(const void *lin, void *win) { last_converter = "cb_LeaderboardScoreUploaded_t_32"; }
+static void cb_LeaderboardUGCSet_t_16(const void *lin, void *win) { last_converter = "cb_LeaderboardUGCSet_t_16"; }
+static void cb_LobbyCreated_t_16(const void *lin, void *win) { last_converter = "cb_LobbyCreated_t_16"; }
+static void cb_MicroTxnAuthorizationResponse_t_24(const void *lin, void *win) { last_converter = "cb_MicroTxnAuthorizationResponse_t_24"; }
+static void cb_PS3TrophiesInstalled_t_24(const void *lin, void *win) { last_converter = "cb_PS3TrophiesInstalled_t_24"; }
+static void cb_RemoteStorageAppSyncProgress_t_288(const void *lin, void *win) { last_converter = "cb_RemoteStorageAppSyncProgress_t_288"; }
+static void cb_RemoteStorageDeletePublishedFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageDeletePublishedFileResult_t_16"; }
+static void cb_RemoteStorageDownloadUGCResult_t_296(const void *lin, void *win) { last_converter = "cb_RemoteStorageDownloadUGCResult_t_296"; }
+static void cb_RemoteStorageDownloadUGCResult_t_40(const void *lin, void *win) { last_converter = "cb_RemoteStorageDownloadUGCResult_t_40"; }
+static void cb_RemoteStorageEnumerateUserPublishedFilesResult_t_416(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateUserPublishedFilesResult_t_416"; }
+static void cb_RemoteStorageEnumerateUserSharedWorkshopFilesResult_t_416(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateUserSharedWorkshopFilesResult_t_416"; }
+static void cb_RemoteStorageEnumerateUserSubscribedFilesResult_t_616(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateUserSubscribedFilesResult_t_616"; }
+static void cb_RemoteStorageEnumerateWorkshopFilesResult_t_616(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateWorkshopFilesResult_t_616"; }
+static void cb_RemoteStorageEnumerateWorkshopFilesResult_t_624(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateWorkshopFilesResult_t_624"; }
+static void cb_RemoteStorageFileShareResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageFileShareResult_t_16"; }
+static void cb_RemoteStorageFileShareResult_t_280(const void *lin, void *win) { last_converter = "cb_RemoteStorageFileShareResult_t_280"; }
+static void cb_RemoteStorageGetPublishedFileDetailsResult_t_1744(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedFileDetailsResult_t_1744"; }
+static void cb_RemoteStorageGetPublishedFileDetailsResult_t_9496(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedFileDetailsResult_t_9496"; }
+static void cb_RemoteStorageGetPublishedFileDetailsResult_t_9752(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedFileDetailsResult_t_9752"; }
+static void cb_RemoteStorageGetPublishedFileDetailsResult_t_9760(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedFileDetailsResult_t_9760"; }
+static void cb_RemoteStorageGetPublishedItemVoteDetailsResult_t_32(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedItemVoteDetailsResult_t_32"; }
+static void cb_RemoteStoragePublishFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStoragePublishFileResult_t_16"; }
+static void cb_RemoteStoragePublishFileResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStoragePublishFileResult_t_24"; }
+static void cb_RemoteStoragePublishedFileUpdated_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStoragePublishedFileUpdated_t_24"; }
+static void cb_RemoteStorageSetUserPublishedFileActionResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStorageSetUserPublishedFileActionResult_t_24"; }
+static void cb_RemoteStorageSubscribePublishedFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageSubscribePublishedFileResult_t_16"; }
+static void cb_RemoteStorageUnsubscribePublishedFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageUnsubscribePublishedFileResult_t_16"; }
+static void cb_RemoteStorageUpdatePublishedFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageUpdatePublishedFileResult_t_16"; }
+static void cb_RemoteStorageUpdatePublishedFileResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStorageUpdatePublishedFileResult_t_24"; }
+static void cb_RemoteStorageUpdateUserPublishedItemVoteResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageUpdateUserPublishedItemVoteResult_t_16"; }
+static void cb_RemoteStorageUserVoteDetails_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStorageUserVoteDetails_t_24"; }
+static void cb_RemoveAppDependencyResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoveAppDependencyResult_t_24"; }
+static void cb_RemoveUGCDependencyResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoveUGCDependencyResult_t_24"; }
+static void cb_RequestPlayersForGameFinalResultCallback_t_24(const void *lin, void *win) { last_converter = "cb_RequestPlayersForGameFinalResultCallback_t_24"; }
+static void cb_RequestPlayersForGameProgressCallback_t_16(const void *lin, void *win) { last_converter = "cb_RequestPlayersForGameProgressCallback_t_16"; }
+static void cb_RequestPlayersForGameResultCallback_t_64(const void *lin, void *win) { last_converter = "cb_RequestPlayersForGameResultCallback_t_64"; }
+static void cb_SteamInputConfigurationLoaded_t_40(const void *lin, void *win) { last_converter = "cb_SteamInputConfigurationLoaded_t_40"; }
+static void cb_SteamInputGamepadSlotChange_t_32(const void *lin, void *win) { last_converter = "cb_SteamInputGamepadSlotChange_t_32"; }
+static void cb_SteamInventoryStartPurchaseResult_t_24(const void *lin, void *win) { last_converter = "cb_SteamInventoryStartPurchaseResult_t_24"; }
+static void cb_SteamNetConnectionStatusChangedCallback_t_584(const void *lin, void *win) { last_converter = "cb_SteamNetConnectionStatusChangedCallback_t_584"; }
+static void cb_SteamNetConnectionStatusChangedCallback_t_712(const void *lin, void *win) { last_converter = "cb_SteamNetConnectionStatusChangedCallback_t_712"; }
+static void cb_SteamUGCRequestUGCDetailsResult_t_9768(const void *lin, void *win) { last_converter = "cb_SteamUGCRequestUGCDetailsResult_t_9768"; }
+static void cb_SteamUGCRequestUGCDetailsResult_t_9776(const void *lin, void *win) { last_converter = "cb_SteamUGCRequestUGCDetailsResult_t_9776"; }
+static void cb_SteamUGCRequestUGCDetailsResult_t_9784(const void *lin, void *win) { last_converter = "cb_SteamUGCRequestUGCDetailsResult_t_9784"; }
+static void cb_SubmitPlayerResultResultCallback_t_24(const void *lin, void *win) { last_converter = "cb_SubmitPlayerResultResultCallback_t_24"; }
+#endif
+
+#ifdef __x86_64__
+static void cb_AddAppDependencyResult_t_24(const void *lin, void *win) { last_converter = "cb_AddAppDependencyResult_t_24"; }
+static void cb_AddUGCDependencyResult_t_24(const void *lin, void *win) { last_converter = "cb_AddUGCDependencyResult_t_24"; }
+static void cb_CreateBeaconCallback_t_16(const void *lin, void *win) { last_converter = "cb_CreateBeaconCallback_t_16"; }
+static void cb_CreateItemResult_t_24(const void *lin, void *win) { last_converter = "cb_CreateItemResult_t_24"; }
+static void cb_DeleteItemResult_t_16(const void *lin, void *win) { last_converter = "cb_DeleteItemResult_t_16"; }
+static void cb_DownloadItemResult_t_24(const void *lin, void *win) { last_converter = "cb_DownloadItemResult_t_24"; }
+static void cb_EndGameResultCallback_t_16(const void *lin, void *win) { last_converter = "cb_EndGameResultCallback_t_16"; }
+static void cb_FileDetailsResult_t_40(const void *lin, void *win) { last_converter = "cb_FileDetailsResult_t_40"; }
+static void cb_GSReputation_t_40(const void *lin, void *win) { last_converter = "cb_GSReputation_t_40"; }
+static void cb_GetAppDependenciesResult_t_152(const void *lin, void *win) { last_converter = "cb_GetAppDependenciesResult_t_152"; }
+static void cb_HTML_ChangedTitle_t_16(const void *lin, void *win) { last_converter = "cb_HTML_ChangedTitle_t_16"; }
+static void cb_HTML_ComboNeedsPaint_t_24(const void *lin, void *win) { last_converter = "cb_HTML_ComboNeedsPaint_t_24"; }
+static void cb_HTML_FileOpenDialog_t_24(const void *lin, void *win) { last_converter = "cb_HTML_FileOpenDialog_t_24"; }
+static void cb_HTML_FinishedRequest_t_24(const void *lin, void *win) { last_converter = "cb_HTML_FinishedRequest_t_24"; }
+static void cb_HTML_JSAlert_t_16(const void *lin, void *win) { last_converter = "cb_HTML_JSAlert_t_16"; }
+static void cb_HTML_JSConfirm_t_16(const void *lin, void *win) { last_converter = "cb_HTML_JSConfirm_t_16"; }
+static void cb_HTML_LinkAtPosition_t_32(const void *lin, void *win) { last_converter = "cb_HTML_LinkAtPosition_t_32"; }
+static void cb_HTML_NeedsPaint_t_56(const void *lin, void *win) { last_converter = "cb_HTML_NeedsPaint_t_56"; }
+static void cb_HTML_NewWindow_t_32(const void *lin, void *win) { last_converter = "cb_HTML_NewWindow_t_32"; }
+static void cb_HTML_NewWindow_t_40(const void *lin, void *win) { last_converter = "cb_HTML_NewWindow_t_40"; }
+static void cb_HTML_OpenLinkInNewTab_t_16(const void *lin, void *win) { last_converter = "cb_HTML_OpenLinkInNewTab_t_16"; }
+static void cb_HTML_ShowToolTip_t_16(const void *lin, void *win) { last_converter = "cb_HTML_ShowToolTip_t_16"; }
+static void cb_HTML_StartRequest_t_40(const void *lin, void *win) { last_converter = "cb_HTML_StartRequest_t_40"; }
+static void cb_HTML_StatusText_t_16(const void *lin, void *win) { last_converter = "cb_HTML_StatusText_t_16"; }
+static void cb_HTML_URLChanged_t_48(const void *lin, void *win) { last_converter = "cb_HTML_URLChanged_t_48"; }
+static void cb_HTML_UpdateToolTip_t_16(const void *lin, void *win) { last_converter = "cb_HTML_UpdateToolTip_t_16"; }
+static void cb_HTTPRequestCompleted_t_24(const void *lin, void *win) { last_converter = "cb_HTTPRequestCompleted_t_24"; }
+static void cb_HTTPRequestCompleted_t_32(const void *lin, void *win) { last_converter = "cb_HTTPRequestCompleted_t_32"; }
+static void cb_HTTPRequestDataReceived_t_24(const void *lin, void *win) { last_converter = "cb_HTTPRequestDataReceived_t_24"; }
+static void cb_HTTPRequestHeadersReceived_t_16(const void *lin, void *win) { last_converter = "cb_HTTPRequestHeadersReceived_t_16"; }
+static void cb_ItemInstalled_t_16(const void *lin, void *win) { last_converter = "cb_ItemInstalled_t_16"; }
+static void cb_JoinPartyCallback_t_280(const void *lin, void *win) { last_converter = "cb_JoinPartyCallback_t_280"; }
+static void cb_LeaderboardScoreUploaded_t_32(const void *lin, void *win) { last_converter = "cb_LeaderboardScoreUploaded_t_32"; }
+static void cb_LeaderboardUGCSet_t_16(const void *lin, void *win) { last_converter = "cb_LeaderboardUGCSet_t_16"; }
+static void cb_LobbyCreated_t_16(const void *lin, void *win) { last_converter = "cb_LobbyCreated_t_16"; }
+static void cb_MicroTxnAuthorizationResponse_t_24(const void *lin, void *win) { last_converter = "cb_MicroTxnAuthorizationResponse_t_24"; }
+static void cb_PS3TrophiesInstalled_t_24(const void *lin, void *win) { last_converter = "cb_PS3TrophiesInstalled_t_24"; }
+static void cb_RemoteStorageAppSyncProgress_t_288(const void *lin, void *win) { last_converter = "cb_RemoteStorageAppSyncProgress_t_288"; }
+static void cb_RemoteStorageDeletePublishedFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageDeletePublishedFileResult_t_16"; }
+static void cb_RemoteStorageDownloadUGCResult_t_296(const void *lin, void *win) { last_converter = "cb_RemoteStorageDownloadUGCResult_t_296"; }
+static void cb_RemoteStorageDownloadUGCResult_t_40(const void *lin, void *win) { last_converter = "cb_RemoteStorageDownloadUGCResult_t_40"; }
+static void cb_RemoteStorageEnumerateUserPublishedFilesResult_t_416(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateUserPublishedFilesResult_t_416"; }
+static void cb_RemoteStorageEnumerateUserSharedWorkshopFilesResult_t_416(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateUserSharedWorkshopFilesResult_t_416"; }
+static void cb_RemoteStorageEnumerateUserSubscribedFilesResult_t_616(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateUserSubscribedFilesResult_t_616"; }
+static void cb_RemoteStorageEnumerateWorkshopFilesResult_t_616(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateWorkshopFilesResult_t_616"; }
+static void cb_RemoteStorageEnumerateWorkshopFilesResult_t_624(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateWorkshopFilesResult_t_624"; }
+static void cb_RemoteStorageFileShareResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageFileShareResult_t_16"; }
+static void cb_RemoteStorageFileShareResult_t_280(const void *lin, void *win) { last_converter = "cb_RemoteStorageFileShareResult_t_280"; }
+static void cb_RemoteStorageGetPublishedFileDetailsResult_t_1744(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedFileDetailsResult_t_1744"; }
+static void cb_RemoteStorageGetPublishedFileDetailsResult_t_9496(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedFileDetailsResult_t_9496"; }
+static void cb_RemoteStorageGetPublishedFileDetailsResult_t_9752(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedFileDetailsResult_t_9752"; }
+static void cb_RemoteStorageGetPublishedFileDetailsResult_t_9760(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedFileDetailsResult_t_9760"; }
+static void cb_RemoteStorageGetPublishedItemVoteDetailsResult_t_32(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedItemVoteDetailsResult_t_32"; }
+static void cb_RemoteStoragePublishFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStoragePublishFileResult_t_16"; }
+static void cb_RemoteStoragePublishFileResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStoragePublishFileResult_t_24"; }
+static void cb_RemoteStoragePublishedFileUpdated_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStoragePublishedFileUpdated_t_24"; }
+static void cb_RemoteStorageSetUserPublishedFileActionResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStorageSetUserPublishedFileActionResult_t_24"; }
+static void cb_RemoteStorageSubscribePublishedFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageSubscribePublishedFileResult_t_16"; }
+static void cb_RemoteStorageUnsubscribePublishedFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageUnsubscribePublishedFileResult_t_16"; }
+static void cb_RemoteStorageUpdatePublishedFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageUpdatePublishedFileResult_t_16"; }
+static void cb_RemoteStorageUpdatePublishedFileResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStorageUpdatePublishedFileResult_t_24"; }
+static void cb_RemoteStorageUpdateUserPublishedItemVoteResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageUpdateUserPublishedItemVoteResult_t_16"; }
+static void cb_RemoteStorageUserVoteDetails_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStorageUserVoteDetails_t_24"; }
+static void cb_RemoveAppDependencyResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoveAppDependencyResult_t_24"; }
+static void cb_RemoveUGCDependencyResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoveUGCDependencyResult_t_24"; }
+static void cb_RequestPlayersForGameFinalResultCallback_t_24(const void *lin, void *win) { last_converter = "cb_RequestPlayersForGameFinalResultCallback_t_24"; }
+static void cb_RequestPlayersForGameProgressCallback_t_16(const void *lin, void *win) { last_converter = "cb_RequestPlayersForGameProgressCallback_t_16"; }
+static void cb_RequestPlayersForGameResultCallback_t_64(const void *lin, void *win) { last_converter = "cb_RequestPlayersForGameResultCallback_t_64"; }
+static void cb_SteamInputConfigurationLoaded_t_40(const void *lin, void *win) { last_converter = "cb_SteamInputConfigurationLoaded_t_40"; }
+static void cb_SteamInputGamepadSlotChange_t_32(const void *lin, void *win) { last_converter = "cb_SteamInputGamepadSlotChange_t_32"; }
+static void cb_SteamInventoryStartPurchaseResult_t_24(const void *lin, void *win) { last_converter = "cb_SteamInventoryStartPurchaseResult_t_24"; }
+static void cb_SteamNetConnectionStatusChangedCallback_t_584(const void *lin, void *win) { last_converter = "cb_SteamNetConnectionStatusChangedCallback_t_584"; }
+static void cb_SteamNetConnectionStatusChangedCallback_t_712(const void *lin, void *win) { last_converter = "cb_SteamNetConnectionStatusChangedCallback_t_712"; }
+static void cb_SteamUGCRequestUGCDetailsResult_t_9768(const void *lin, void *win) { last_converter = "cb_SteamUGCRequestUGCDetailsResult_t_9768"; }
+static void cb_SteamUGCRequestUGCDetailsResult_t_9776(const void *lin, void *win) { last_converter = "cb_SteamUGCRequestUGCDetailsResult_t_9776"; }
+static void cb_SteamUGCRequestUGCDetailsResult_t_9784(const void *lin, void *win) { last_converter = "cb_SteamUGCRequestUGCDetailsResult_t_9784"; }
+static void cb_SubmitPlayerResultResultCallback_t_24(const void *lin, void *win) { last_converter = "cb_SubmitPlayerResultResultCallback_t_24"; }
+#endif
+
+#include "steamclient_cb_tables.h"
+#include "steamclient_cb_buffers.h"
+
+struct message
+{
+    int id;
+    int cb;
+    int callback_len;
+};
+
+static const struct message messages[] =
+{
+#ifdef __i386__
+    {0x0008119b, 152, 24},
+    {0x0008119c, 209, 40},
+    {0x000811a2, 513, 16},
+    {0x000811a3, 1023, 40},
+    {0x000811ab, 1106, 32},
+    {0x000811ac, 1111, 16},
+    {0x000811ad, 1112, 24},
+    {0x000c0201, 1221, 712},
+    {0x000c0457, 1303, 288},
+    {0x000c051b, 1307, 280},
+    {0x000c051d, 1308, 40},
+    {0x000c051f, 1309, 24},
+    {0x000c0521, 1310, 1744},
+    {0x000c0523, 1311, 16},
+    {0x000c0524, 1312, 416},
+    {0x000c052c, 1313, 16},
+    {0x000c0836, 1314, 616},
+    {0x000c0d4d, 1315, 16},
+    {0x000c0d59, 1316, 24},
+    {0x000c119a, 1317, 296},
+    {0x000c11a4, 1318, 9760},
+    {0x000c145b, 1319, 624},
+    {0x000c145f, 1320, 32},
+    {0x000c14b6, 1324, 16},
+    {0x00100098, 1325, 24},
+    {0x0010051d, 1326, 416},
+    {0x00100524, 1327, 24},
+    {0x0010052d, 1330, 24},
+    {0x0010052f, 2101, 32},
+    {0x00100d4b, 2102, 16},
+    {0x00100d4e, 2103, 24},
+    {0x00100d56, 2803, 40},
+    {0x00100d57, 2804, 32},
+    {0x001011a5, 3402, 9784},
+    {0x00140458, 3403, 24},
+    {0x00140532, 3405, 16},
+    {0x00140835, 3406, 24},
+    {0x00140837, 3412, 24},
+    {0x00140d54, 3413, 24},
+    {0x00140d55, 3414, 24},
+    {0x00141197, 3415, 24},
+    {0x001411a1, 3416, 152},
+    {0x00141260, 3417, 16},
+    {0x0014145d, 4502, 48},
+    {0x0014145e, 4503, 20},
+    {0x00180835, 4505, 24},
+    {0x00180af4, 4506, 12},
+    {0x00181199, 4507, 8},
+    {0x001811a9, 4508, 8},
+    {0x001c0452, 4513, 20},
+    {0x001c0528, 4514, 8},
+    {0x001c11a9, 4515, 8},
+    {0x002000d1, 4516, 12},
+    {0x0020051c, 4517, 16},
+    {0x00200af3, 4521, 28},
+    {0x002403ff, 4523, 8},
+    {0x00301196, 4524, 8},
+    {0x0038145c, 4525, 8},
+    {0x00940d58, 4704, 24},
+    {0x0110051b, 5211, 16},
+    {0x011414b5, 5212, 64},
+    {0x01180517, 5213, 24},
+    {0x01200525, 5214, 24},
+    {0x019c0520, 5215, 16},
+    {0x019c052e, 5301, 280},
+    {0x024004c5, 5302, 16},
+    {0x02640522, 1307, 16},
+    {0x02640527, 1309, 16},
+    {0x026c0527, 1316, 16},
+    {0x02c004c5, 2101, 24},
+    {0x06c4051e, 4521, 24},
+    {0x250c0526, 1221, 584},
+    {0x26100526, 1319, 616},
+    {0x26140526, 1318, 9496},
+    {0x26200d4a, 1318, 9752},
+    {0x26240d4a, 3402, 9768},
+    {0x26280d4a, 3402, 9776},
+#endif
+#ifdef __x86_64__
+    {0x000c0201, 152, 24},
+    {0x000c0457, 209, 40},
+    {0x000c051b, 513, 16},
+    {0x000c051d, 1023, 40},
+    {0x000c051f, 1106, 32},
+    {0x000c0521, 1111, 16},
+    {0x000c0523, 1112, 24},
+    {0x000c0524, 1221, 712},
+    {0x000c052c, 1303, 288},
+    {0x000c0836, 1307, 280},
+    {0x000c0d4d, 1308, 40},
+    {0x000c0d59, 1309, 24},
+    {0x000c119b, 1310, 1744},
+    {0x000c119c, 1311, 16},
+    {0x000c11a2, 1312, 416},
+    {0x000c11a3, 1313, 16},
+    {0x000c11ab, 1314, 616},
+    {0x000c11ac, 1315, 16},
+    {0x000c11ad, 1316, 24},
+    {0x000c145b, 1317, 296},
+    {0x000c145f, 1318, 9760},
+    {0x000c14b6, 1319, 624},
+    {0x00100098, 1320, 32},
+    {0x0010051d, 1324, 16},
+    {0x00100524, 1325, 24},
+    {0x0010052d, 1326, 416},
+    {0x0010052f, 1327, 24},
+    {0x00100d4b, 1330, 24},
+    {0x00100d4e, 2101, 32},
+    {0x00100d56, 2102, 16},
+    {0x00100d57, 2103, 24},
+    {0x00140458, 2803, 40},
+    {0x00140532, 2804, 32},
+    {0x00140835, 3402, 9784},
+    {0x00140837, 3403, 24},
+    {0x00140d54, 3405, 16},
+    {0x00140d55, 3406, 24},
+    {0x0014119a, 3412, 24},
+    {0x001411a4, 3413, 24},
+    {0x001411a5, 3414, 24},
+    {0x00141260, 3415, 24},
+    {0x0014145d, 3416, 152},
+    {0x0014145e, 3417, 16},
+    {0x00180835, 4502, 56},
+    {0x00180af4, 4503, 40},
+    {0x001811a1, 4505, 48},
+    {0x001c0452, 4506, 24},
+    {0x001c0528, 4507, 16},
+    {0x001c11a9, 4508, 16},
+    {0x002000d1, 4513, 32},
+    {0x0020051c, 4514, 16},
+    {0x00200af3, 4515, 16},
+    {0x00201197, 4516, 24},
+    {0x002011a9, 4517, 24},
+    {0x002403ff, 4521, 40},
+    {0x00241199, 4523, 16},
+    {0x00341196, 4524, 16},
+    {0x0038145c, 4525, 16},
+    {0x00940d58, 4704, 24},
+    {0x0110051b, 5211, 16},
+    {0x011414b5, 5212, 64},
+    {0x01180517, 5213, 24},
+    {0x01200525, 5214, 24},
+    {0x019c0520, 5215, 16},
+    {0x019c052e, 5301, 280},
+    {0x024004c5, 5302, 16},
+    {0x02640522, 1307, 16},
+    {0x02640527, 1309, 16},
+    {0x026c0527, 1316, 16},
+    {0x02c004c5, 2101, 24},
+    {0x06c4051e, 4521, 32},
+    {0x250c0526, 1221, 584},
+    {0x26100526, 1319, 616},
+    {0x26140526, 1318, 9496},
+    {0x26200d4a, 1318, 9752},
+    {0x26240d4a, 3402, 9768},
+    {0x26280d4a, 3402, 9776},
+#endif
+};
+
+static void check_size_classes(const struct cb_entry *table, unsigned int count, unsigned int *failures)
+{
+    unsigned int i;
+
+    for (i = 0; i < count; ++i)
+    {
+        if (table[i].id && (table[i].size_class >= CB_BUFFER_SIZE_CLASSES ||
+                CB_BUFFER_MIN_SIZE << table[i].size_class < (table == cb_converters ? table[i].win_size : table[i].lin_size)))
+        {
+            printf("id %#x: size class %d is too small\n", table[i].id, table[i].size_class);
+            ++*failures;
+        }
+    }
+}
+
+int main(void)
+{
+    const struct cb_entry *callback, *result;
+    const struct message *msg;
+    unsigned int i, before, after, failures = 0;
+    void *callback_buffer, *result_buffer;
+
+    check_size_classes(cb_converters, sizeof(cb_converters) / sizeof(cb_converters[0]), &failures);
+    check_size_classes(cb_getapi_table, sizeof(cb_getapi_table) / sizeof(cb_getapi_table[0]), &failures);
+
+    heap_allocs = 0;
+    for (i = 0; i < 10000; ++i)
+    {
+        msg = &messages[i % (sizeof(messages) / sizeof(messages[0]))];
+        callback = find_cb_converter(msg->id);
+        result = find_cb_getapi_entry(msg->cb, msg->callback_len);
+
+        callback_buffer = HeapAlloc(GetProcessHeap(), 0, callback->win_size);
+        callback->convert(NULL, callback_buffer);
+        result_buffer = HeapAlloc(GetProcessHeap(), 0, result->lin_size);
+        result->convert(result_buffer, NULL);
+        HeapFree(GetProcessHeap(), 0, result_buffer);
+        HeapFree(GetProcessHeap(), 0, callback_buffer);
+    }
+    before = heap_allocs;
+
+    heap_allocs = 0;
+    for (i = 0; i < 10000; ++i)
+    {
+        msg = &messages[i % (sizeof(messages) / sizeof(messages[0]))];
+        callback = find_cb_converter(msg->id);
+        result = find_cb_getapi_entry(msg->cb, msg->callback_len);
+
+        callback_buffer = alloc_cb_buffer(callback->size_class);
+        callback->convert(NULL, callback_buffer);
+        result_buffer = alloc_cb_buffer(result->size_class);
+        result->convert(result_buffer, NULL);
+        free_cb_buffer(result_buffer, result->size_class);
+        free_cb_buffer(callback_buffer, callback->size_class);
+    }
+    after = heap_allocs;
+
+    printf("heap allocations per 10000 callbacks: %u before, %u after\n", before, after);
+    if (after > CB_BUFFER_SIZE_CLASSES * CB_BUFFER_POOL_SLOTS)
+    {
+        printf("the buffer pool allocated more than it can hold\n");
+        ++failures;
+    }
+
+    return failures != 0;
+}
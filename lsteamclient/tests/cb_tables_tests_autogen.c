@@ -0,0 +1,1463 @@
+/* This file is auto-generated, do not edit. */
+#include <stdio.h>
+
+typedef void (*cb_converter)(const void *lin, void *win);
+static const char *last_converter;
+
+#ifdef __i386__
+static void cb_AddAppDependencyResult_t_24(const void *lin, void *win) { last_converter = "cb_AddAppDependencyResult_t_24"; }
+static void cb_AddUGCDependencyResult_t_24(const void *lin, void *win) { last_converter = "cb_AddUGCDependencyResult_t_24"; }
+static void cb_CreateBeaconCallback_t_16(const void *lin, void *win) { last_converter = "cb_CreateBeaconCallback_t_16"; }
+static void cb_CreateItemResult_t_24(const void *lin, void *win) { last_converter = "cb_CreateItemResult_t_24"; }
+static void cb_DeleteItemResult_t_16(const void *lin, void *win) { last_converter = "cb_DeleteItemResult_t_16"; }
+static void cb_DownloadItemResult_t_24(const void *lin, void *win) { last_converter = "cb_DownloadItemResult_t_24"; }
+static void cb_EndGameResultCallback_t_16(const void *lin, void *win) { last_converter = "cb_EndGameResultCallback_t_16"; }
+static void cb_FileDetailsResult_t_40(const void *lin, void *win) { last_converter = "cb_FileDetailsResult_t_40"; }
+static void cb_GSReputation_t_40(const void *lin, void *win) { last_converter = "cb_GSReputation_t_40"; }
+static void cb_GetAppDependenciesResult_t_152(const void *lin, void *win) { last_converter = "cb_GetAppDependenciesResult_t_152"; }
+static void cb_HTML_ChangedTitle_t_8(const void *lin, void *win) { last_converter = "cb_HTML_ChangedTitle_t_8"; }
+static void cb_HTML_ComboNeedsPaint_t_16(const void *lin, void *win) { last_converter = "cb_HTML_ComboNeedsPaint_t_16"; }
+static void cb_HTML_FileOpenDialog_t_12(const void *lin, void *win) { last_converter = "cb_HTML_FileOpenDialog_t_12"; }
+static void cb_HTML_FinishedRequest_t_12(const void *lin, void *win) { last_converter = "cb_HTML_FinishedRequest_t_12"; }
+static void cb_HTML_JSAlert_t_8(const void *lin, void *win) { last_converter = "cb_HTML_JSAlert_t_8"; }
+static void cb_HTML_JSConfirm_t_8(const void *lin, void *win) { last_converter = "cb_HTML_JSConfirm_t_8"; }
+static void cb_HTML_LinkAtPosition_t_20(const void *lin, void *win) { last_converter = "cb_HTML_LinkAtPosition_t_20"; }
+static void cb_HTML_NeedsPaint_t_48(const void *lin, void *win) { last_converter = "cb_HTML_NeedsPaint_t_48"; }
+static void cb_HTML_NewWindow_t_24(const void *lin, void *win) { last_converter = "cb_HTML_NewWindow_t_24"; }
+static void cb_HTML_NewWindow_t_28(const void *lin, void *win) { last_converter = "cb_HTML_NewWindow_t_28"; }
+static void cb_HTML_OpenLinkInNewTab_t_8(const void *lin, void *win) { last_converter = "cb_HTML_OpenLinkInNewTab_t_8"; }
+static void cb_HTML_ShowToolTip_t_8(const void *lin, void *win) { last_converter = "cb_HTML_ShowToolTip_t_8"; }
+static void cb_HTML_StartRequest_t_20(const void *lin, void *win) { last_converter = "cb_HTML_StartRequest_t_20"; }
+static void cb_HTML_StatusText_t_8(const void *lin, void *win) { last_converter = "cb_HTML_StatusText_t_8"; }
+static void cb_HTML_URLChanged_t_24(const void *lin, void *win) { last_converter = "cb_HTML_URLChanged_t_24"; }
+static void cb_HTML_UpdateToolTip_t_8(const void *lin, void *win) { last_converter = "cb_HTML_UpdateToolTip_t_8"; }
+static void cb_HTTPRequestCompleted_t_24(const void *lin, void *win) { last_converter = "cb_HTTPRequestCompleted_t_24"; }
+static void cb_HTTPRequestCompleted_t_32(const void *lin, void *win) { last_converter = "cb_HTTPRequestCompleted_t_32"; }
+static void cb_HTTPRequestDataReceived_t_24(const void *lin, void *win) { last_converter = "cb_HTTPRequestDataReceived_t_24"; }
+static void cb_HTTPRequestHeadersReceived_t_16(const void *lin, void *win) { last_converter = "cb_HTTPRequestHeadersReceived_t_16"; }
+static void cb_ItemInstalled_t_16(const void *lin, void *win) { last_converter = "cb_ItemInstalled_t_16"; }
+static void cb_JoinPartyCallback_t_280(const void *lin, void *win) { last_converter = "cb_JoinPartyCallback_t_280"; }
+static void cb_LeaderboardScoreUploaded_t_32(const void *lin, void *win) { last_converter = "cb_LeaderboardScoreUploaded_t_32"; }
+static void cb_LeaderboardUGCSet_t_16(const void *lin, void *win) { last_converter = "cb_LeaderboardUGCSet_t_16"; }
+static void cb_LobbyCreated_t_16(const void *lin, void *win) { last_converter = "cb_LobbyCreated_t_16"; }
+static void cb_MicroTxnAuthorizationResponse_t_24(const void *lin, void *win) { last_converter = "cb_MicroTxnAuthorizationResponse_t_24"; }
+static void cb_PS3TrophiesInstalled_t_24(const void *lin, void *win) { last_converter = "cb_PS3TrophiesInstalled_t_24"; }
+static void cb_RemoteStorageAppSyncProgress_t_288(const void *lin, void *win) { last_converter = "cb_RemoteStorageAppSyncProgress_t_288"; }
+static void cb_RemoteStorageDeletePublishedFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageDeletePublishedFileResult_t_16"; }
+static void cb_RemoteStorageDownloadUGCResult_t_296(const void *lin, void *win) { last_converter = "cb_RemoteStorageDownloadUGCResult_t_296"; }
+static void cb_RemoteStorageDownloadUGCResult_t_40(const void *lin, void *win) { last_converter = "cb_RemoteStorageDownloadUGCResult_t_40"; }
+static void cb_RemoteStorageEnumerateUserPublishedFilesResult_t_416(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateUserPublishedFilesResult_t_416"; }
+static void cb_RemoteStorageEnumerateUserSharedWorkshopFilesResult_t_416(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateUserSharedWorkshopFilesResult_t_416"; }
+static void cb_RemoteStorageEnumerateUserSubscribedFilesResult_t_616(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateUserSubscribedFilesResult_t_616"; }
+static void cb_RemoteStorageEnumerateWorkshopFilesResult_t_616(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateWorkshopFilesResult_t_616"; }
+static void cb_RemoteStorageEnumerateWorkshopFilesResult_t_624(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateWorkshopFilesResult_t_624"; }
+static void cb_RemoteStorageFileShareResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageFileShareResult_t_16"; }
+static void cb_RemoteStorageFileShareResult_t_280(const void *lin, void *win) { last_converter = "cb_RemoteStorageFileShareResult_t_280"; }
+static void cb_RemoteStorageGetPublishedFileDetailsResult_t_1744(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedFileDetailsResult_t_1744"; }
+static void cb_RemoteStorageGetPublishedFileDetailsResult_t_9496(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedFileDetailsResult_t_9496"; }
+static void cb_RemoteStorageGetPublishedFileDetailsResult_t_9752(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedFileDetailsResult_t_9752"; }
+static void cb_RemoteStorageGetPublishedFileDetailsResult_t_9760(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedFileDetailsResult_t_9760"; }
+static void cb_RemoteStorageGetPublishedItemVoteDetailsResult_t_32(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedItemVoteDetailsResult_t_32"; }
+static void cb_RemoteStoragePublishFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStoragePublishFileResult_t_16"; }
+static void cb_RemoteStoragePublishFileResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStoragePublishFileResult_t_24"; }
+static void cb_RemoteStoragePublishedFileUpdated_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStoragePublishedFileUpdated_t_24"; }
+static void cb_RemoteStorageSetUserPublishedFileActionResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStorageSetUserPublishedFileActionResult_t_24"; }
+static void cb_RemoteStorageSubscribePublishedFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageSubscribePublishedFileResult_t_16"; }
+static void cb_RemoteStorageUnsubscribePublishedFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageUnsubscribePublishedFileResult_t_16"; }
+static void cb_RemoteStorageUpdatePublishedFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageUpdatePublishedFileResult_t_16"; }
+static void cb_RemoteStorageUpdatePublishedFileResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStorageUpdatePublishedFileResult_t_24"; }
+static void cb_RemoteStorageUpdateUserPublishedItemVoteResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageUpdateUserPublishedItemVoteResult_t_16"; }
+static void cb_RemoteStorageUserVoteDetails_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStorageUserVoteDetails_t_24"; }
+static void cb_RemoveAppDependencyResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoveAppDependencyResult_t_24"; }
+static void cb_RemoveUGCDependencyResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoveUGCDependencyResult_t_24"; }
+static void cb_RequestPlayersForGameFinalResultCallback_t_24(const void *lin, void *win) { last_converter = "cb_RequestPlayersForGameFinalResultCallback_t_24"; }
+static void cb_RequestPlayersForGameProgressCallback_t_16(const void *lin, void *win) { last_converter = "cb_RequestPlayersForGameProgressCallback_t_16"; }
+static void cb_RequestPlayersForGameResultCallback_t_64(const void *lin, void *win) { last_converter = "cb_RequestPlayersForGameResultCallback_t_64"; }
+static void cb_SteamInputConfigurationLoaded_t_40(const void *lin, void *win) { last_converter = "cb_SteamInputConfigurationLoaded_t_40"; }
+static void cb_SteamInputGamepadSlotChange_t_32(const void *lin, void *win) { last_converter = "cb_SteamInputGamepadSlotChange_t_32"; }
+static void cb_SteamInventoryStartPurchaseResult_t_24(const void *lin, void *win) { last_converter = "cb_SteamInventoryStartPurchaseResult_t_24"; }
+static void cb_SteamNetConnectionStatusChangedCallback_t_584(const void *lin, void *win) { last_converter = "cb_SteamNetConnectionStatusChangedCallback_t_584"; }
+static void cb_SteamNetConnectionStatusChangedCallback_t_712(const void *lin, void *win) { last_converter = "cb_SteamNetConnectionStatusChangedCallback_t_712"; }
+static void cb_SteamUGCRequestUGCDetailsResult_t_9768(const void *lin, void *win) { last_converter = "cb_SteamUGCRequestUGCDetailsResult_t_9768"; }
+static void cb_SteamUGCRequestUGCDetailsResult_t_9776(const void *lin, void *win) { last_converter = "cb_SteamUGCRequestUGCDetailsResult_t_9776"; }
+static void cb_SteamUGCRequestUGCDetailsResult_t_9784(const void *lin, void *win) { last_converter = "cb_SteamUGCRequestUGCDetailsResult_t_9784"; }
+static void cb_SubmitPlayerResultResultCallback_t_24(const void *lin, void *win) { last_converter = "cb_SubmitPlayerResultResultCallback_t_24"; }
+#endif
+
+#ifdef __x86_64__
+static void cb_AddAppDependencyResult_t_24(const void *lin, void *win) { last_converter = "cb_AddAppDependencyResult_t_24"; }
+static void cb_AddUGCDependencyResult_t_24(const void *lin, void *win) { last_converter = "cb_AddUGCDependencyResult_t_24"; }
+static void cb_CreateBeaconCallback_t_16(const void *lin, void *win) { last_converter = "cb_CreateBeaconCallback_t_16"; }
+static void cb_CreateItemResult_t_24(const void *lin, void *win) { last_converter = "cb_CreateItemResult_t_24"; }
+static void cb_DeleteItemResult_t_16(const void *lin, void *win) { last_converter = "cb_DeleteItemResult_t_16"; }
+static void cb_DownloadItemResult_t_24(const void *lin, void *win) { last_converter = "cb_DownloadItemResult_t_24"; }
+static void cb_EndGameResultCallback_t_16(const void *lin, void *win) { last_converter = "cb_EndGameResultCallback_t_16"; }
+static void cb_FileDetailsResult_t_40(const void *lin, void *win) { last_converter = "cb_FileDetailsResult_t_40"; }
+static void cb_GSReputation_t_40(const void *lin, void *win) { last_converter = "cb_GSReputation_t_40"; }
+static void cb_GetAppDependenciesResult_t_152(const void *lin, void *win) { last_converter = "cb_GetAppDependenciesResult_t_152"; }
+static void cb_HTML_ChangedTitle_t_16(const void *lin, void *win) { last_converter = "cb_HTML_ChangedTitle_t_16"; }
+static void cb_HTML_ComboNeedsPaint_t_24(const void *lin, void *win) { last_converter = "cb_HTML_ComboNeedsPaint_t_24"; }
+static void cb_HTML_FileOpenDialog_t_24(const void *lin, void *win) { last_converter = "cb_HTML_FileOpenDialog_t_24"; }
+static void cb_HTML_FinishedRequest_t_24(const void *lin, void *win) { last_converter = "cb_HTML_FinishedRequest_t_24"; }
+static void cb_HTML_JSAlert_t_16(const void *lin, void *win) { last_converter = "cb_HTML_JSAlert_t_16"; }
+static void cb_HTML_JSConfirm_t_16(const void *lin, void *win) { last_converter = "cb_HTML_JSConfirm_t_16"; }
+static void cb_HTML_LinkAtPosition_t_32(const void *lin, void *win) { last_converter = "cb_HTML_LinkAtPosition_t_32"; }
+static void cb_HTML_NeedsPaint_t_56(const void *lin, void *win) { last_converter = "cb_HTML_NeedsPaint_t_56"; }
+static void cb_HTML_NewWindow_t_32(const void *lin, void *win) { last_converter = "cb_HTML_NewWindow_t_32"; }
+static void cb_HTML_NewWindow_t_40(const void *lin, void *win) { last_converter = "cb_HTML_NewWindow_t_40"; }
+static void cb_HTML_OpenLinkInNewTab_t_16(const void *lin, void *win) { last_converter = "cb_HTML_OpenLinkInNewTab_t_16"; }
+static void cb_HTML_ShowToolTip_t_16(const void *lin, void *win) { last_converter = "cb_HTML_ShowToolTip_t_16"; }
+static void cb_HTML_StartRequest_t_40(const void *lin, void *win) { last_converter = "cb_HTML_StartRequest_t_40"; }
+static void cb_HTML_StatusText_t_16(const void *lin, void *win) { last_converter = "cb_HTML_StatusText_t_16"; }
+static void cb_HTML_URLChanged_t_48(const void *lin, void *win) { last_converter = "cb_HTML_URLChanged_t_48"; }
+static void cb_HTML_UpdateToolTip_t_16(const void *lin, void *win) { last_converter = "cb_HTML_UpdateToolTip_t_16"; }
+static void cb_HTTPRequestCompleted_t_24(const void *lin, void *win) { last_converter = "cb_HTTPRequestCompleted_t_24"; }
+static void cb_HTTPRequestCompleted_t_32(const void *lin, void *win) { last_converter = "cb_HTTPRequestCompleted_t_32"; }
+static void cb_HTTPRequestDataReceived_t_24(const void *lin, void *win) { last_converter = "cb_HTTPRequestDataReceived_t_24"; }
+static void cb_HTTPRequestHeadersReceived_t_16(const void *lin, void *win) { last_converter = "cb_HTTPRequestHeadersReceived_t_16"; }
+static void cb_ItemInstalled_t_16(const void *lin, void *win) { last_converter = "cb_ItemInstalled_t_16"; }
+static void cb_JoinPartyCallback_t_280(const void *lin, void *win) { last_converter = "cb_JoinPartyCallback_t_280"; }
+static void cb_LeaderboardScoreUploaded_t_32(const void *lin, void *win) { last_converter = "cb_LeaderboardScoreUploaded_t_32"; }
+static void cb_LeaderboardUGCSet_t_16(const void *lin, void *win) { last_converter = "cb_LeaderboardUGCSet_t_16"; }
+static void cb_LobbyCreated_t_16(const void *lin, void *win) { last_converter = "cb_LobbyCreated_t_16"; }
+static void cb_MicroTxnAuthorizationResponse_t_24(const void *lin, void *win) { last_converter = "cb_MicroTxnAuthorizationResponse_t_24"; }
+static void cb_PS3TrophiesInstalled_t_24(const void *lin, void *win) { last_converter = "cb_PS3TrophiesInstalled_t_24"; }
+static void cb_RemoteStorageAppSyncProgress_t_288(const void *lin, void *win) { last_converter = "cb_RemoteStorageAppSyncProgress_t_288"; }
+static void cb_RemoteStorageDeletePublishedFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageDeletePublishedFileResult_t_16"; }
+static void cb_RemoteStorageDownloadUGCResult_t_296(const void *lin, void *win) { last_converter = "cb_RemoteStorageDownloadUGCResult_t_296"; }
+static void cb_RemoteStorageDownloadUGCResult_t_40(const void *lin, void *win) { last_converter = "cb_RemoteStorageDownloadUGCResult_t_40"; }
+static void cb_RemoteStorageEnumerateUserPublishedFilesResult_t_416(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateUserPublishedFilesResult_t_416"; }
+static void cb_RemoteStorageEnumerateUserSharedWorkshopFilesResult_t_416(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateUserSharedWorkshopFilesResult_t_416"; }
+static void cb_RemoteStorageEnumerateUserSubscribedFilesResult_t_616(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateUserSubscribedFilesResult_t_616"; }
+static void cb_RemoteStorageEnumerateWorkshopFilesResult_t_616(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateWorkshopFilesResult_t_616"; }
+static void cb_RemoteStorageEnumerateWorkshopFilesResult_t_624(const void *lin, void *win) { last_converter = "cb_RemoteStorageEnumerateWorkshopFilesResult_t_624"; }
+static void cb_RemoteStorageFileShareResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageFileShareResult_t_16"; }
+static void cb_RemoteStorageFileShareResult_t_280(const void *lin, void *win) { last_converter = "cb_RemoteStorageFileShareResult_t_280"; }
+static void cb_RemoteStorageGetPublishedFileDetailsResult_t_1744(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedFileDetailsResult_t_1744"; }
+static void cb_RemoteStorageGetPublishedFileDetailsResult_t_9496(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedFileDetailsResult_t_9496"; }
+static void cb_RemoteStorageGetPublishedFileDetailsResult_t_9752(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedFileDetailsResult_t_9752"; }
+static void cb_RemoteStorageGetPublishedFileDetailsResult_t_9760(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedFileDetailsResult_t_9760"; }
+static void cb_RemoteStorageGetPublishedItemVoteDetailsResult_t_32(const void *lin, void *win) { last_converter = "cb_RemoteStorageGetPublishedItemVoteDetailsResult_t_32"; }
+static void cb_RemoteStoragePublishFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStoragePublishFileResult_t_16"; }
+static void cb_RemoteStoragePublishFileResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStoragePublishFileResult_t_24"; }
+static void cb_RemoteStoragePublishedFileUpdated_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStoragePublishedFileUpdated_t_24"; }
+static void cb_RemoteStorageSetUserPublishedFileActionResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStorageSetUserPublishedFileActionResult_t_24"; }
+static void cb_RemoteStorageSubscribePublishedFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageSubscribePublishedFileResult_t_16"; }
+static void cb_RemoteStorageUnsubscribePublishedFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageUnsubscribePublishedFileResult_t_16"; }
+static void cb_RemoteStorageUpdatePublishedFileResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageUpdatePublishedFileResult_t_16"; }
+static void cb_RemoteStorageUpdatePublishedFileResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStorageUpdatePublishedFileResult_t_24"; }
+static void cb_RemoteStorageUpdateUserPublishedItemVoteResult_t_16(const void *lin, void *win) { last_converter = "cb_RemoteStorageUpdateUserPublishedItemVoteResult_t_16"; }
+static void cb_RemoteStorageUserVoteDetails_t_24(const void *lin, void *win) { last_converter = "cb_RemoteStorageUserVoteDetails_t_24"; }
+static void cb_RemoveAppDependencyResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoveAppDependencyResult_t_24"; }
+static void cb_RemoveUGCDependencyResult_t_24(const void *lin, void *win) { last_converter = "cb_RemoveUGCDependencyResult_t_24"; }
+static void cb_RequestPlayersForGameFinalResultCallback_t_24(const void *lin, void *win) { last_converter = "cb_RequestPlayersForGameFinalResultCallback_t_24"; }
+static void cb_RequestPlayersForGameProgressCallback_t_16(const void *lin, void *win) { last_converter = "cb_RequestPlayersForGameProgressCallback_t_16"; }
+static void cb_RequestPlayersForGameResultCallback_t_64(const void *lin, void *win) { last_converter = "cb_RequestPlayersForGameResultCallback_t_64"; }
+static void cb_SteamInputConfigurationLoaded_t_40(const void *lin, void *win) { last_converter = "cb_SteamInputConfigurationLoaded_t_40"; }
+static void cb_SteamInputGamepadSlotChange_t_32(const void *lin, void *win) { last_converter = "cb_SteamInputGamepadSlotChange_t_32"; }
+static void cb_SteamInventoryStartPurchaseResult_t_24(const void *lin, void *win) { last_converter = "cb_SteamInventoryStartPurchaseResult_t_24"; }
+static void cb_SteamNetConnectionStatusChangedCallback_t_584(const void *lin, void *win) { last_converter = "cb_SteamNetConnectionStatusChangedCallback_t_584"; }
+static void cb_SteamNetConnectionStatusChangedCallback_t_712(const void *lin, void *win) { last_converter = "cb_SteamNetConnectionStatusChangedCallback_t_712"; }
+static void cb_SteamUGCRequestUGCDetailsResult_t_9768(const void *lin, void *win) { last_converter = "cb_SteamUGCRequestUGCDetailsResult_t_9768"; }
+static void cb_SteamUGCRequestUGCDetailsResult_t_9776(const void *lin, void *win) { last_converter = "cb_SteamUGCRequestUGCDetailsResult_t_9776"; }
+static void cb_SteamUGCRequestUGCDetailsResult_t_9784(const void *lin, void *win) { last_converter = "cb_SteamUGCRequestUGCDetailsResult_t_9784"; }
+static void cb_SubmitPlayerResultResultCallback_t_24(const void *lin, void *win) { last_converter = "cb_SubmitPlayerResultResultCallback_t_24"; }
+#endif
+
+#include "steamclient_cb_tables.h"
+
+static cb_converter switch_converter(int id, int *win_size)
+{
+    switch(id){
+#ifdef __i386__
+    case 0x00100098: *win_size = 24; return (cb_converter)cb_MicroTxnAuthorizationResponse_t_24;
+    case 0x000c0201: *win_size = 16; return (cb_converter)cb_LobbyCreated_t_16;
+    case 0x000c145b: *win_size = 16; return (cb_converter)cb_RequestPlayersForGameProgressCallback_t_16;
+    case 0x0038145c: *win_size = 64; return (cb_converter)cb_RequestPlayersForGameResultCallback_t_64;
+    case 0x0014145d: *win_size = 24; return (cb_converter)cb_RequestPlayersForGameFinalResultCallback_t_24;
+    case 0x0014145e: *win_size = 24; return (cb_converter)cb_SubmitPlayerResultResultCallback_t_24;
+    case 0x000c145f: *win_size = 16; return (cb_converter)cb_EndGameResultCallback_t_16;
+    case 0x011414b5: *win_size = 280; return (cb_converter)cb_JoinPartyCallback_t_280;
+    case 0x000c14b6: *win_size = 16; return (cb_converter)cb_CreateBeaconCallback_t_16;
+    case 0x0110051b: *win_size = 280; return (cb_converter)cb_RemoteStorageFileShareResult_t_280;
+    case 0x0010051d: *win_size = 24; return (cb_converter)cb_RemoteStoragePublishFileResult_t_24;
+    case 0x000c051f: *win_size = 16; return (cb_converter)cb_RemoteStorageDeletePublishedFileResult_t_16;
+    case 0x019c0520: *win_size = 416; return (cb_converter)cb_RemoteStorageEnumerateUserPublishedFilesResult_t_416;
+    case 0x000c0521: *win_size = 16; return (cb_converter)cb_RemoteStorageSubscribePublishedFileResult_t_16;
+    case 0x02640522: *win_size = 616; return (cb_converter)cb_RemoteStorageEnumerateUserSubscribedFilesResult_t_616;
+    case 0x000c0523: *win_size = 16; return (cb_converter)cb_RemoteStorageUnsubscribePublishedFileResult_t_16;
+    case 0x00100524: *win_size = 24; return (cb_converter)cb_RemoteStorageUpdatePublishedFileResult_t_24;
+    case 0x01200525: *win_size = 296; return (cb_converter)cb_RemoteStorageDownloadUGCResult_t_296;
+    case 0x26140526: *win_size = 9760; return (cb_converter)cb_RemoteStorageGetPublishedFileDetailsResult_t_9760;
+    case 0x026c0527: *win_size = 624; return (cb_converter)cb_RemoteStorageEnumerateWorkshopFilesResult_t_624;
+    case 0x001c0528: *win_size = 32; return (cb_converter)cb_RemoteStorageGetPublishedItemVoteDetailsResult_t_32;
+    case 0x000c052c: *win_size = 16; return (cb_converter)cb_RemoteStorageUpdateUserPublishedItemVoteResult_t_16;
+    case 0x0010052d: *win_size = 24; return (cb_converter)cb_RemoteStorageUserVoteDetails_t_24;
+    case 0x019c052e: *win_size = 416; return (cb_converter)cb_RemoteStorageEnumerateUserSharedWorkshopFilesResult_t_416;
+    case 0x0010052f: *win_size = 24; return (cb_converter)cb_RemoteStorageSetUserPublishedFileActionResult_t_24;
+    case 0x00140532: *win_size = 24; return (cb_converter)cb_RemoteStoragePublishedFileUpdated_t_24;
+    case 0x001c0452: *win_size = 32; return (cb_converter)cb_LeaderboardScoreUploaded_t_32;
+    case 0x000c0457: *win_size = 16; return (cb_converter)cb_LeaderboardUGCSet_t_16;
+    case 0x00140458: *win_size = 24; return (cb_converter)cb_PS3TrophiesInstalled_t_24;
+    case 0x002403ff: *win_size = 40; return (cb_converter)cb_FileDetailsResult_t_40;
+    case 0x00180835: *win_size = 32; return (cb_converter)cb_HTTPRequestCompleted_t_32;
+    case 0x000c0836: *win_size = 16; return (cb_converter)cb_HTTPRequestHeadersReceived_t_16;
+    case 0x00140837: *win_size = 24; return (cb_converter)cb_HTTPRequestDataReceived_t_24;
+    case 0x00200af3: *win_size = 40; return (cb_converter)cb_SteamInputConfigurationLoaded_t_40;
+    case 0x00180af4: *win_size = 32; return (cb_converter)cb_SteamInputGamepadSlotChange_t_32;
+    case 0x26280d4a: *win_size = 9784; return (cb_converter)cb_SteamUGCRequestUGCDetailsResult_t_9784;
+    case 0x00100d4b: *win_size = 24; return (cb_converter)cb_CreateItemResult_t_24;
+    case 0x000c0d4d: *win_size = 16; return (cb_converter)cb_ItemInstalled_t_16;
+    case 0x00100d4e: *win_size = 24; return (cb_converter)cb_DownloadItemResult_t_24;
+    case 0x00140d54: *win_size = 24; return (cb_converter)cb_AddUGCDependencyResult_t_24;
+    case 0x00140d55: *win_size = 24; return (cb_converter)cb_RemoveUGCDependencyResult_t_24;
+    case 0x00100d56: *win_size = 24; return (cb_converter)cb_AddAppDependencyResult_t_24;
+    case 0x00100d57: *win_size = 24; return (cb_converter)cb_RemoveAppDependencyResult_t_24;
+    case 0x00940d58: *win_size = 152; return (cb_converter)cb_GetAppDependenciesResult_t_152;
+    case 0x000c0d59: *win_size = 16; return (cb_converter)cb_DeleteItemResult_t_16;
+    case 0x00301196: *win_size = 48; return (cb_converter)cb_HTML_NeedsPaint_t_48;
+    case 0x00141197: *win_size = 20; return (cb_converter)cb_HTML_StartRequest_t_20;
+    case 0x00181199: *win_size = 24; return (cb_converter)cb_HTML_URLChanged_t_24;
+    case 0x000c119a: *win_size = 12; return (cb_converter)cb_HTML_FinishedRequest_t_12;
+    case 0x0008119b: *win_size = 8; return (cb_converter)cb_HTML_OpenLinkInNewTab_t_8;
+    case 0x0008119c: *win_size = 8; return (cb_converter)cb_HTML_ChangedTitle_t_8;
+    case 0x001411a1: *win_size = 20; return (cb_converter)cb_HTML_LinkAtPosition_t_20;
+    case 0x000811a2: *win_size = 8; return (cb_converter)cb_HTML_JSAlert_t_8;
+    case 0x000811a3: *win_size = 8; return (cb_converter)cb_HTML_JSConfirm_t_8;
+    case 0x000c11a4: *win_size = 12; return (cb_converter)cb_HTML_FileOpenDialog_t_12;
+    case 0x001c11a9: *win_size = 28; return (cb_converter)cb_HTML_NewWindow_t_28;
+    case 0x000811ab: *win_size = 8; return (cb_converter)cb_HTML_StatusText_t_8;
+    case 0x000811ac: *win_size = 8; return (cb_converter)cb_HTML_ShowToolTip_t_8;
+    case 0x000811ad: *win_size = 8; return (cb_converter)cb_HTML_UpdateToolTip_t_8;
+    case 0x00141260: *win_size = 24; return (cb_converter)cb_SteamInventoryStartPurchaseResult_t_24;
+    case 0x02c004c5: *win_size = 712; return (cb_converter)cb_SteamNetConnectionStatusChangedCallback_t_712;
+    case 0x002000d1: *win_size = 40; return (cb_converter)cb_GSReputation_t_40;
+    case 0x01180517: *win_size = 288; return (cb_converter)cb_RemoteStorageAppSyncProgress_t_288;
+    case 0x024004c5: *win_size = 584; return (cb_converter)cb_SteamNetConnectionStatusChangedCallback_t_584;
+    case 0x00140835: *win_size = 24; return (cb_converter)cb_HTTPRequestCompleted_t_24;
+    case 0x001011a5: *win_size = 16; return (cb_converter)cb_HTML_ComboNeedsPaint_t_16;
+    case 0x001811a9: *win_size = 24; return (cb_converter)cb_HTML_NewWindow_t_24;
+    case 0x26240d4a: *win_size = 9776; return (cb_converter)cb_SteamUGCRequestUGCDetailsResult_t_9776;
+    case 0x000c051b: *win_size = 16; return (cb_converter)cb_RemoteStorageFileShareResult_t_16;
+    case 0x26200d4a: *win_size = 9768; return (cb_converter)cb_SteamUGCRequestUGCDetailsResult_t_9768;
+    case 0x26100526: *win_size = 9752; return (cb_converter)cb_RemoteStorageGetPublishedFileDetailsResult_t_9752;
+    case 0x000c051d: *win_size = 16; return (cb_converter)cb_RemoteStoragePublishFileResult_t_16;
+    case 0x000c0524: *win_size = 16; return (cb_converter)cb_RemoteStorageUpdatePublishedFileResult_t_16;
+    case 0x02640527: *win_size = 616; return (cb_converter)cb_RemoteStorageEnumerateWorkshopFilesResult_t_616;
+    case 0x250c0526: *win_size = 9496; return (cb_converter)cb_RemoteStorageGetPublishedFileDetailsResult_t_9496;
+    case 0x06c4051e: *win_size = 1744; return (cb_converter)cb_RemoteStorageGetPublishedFileDetailsResult_t_1744;
+    case 0x0020051c: *win_size = 40; return (cb_converter)cb_RemoteStorageDownloadUGCResult_t_40;
+#endif
+#ifdef __x86_64__
+    case 0x00100098: *win_size = 24; return (cb_converter)cb_MicroTxnAuthorizationResponse_t_24;
+    case 0x000c0201: *win_size = 16; return (cb_converter)cb_LobbyCreated_t_16;
+    case 0x000c145b: *win_size = 16; return (cb_converter)cb_RequestPlayersForGameProgressCallback_t_16;
+    case 0x0038145c: *win_size = 64; return (cb_converter)cb_RequestPlayersForGameResultCallback_t_64;
+    case 0x0014145d: *win_size = 24; return (cb_converter)cb_RequestPlayersForGameFinalResultCallback_t_24;
+    case 0x0014145e: *win_size = 24; return (cb_converter)cb_SubmitPlayerResultResultCallback_t_24;
+    case 0x000c145f: *win_size = 16; return (cb_converter)cb_EndGameResultCallback_t_16;
+    case 0x011414b5: *win_size = 280; return (cb_converter)cb_JoinPartyCallback_t_280;
+    case 0x000c14b6: *win_size = 16; return (cb_converter)cb_CreateBeaconCallback_t_16;
+    case 0x0110051b: *win_size = 280; return (cb_converter)cb_RemoteStorageFileShareResult_t_280;
+    case 0x0010051d: *win_size = 24; return (cb_converter)cb_RemoteStoragePublishFileResult_t_24;
+    case 0x000c051f: *win_size = 16; return (cb_converter)cb_RemoteStorageDeletePublishedFileResult_t_16;
+    case 0x019c0520: *win_size = 416; return (cb_converter)cb_RemoteStorageEnumerateUserPublishedFilesResult_t_416;
+    case 0x000c0521: *win_size = 16; return (cb_converter)cb_RemoteStorageSubscribePublishedFileResult_t_16;
+    case 0x02640522: *win_size = 616; return (cb_converter)cb_RemoteStorageEnumerateUserSubscribedFilesResult_t_616;
+    case 0x000c0523: *win_size = 16; return (cb_converter)cb_RemoteStorageUnsubscribePublishedFileResult_t_16;
+    case 0x00100524: *win_size = 24; return (cb_converter)cb_RemoteStorageUpdatePublishedFileResult_t_24;
+    case 0x01200525: *win_size = 296; return (cb_converter)cb_RemoteStorageDownloadUGCResult_t_296;
+    case 0x26140526: *win_size = 9760; return (cb_converter)cb_RemoteStorageGetPublishedFileDetailsResult_t_9760;
+    case 0x026c0527: *win_size = 624; return (cb_converter)cb_RemoteStorageEnumerateWorkshopFilesResult_t_624;
+    case 0x001c0528: *win_size = 32; return (cb_converter)cb_RemoteStorageGetPublishedItemVoteDetailsResult_t_32;
+    case 0x000c052c: *win_size = 16; return (cb_converter)cb_RemoteStorageUpdateUserPublishedItemVoteResult_t_16;
+    case 0x0010052d: *win_size = 24; return (cb_converter)cb_RemoteStorageUserVoteDetails_t_24;
+    case 0x019c052e: *win_size = 416; return (cb_converter)cb_RemoteStorageEnumerateUserSharedWorkshopFilesResult_t_416;
+    case 0x0010052f: *win_size = 24; return (cb_converter)cb_RemoteStorageSetUserPublishedFileActionResult_t_24;
+    case 0x00140532: *win_size = 24; return (cb_converter)cb_RemoteStoragePublishedFileUpdated_t_24;
+    case 0x001c0452: *win_size = 32; return (cb_converter)cb_LeaderboardScoreUploaded_t_32;
+    case 0x000c0457: *win_size = 16; return (cb_converter)cb_LeaderboardUGCSet_t_16;
+    case 0x00140458: *win_size = 24; return (cb_converter)cb_PS3TrophiesInstalled_t_24;
+    case 0x002403ff: *win_size = 40; return (cb_converter)cb_FileDetailsResult_t_40;
+    case 0x00180835: *win_size = 32; return (cb_converter)cb_HTTPRequestCompleted_t_32;
+    case 0x000c0836: *win_size = 16; return (cb_converter)cb_HTTPRequestHeadersReceived_t_16;
+    case 0x00140837: *win_size = 24; return (cb_converter)cb_HTTPRequestDataReceived_t_24;
+    case 0x00200af3: *win_size = 40; return (cb_converter)cb_SteamInputConfigurationLoaded_t_40;
+    case 0x00180af4: *win_size = 32; return (cb_converter)cb_SteamInputGamepadSlotChange_t_32;
+    case 0x26280d4a: *win_size = 9784; return (cb_converter)cb_SteamUGCRequestUGCDetailsResult_t_9784;
+    case 0x00100d4b: *win_size = 24; return (cb_converter)cb_CreateItemResult_t_24;
+    case 0x000c0d4d: *win_size = 16; return (cb_converter)cb_ItemInstalled_t_16;
+    case 0x00100d4e: *win_size = 24; return (cb_converter)cb_DownloadItemResult_t_24;
+    case 0x00140d54: *win_size = 24; return (cb_converter)cb_AddUGCDependencyResult_t_24;
+    case 0x00140d55: *win_size = 24; return (cb_converter)cb_RemoveUGCDependencyResult_t_24;
+    case 0x00100d56: *win_size = 24; return (cb_converter)cb_AddAppDependencyResult_t_24;
+    case 0x00100d57: *win_size = 24; return (cb_converter)cb_RemoveAppDependencyResult_t_24;
+    case 0x00940d58: *win_size = 152; return (cb_converter)cb_GetAppDependenciesResult_t_152;
+    case 0x000c0d59: *win_size = 16; return (cb_converter)cb_DeleteItemResult_t_16;
+    case 0x00341196: *win_size = 56; return (cb_converter)cb_HTML_NeedsPaint_t_56;
+    case 0x00201197: *win_size = 40; return (cb_converter)cb_HTML_StartRequest_t_40;
+    case 0x00241199: *win_size = 48; return (cb_converter)cb_HTML_URLChanged_t_48;
+    case 0x0014119a: *win_size = 24; return (cb_converter)cb_HTML_FinishedRequest_t_24;
+    case 0x000c119b: *win_size = 16; return (cb_converter)cb_HTML_OpenLinkInNewTab_t_16;
+    case 0x000c119c: *win_size = 16; return (cb_converter)cb_HTML_ChangedTitle_t_16;
+    case 0x001811a1: *win_size = 32; return (cb_converter)cb_HTML_LinkAtPosition_t_32;
+    case 0x000c11a2: *win_size = 16; return (cb_converter)cb_HTML_JSAlert_t_16;
+    case 0x000c11a3: *win_size = 16; return (cb_converter)cb_HTML_JSConfirm_t_16;
+    case 0x001411a4: *win_size = 24; return (cb_converter)cb_HTML_FileOpenDialog_t_24;
+    case 0x002011a9: *win_size = 40; return (cb_converter)cb_HTML_NewWindow_t_40;
+    case 0x000c11ab: *win_size = 16; return (cb_converter)cb_HTML_StatusText_t_16;
+    case 0x000c11ac: *win_size = 16; return (cb_converter)cb_HTML_ShowToolTip_t_16;
+    case 0x000c11ad: *win_size = 16; return (cb_converter)cb_HTML_UpdateToolTip_t_16;
+    case 0x00141260: *win_size = 24; return (cb_converter)cb_SteamInventoryStartPurchaseResult_t_24;
+    case 0x02c004c5: *win_size = 712; return (cb_converter)cb_SteamNetConnectionStatusChangedCallback_t_712;
+    case 0x002000d1: *win_size = 40; return (cb_converter)cb_GSReputation_t_40;
+    case 0x01180517: *win_size = 288; return (cb_converter)cb_RemoteStorageAppSyncProgress_t_288;
+    case 0x024004c5: *win_size = 584; return (cb_converter)cb_SteamNetConnectionStatusChangedCallback_t_584;
+    case 0x00140835: *win_size = 24; return (cb_converter)cb_HTTPRequestCompleted_t_24;
+    case 0x001411a5: *win_size = 24; return (cb_converter)cb_HTML_ComboNeedsPaint_t_24;
+    case 0x001c11a9: *win_size = 32; return (cb_converter)cb_HTML_NewWindow_t_32;
+    case 0x26240d4a: *win_size = 9776; return (cb_converter)cb_SteamUGCRequestUGCDetailsResult_t_9776;
+    case 0x000c051b: *win_size = 16; return (cb_converter)cb_RemoteStorageFileShareResult_t_16;
+    case 0x26200d4a: *win_size = 9768; return (cb_converter)cb_SteamUGCRequestUGCDetailsResult_t_9768;
+    case 0x26100526: *win_size = 9752; return (cb_converter)cb_RemoteStorageGetPublishedFileDetailsResult_t_9752;
+    case 0x000c051d: *win_size = 16; return (cb_converter)cb_RemoteStoragePublishFileResult_t_16;
+    case 0x000c0524: *win_size = 16; return (cb_converter)cb_RemoteStorageUpdatePublishedFileResult_t_16;
+    case 0x02640527: *win_size = 616; return (cb_converter)cb_RemoteStorageEnumerateWorkshopFilesResult_t_616;
+    case 0x250c0526: *win_size = 9496; return (cb_converter)cb_RemoteStorageGetPublishedFileDetailsResult_t_9496;
+    case 0x06c4051e: *win_size = 1744; return (cb_converter)cb_RemoteStorageGetPublishedFileDetailsResult_t_1744;
+    case 0x0020051c: *win_size = 40; return (cb_converter)cb_RemoteStorageDownloadUGCResult_t_40;
+#endif
+    }
+    return NULL;
+}
+
+static int switch_callback_len(int cb)
+{
+    switch(cb){
+#ifdef __i386__
+    case 152: return 16;
+    case 209: return 32;
+    case 513: return 12;
+    case 1023: return 36;
+    case 1106: return 28;
+    case 1111: return 12;
+    case 1112: return 20;
+    case 1221: return 704;
+    case 1303: return 280;
+    case 1307: return 272;
+    case 1308: return 32;
+    case 1309: return 16;
+    case 1310: return 1732;
+    case 1311: return 12;
+    case 1312: return 412;
+    case 1313: return 12;
+    case 1314: return 612;
+    case 1315: return 12;
+    case 1316: return 16;
+    case 1317: return 288;
+    case 1318: return 9748;
+    case 1319: return 620;
+    case 1320: return 28;
+    case 1324: return 12;
+    case 1325: return 16;
+    case 1326: return 412;
+    case 1327: return 16;
+    case 1330: return 20;
+    case 2101: return 24;
+    case 2102: return 12;
+    case 2103: return 20;
+    case 2803: return 32;
+    case 2804: return 24;
+    case 3402: return 9768;
+    case 3403: return 16;
+    case 3405: return 12;
+    case 3406: return 16;
+    case 3412: return 20;
+    case 3413: return 20;
+    case 3414: return 16;
+    case 3415: return 16;
+    case 3416: return 148;
+    case 3417: return 12;
+    case 4502: return 48;
+    case 4503: return 20;
+    case 4505: return 24;
+    case 4506: return 12;
+    case 4507: return 8;
+    case 4508: return 8;
+    case 4513: return 20;
+    case 4514: return 8;
+    case 4515: return 8;
+    case 4516: return 12;
+    case 4517: return 16;
+    case 4521: return 28;
+    case 4523: return 8;
+    case 4524: return 8;
+    case 4525: return 8;
+    case 4704: return 20;
+    case 5211: return 12;
+    case 5212: return 56;
+    case 5213: return 20;
+    case 5214: return 20;
+    case 5215: return 12;
+    case 5301: return 276;
+    case 5302: return 12;
+#endif
+#ifdef __x86_64__
+    case 152: return 16;
+    case 209: return 32;
+    case 513: return 12;
+    case 1023: return 36;
+    case 1106: return 28;
+    case 1111: return 12;
+    case 1112: return 20;
+    case 1221: return 704;
+    case 1303: return 280;
+    case 1307: return 272;
+    case 1308: return 32;
+    case 1309: return 16;
+    case 1310: return 1732;
+    case 1311: return 12;
+    case 1312: return 412;
+    case 1313: return 12;
+    case 1314: return 612;
+    case 1315: return 12;
+    case 1316: return 16;
+    case 1317: return 288;
+    case 1318: return 9748;
+    case 1319: return 620;
+    case 1320: return 28;
+    case 1324: return 12;
+    case 1325: return 16;
+    case 1326: return 412;
+    case 1327: return 16;
+    case 1330: return 20;
+    case 2101: return 24;
+    case 2102: return 12;
+    case 2103: return 20;
+    case 2803: return 32;
+    case 2804: return 24;
+    case 3402: return 9768;
+    case 3403: return 16;
+    case 3405: return 12;
+    case 3406: return 16;
+    case 3412: return 20;
+    case 3413: return 20;
+    case 3414: return 16;
+    case 3415: return 16;
+    case 3416: return 148;
+    case 3417: return 12;
+    case 4502: return 52;
+    case 4503: return 32;
+    case 4505: return 36;
+    case 4506: return 20;
+    case 4507: return 12;
+    case 4508: return 12;
+    case 4513: return 24;
+    case 4514: return 12;
+    case 4515: return 12;
+    case 4516: return 20;
+    case 4517: return 20;
+    case 4521: return 32;
+    case 4523: return 12;
+    case 4524: return 12;
+    case 4525: return 12;
+    case 4704: return 20;
+    case 5211: return 12;
+    case 5212: return 56;
+    case 5213: return 20;
+    case 5214: return 20;
+    case 5215: return 12;
+    case 5301: return 276;
+    case 5302: return 12;
+#endif
+    }
+    return 0;
+}
+
+static cb_converter switch_getapi(int cb, int callback_len)
+{
+    switch(cb){
+#ifdef __i386__
+    case 152:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_MicroTxnAuthorizationResponse_t_24;
+        }
+    case 209:
+        switch(callback_len){
+        default:
+        case 40: return (cb_converter)cb_GSReputation_t_40;
+        }
+    case 513:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_LobbyCreated_t_16;
+        }
+    case 1023:
+        switch(callback_len){
+        default:
+        case 40: return (cb_converter)cb_FileDetailsResult_t_40;
+        }
+    case 1106:
+        switch(callback_len){
+        default:
+        case 32: return (cb_converter)cb_LeaderboardScoreUploaded_t_32;
+        }
+    case 1111:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_LeaderboardUGCSet_t_16;
+        }
+    case 1112:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_PS3TrophiesInstalled_t_24;
+        }
+    case 1221:
+        switch(callback_len){
+        default:
+        case 712: return (cb_converter)cb_SteamNetConnectionStatusChangedCallback_t_712;
+        case 584: return (cb_converter)cb_SteamNetConnectionStatusChangedCallback_t_584;
+        }
+    case 1303:
+        switch(callback_len){
+        default:
+        case 288: return (cb_converter)cb_RemoteStorageAppSyncProgress_t_288;
+        }
+    case 1307:
+        switch(callback_len){
+        default:
+        case 280: return (cb_converter)cb_RemoteStorageFileShareResult_t_280;
+        case 16: return (cb_converter)cb_RemoteStorageFileShareResult_t_16;
+        }
+    case 1308:
+        switch(callback_len){
+        default:
+        case 40: return (cb_converter)cb_RemoteStorageDownloadUGCResult_t_40;
+        }
+    case 1309:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_RemoteStoragePublishFileResult_t_24;
+        case 16: return (cb_converter)cb_RemoteStoragePublishFileResult_t_16;
+        }
+    case 1310:
+        switch(callback_len){
+        default:
+        case 1744: return (cb_converter)cb_RemoteStorageGetPublishedFileDetailsResult_t_1744;
+        }
+    case 1311:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_RemoteStorageDeletePublishedFileResult_t_16;
+        }
+    case 1312:
+        switch(callback_len){
+        default:
+        case 416: return (cb_converter)cb_RemoteStorageEnumerateUserPublishedFilesResult_t_416;
+        }
+    case 1313:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_RemoteStorageSubscribePublishedFileResult_t_16;
+        }
+    case 1314:
+        switch(callback_len){
+        default:
+        case 616: return (cb_converter)cb_RemoteStorageEnumerateUserSubscribedFilesResult_t_616;
+        }
+    case 1315:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_RemoteStorageUnsubscribePublishedFileResult_t_16;
+        }
+    case 1316:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_RemoteStorageUpdatePublishedFileResult_t_24;
+        case 16: return (cb_converter)cb_RemoteStorageUpdatePublishedFileResult_t_16;
+        }
+    case 1317:
+        switch(callback_len){
+        default:
+        case 296: return (cb_converter)cb_RemoteStorageDownloadUGCResult_t_296;
+        }
+    case 1318:
+        switch(callback_len){
+        default:
+        case 9760: return (cb_converter)cb_RemoteStorageGetPublishedFileDetailsResult_t_9760;
+        case 9752: return (cb_converter)cb_RemoteStorageGetPublishedFileDetailsResult_t_9752;
+        case 9496: return (cb_converter)cb_RemoteStorageGetPublishedFileDetailsResult_t_9496;
+        }
+    case 1319:
+        switch(callback_len){
+        default:
+        case 624: return (cb_converter)cb_RemoteStorageEnumerateWorkshopFilesResult_t_624;
+        case 616: return (cb_converter)cb_RemoteStorageEnumerateWorkshopFilesResult_t_616;
+        }
+    case 1320:
+        switch(callback_len){
+        default:
+        case 32: return (cb_converter)cb_RemoteStorageGetPublishedItemVoteDetailsResult_t_32;
+        }
+    case 1324:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_RemoteStorageUpdateUserPublishedItemVoteResult_t_16;
+        }
+    case 1325:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_RemoteStorageUserVoteDetails_t_24;
+        }
+    case 1326:
+        switch(callback_len){
+        default:
+        case 416: return (cb_converter)cb_RemoteStorageEnumerateUserSharedWorkshopFilesResult_t_416;
+        }
+    case 1327:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_RemoteStorageSetUserPublishedFileActionResult_t_24;
+        }
+    case 1330:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_RemoteStoragePublishedFileUpdated_t_24;
+        }
+    case 2101:
+        switch(callback_len){
+        default:
+        case 32: return (cb_converter)cb_HTTPRequestCompleted_t_32;
+        case 24: return (cb_converter)cb_HTTPRequestCompleted_t_24;
+        }
+    case 2102:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_HTTPRequestHeadersReceived_t_16;
+        }
+    case 2103:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_HTTPRequestDataReceived_t_24;
+        }
+    case 2803:
+        switch(callback_len){
+        default:
+        case 40: return (cb_converter)cb_SteamInputConfigurationLoaded_t_40;
+        }
+    case 2804:
+        switch(callback_len){
+        default:
+        case 32: return (cb_converter)cb_SteamInputGamepadSlotChange_t_32;
+        }
+    case 3402:
+        switch(callback_len){
+        default:
+        case 9784: return (cb_converter)cb_SteamUGCRequestUGCDetailsResult_t_9784;
+        case 9776: return (cb_converter)cb_SteamUGCRequestUGCDetailsResult_t_9776;
+        case 9768: return (cb_converter)cb_SteamUGCRequestUGCDetailsResult_t_9768;
+        }
+    case 3403:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_CreateItemResult_t_24;
+        }
+    case 3405:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_ItemInstalled_t_16;
+        }
+    case 3406:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_DownloadItemResult_t_24;
+        }
+    case 3412:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_AddUGCDependencyResult_t_24;
+        }
+    case 3413:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_RemoveUGCDependencyResult_t_24;
+        }
+    case 3414:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_AddAppDependencyResult_t_24;
+        }
+    case 3415:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_RemoveAppDependencyResult_t_24;
+        }
+    case 3416:
+        switch(callback_len){
+        default:
+        case 152: return (cb_converter)cb_GetAppDependenciesResult_t_152;
+        }
+    case 3417:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_DeleteItemResult_t_16;
+        }
+    case 4502:
+        switch(callback_len){
+        default:
+        case 48: return (cb_converter)cb_HTML_NeedsPaint_t_48;
+        }
+    case 4503:
+        switch(callback_len){
+        default:
+        case 20: return (cb_converter)cb_HTML_StartRequest_t_20;
+        }
+    case 4505:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_HTML_URLChanged_t_24;
+        }
+    case 4506:
+        switch(callback_len){
+        default:
+        case 12: return (cb_converter)cb_HTML_FinishedRequest_t_12;
+        }
+    case 4507:
+        switch(callback_len){
+        default:
+        case 8: return (cb_converter)cb_HTML_OpenLinkInNewTab_t_8;
+        }
+    case 4508:
+        switch(callback_len){
+        default:
+        case 8: return (cb_converter)cb_HTML_ChangedTitle_t_8;
+        }
+    case 4513:
+        switch(callback_len){
+        default:
+        case 20: return (cb_converter)cb_HTML_LinkAtPosition_t_20;
+        }
+    case 4514:
+        switch(callback_len){
+        default:
+        case 8: return (cb_converter)cb_HTML_JSAlert_t_8;
+        }
+    case 4515:
+        switch(callback_len){
+        default:
+        case 8: return (cb_converter)cb_HTML_JSConfirm_t_8;
+        }
+    case 4516:
+        switch(callback_len){
+        default:
+        case 12: return (cb_converter)cb_HTML_FileOpenDialog_t_12;
+        }
+    case 4517:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_HTML_ComboNeedsPaint_t_16;
+        }
+    case 4521:
+        switch(callback_len){
+        default:
+        case 28: return (cb_converter)cb_HTML_NewWindow_t_28;
+        case 24: return (cb_converter)cb_HTML_NewWindow_t_24;
+        }
+    case 4523:
+        switch(callback_len){
+        default:
+        case 8: return (cb_converter)cb_HTML_StatusText_t_8;
+        }
+    case 4524:
+        switch(callback_len){
+        default:
+        case 8: return (cb_converter)cb_HTML_ShowToolTip_t_8;
+        }
+    case 4525:
+        switch(callback_len){
+        default:
+        case 8: return (cb_converter)cb_HTML_UpdateToolTip_t_8;
+        }
+    case 4704:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_SteamInventoryStartPurchaseResult_t_24;
+        }
+    case 5211:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_RequestPlayersForGameProgressCallback_t_16;
+        }
+    case 5212:
+        switch(callback_len){
+        default:
+        case 64: return (cb_converter)cb_RequestPlayersForGameResultCallback_t_64;
+        }
+    case 5213:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_RequestPlayersForGameFinalResultCallback_t_24;
+        }
+    case 5214:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_SubmitPlayerResultResultCallback_t_24;
+        }
+    case 5215:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_EndGameResultCallback_t_16;
+        }
+    case 5301:
+        switch(callback_len){
+        default:
+        case 280: return (cb_converter)cb_JoinPartyCallback_t_280;
+        }
+    case 5302:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_CreateBeaconCallback_t_16;
+        }
+#endif
+#ifdef __x86_64__
+    case 152:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_MicroTxnAuthorizationResponse_t_24;
+        }
+    case 209:
+        switch(callback_len){
+        default:
+        case 40: return (cb_converter)cb_GSReputation_t_40;
+        }
+    case 513:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_LobbyCreated_t_16;
+        }
+    case 1023:
+        switch(callback_len){
+        default:
+        case 40: return (cb_converter)cb_FileDetailsResult_t_40;
+        }
+    case 1106:
+        switch(callback_len){
+        default:
+        case 32: return (cb_converter)cb_LeaderboardScoreUploaded_t_32;
+        }
+    case 1111:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_LeaderboardUGCSet_t_16;
+        }
+    case 1112:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_PS3TrophiesInstalled_t_24;
+        }
+    case 1221:
+        switch(callback_len){
+        default:
+        case 712: return (cb_converter)cb_SteamNetConnectionStatusChangedCallback_t_712;
+        case 584: return (cb_converter)cb_SteamNetConnectionStatusChangedCallback_t_584;
+        }
+    case 1303:
+        switch(callback_len){
+        default:
+        case 288: return (cb_converter)cb_RemoteStorageAppSyncProgress_t_288;
+        }
+    case 1307:
+        switch(callback_len){
+        default:
+        case 280: return (cb_converter)cb_RemoteStorageFileShareResult_t_280;
+        case 16: return (cb_converter)cb_RemoteStorageFileShareResult_t_16;
+        }
+    case 1308:
+        switch(callback_len){
+        default:
+        case 40: return (cb_converter)cb_RemoteStorageDownloadUGCResult_t_40;
+        }
+    case 1309:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_RemoteStoragePublishFileResult_t_24;
+        case 16: return (cb_converter)cb_RemoteStoragePublishFileResult_t_16;
+        }
+    case 1310:
+        switch(callback_len){
+        default:
+        case 1744: return (cb_converter)cb_RemoteStorageGetPublishedFileDetailsResult_t_1744;
+        }
+    case 1311:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_RemoteStorageDeletePublishedFileResult_t_16;
+        }
+    case 1312:
+        switch(callback_len){
+        default:
+        case 416: return (cb_converter)cb_RemoteStorageEnumerateUserPublishedFilesResult_t_416;
+        }
+    case 1313:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_RemoteStorageSubscribePublishedFileResult_t_16;
+        }
+    case 1314:
+        switch(callback_len){
+        default:
+        case 616: return (cb_converter)cb_RemoteStorageEnumerateUserSubscribedFilesResult_t_616;
+        }
+    case 1315:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_RemoteStorageUnsubscribePublishedFileResult_t_16;
+        }
+    case 1316:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_RemoteStorageUpdatePublishedFileResult_t_24;
+        case 16: return (cb_converter)cb_RemoteStorageUpdatePublishedFileResult_t_16;
+        }
+    case 1317:
+        switch(callback_len){
+        default:
+        case 296: return (cb_converter)cb_RemoteStorageDownloadUGCResult_t_296;
+        }
+    case 1318:
+        switch(callback_len){
+        default:
+        case 9760: return (cb_converter)cb_RemoteStorageGetPublishedFileDetailsResult_t_9760;
+        case 9752: return (cb_converter)cb_RemoteStorageGetPublishedFileDetailsResult_t_9752;
+        case 9496: return (cb_converter)cb_RemoteStorageGetPublishedFileDetailsResult_t_9496;
+        }
+    case 1319:
+        switch(callback_len){
+        default:
+        case 624: return (cb_converter)cb_RemoteStorageEnumerateWorkshopFilesResult_t_624;
+        case 616: return (cb_converter)cb_RemoteStorageEnumerateWorkshopFilesResult_t_616;
+        }
+    case 1320:
+        switch(callback_len){
+        default:
+        case 32: return (cb_converter)cb_RemoteStorageGetPublishedItemVoteDetailsResult_t_32;
+        }
+    case 1324:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_RemoteStorageUpdateUserPublishedItemVoteResult_t_16;
+        }
+    case 1325:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_RemoteStorageUserVoteDetails_t_24;
+        }
+    case 1326:
+        switch(callback_len){
+        default:
+        case 416: return (cb_converter)cb_RemoteStorageEnumerateUserSharedWorkshopFilesResult_t_416;
+        }
+    case 1327:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_RemoteStorageSetUserPublishedFileActionResult_t_24;
+        }
+    case 1330:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_RemoteStoragePublishedFileUpdated_t_24;
+        }
+    case 2101:
+        switch(callback_len){
+        default:
+        case 32: return (cb_converter)cb_HTTPRequestCompleted_t_32;
+        case 24: return (cb_converter)cb_HTTPRequestCompleted_t_24;
+        }
+    case 2102:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_HTTPRequestHeadersReceived_t_16;
+        }
+    case 2103:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_HTTPRequestDataReceived_t_24;
+        }
+    case 2803:
+        switch(callback_len){
+        default:
+        case 40: return (cb_converter)cb_SteamInputConfigurationLoaded_t_40;
+        }
+    case 2804:
+        switch(callback_len){
+        default:
+        case 32: return (cb_converter)cb_SteamInputGamepadSlotChange_t_32;
+        }
+    case 3402:
+        switch(callback_len){
+        default:
+        case 9784: return (cb_converter)cb_SteamUGCRequestUGCDetailsResult_t_9784;
+        case 9776: return (cb_converter)cb_SteamUGCRequestUGCDetailsResult_t_9776;
+        case 9768: return (cb_converter)cb_SteamUGCRequestUGCDetailsResult_t_9768;
+        }
+    case 3403:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_CreateItemResult_t_24;
+        }
+    case 3405:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_ItemInstalled_t_16;
+        }
+    case 3406:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_DownloadItemResult_t_24;
+        }
+    case 3412:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_AddUGCDependencyResult_t_24;
+        }
+    case 3413:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_RemoveUGCDependencyResult_t_24;
+        }
+    case 3414:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_AddAppDependencyResult_t_24;
+        }
+    case 3415:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_RemoveAppDependencyResult_t_24;
+        }
+    case 3416:
+        switch(callback_len){
+        default:
+        case 152: return (cb_converter)cb_GetAppDependenciesResult_t_152;
+        }
+    case 3417:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_DeleteItemResult_t_16;
+        }
+    case 4502:
+        switch(callback_len){
+        default:
+        case 56: return (cb_converter)cb_HTML_NeedsPaint_t_56;
+        }
+    case 4503:
+        switch(callback_len){
+        default:
+        case 40: return (cb_converter)cb_HTML_StartRequest_t_40;
+        }
+    case 4505:
+        switch(callback_len){
+        default:
+        case 48: return (cb_converter)cb_HTML_URLChanged_t_48;
+        }
+    case 4506:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_HTML_FinishedRequest_t_24;
+        }
+    case 4507:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_HTML_OpenLinkInNewTab_t_16;
+        }
+    case 4508:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_HTML_ChangedTitle_t_16;
+        }
+    case 4513:
+        switch(callback_len){
+        default:
+        case 32: return (cb_converter)cb_HTML_LinkAtPosition_t_32;
+        }
+    case 4514:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_HTML_JSAlert_t_16;
+        }
+    case 4515:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_HTML_JSConfirm_t_16;
+        }
+    case 4516:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_HTML_FileOpenDialog_t_24;
+        }
+    case 4517:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_HTML_ComboNeedsPaint_t_24;
+        }
+    case 4521:
+        switch(callback_len){
+        default:
+        case 40: return (cb_converter)cb_HTML_NewWindow_t_40;
+        case 32: return (cb_converter)cb_HTML_NewWindow_t_32;
+        }
+    case 4523:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_HTML_StatusText_t_16;
+        }
+    case 4524:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_HTML_ShowToolTip_t_16;
+        }
+    case 4525:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_HTML_UpdateToolTip_t_16;
+        }
+    case 4704:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_SteamInventoryStartPurchaseResult_t_24;
+        }
+    case 5211:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_RequestPlayersForGameProgressCallback_t_16;
+        }
+    case 5212:
+        switch(callback_len){
+        default:
+        case 64: return (cb_converter)cb_RequestPlayersForGameResultCallback_t_64;
+        }
+    case 5213:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_RequestPlayersForGameFinalResultCallback_t_24;
+        }
+    case 5214:
+        switch(callback_len){
+        default:
+        case 24: return (cb_converter)cb_SubmitPlayerResultResultCallback_t_24;
+        }
+    case 5215:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_EndGameResultCallback_t_16;
+        }
+    case 5301:
+        switch(callback_len){
+        default:
+        case 280: return (cb_converter)cb_JoinPartyCallback_t_280;
+        }
+    case 5302:
+        switch(callback_len){
+        default:
+        case 16: return (cb_converter)cb_CreateBeaconCallback_t_16;
+        }
+#endif
+    }
+    return NULL;
+}
+
+static const int cb_nums[] =
+{
+    -1,
+    0,
+    151,
+    152,
+    153,
+    208,
+    209,
+    210,
+    512,
+    513,
+    514,
+    1022,
+    1023,
+    1024,
+    1105,
+    1106,
+    1107,
+    1110,
+    1111,
+    1112,
+    1113,
+    1220,
+    1221,
+    1222,
+    1302,
+    1303,
+    1304,
+    1306,
+    1307,
+    1308,
+    1309,
+    1310,
+    1311,
+    1312,
+    1313,
+    1314,
+    1315,
+    1316,
+    1317,
+    1318,
+    1319,
+    1320,
+    1321,
+    1323,
+    1324,
+    1325,
+    1326,
+    1327,
+    1328,
+    1329,
+    1330,
+    1331,
+    2100,
+    2101,
+    2102,
+    2103,
+    2104,
+    2802,
+    2803,
+    2804,
+    2805,
+    3401,
+    3402,
+    3403,
+    3404,
+    3405,
+    3406,
+    3407,
+    3411,
+    3412,
+    3413,
+    3414,
+    3415,
+    3416,
+    3417,
+    3418,
+    4501,
+    4502,
+    4503,
+    4504,
+    4505,
+    4506,
+    4507,
+    4508,
+    4509,
+    4512,
+    4513,
+    4514,
+    4515,
+    4516,
+    4517,
+    4518,
+    4520,
+    4521,
+    4522,
+    4523,
+    4524,
+    4525,
+    4526,
+    4703,
+    4704,
+    4705,
+    5210,
+    5211,
+    5212,
+    5213,
+    5214,
+    5215,
+    5216,
+    5300,
+    5301,
+    5302,
+    5303,
+    65688,
+    65745,
+    66049,
+    66559,
+    66642,
+    66647,
+    66648,
+    66757,
+    66839,
+    66843,
+    66844,
+    66845,
+    66846,
+    66847,
+    66848,
+    66849,
+    66850,
+    66851,
+    66852,
+    66853,
+    66854,
+    66855,
+    66856,
+    66860,
+    66861,
+    66862,
+    66863,
+    66866,
+    67637,
+    67638,
+    67639,
+    68339,
+    68340,
+    68938,
+    68939,
+    68941,
+    68942,
+    68948,
+    68949,
+    68950,
+    68951,
+    68952,
+    68953,
+    70038,
+    70039,
+    70041,
+    70042,
+    70043,
+    70044,
+    70049,
+    70050,
+    70051,
+    70052,
+    70053,
+    70057,
+    70059,
+    70060,
+    70061,
+    70240,
+    70747,
+    70748,
+    70749,
+    70750,
+    70751,
+    70837,
+    70838,
+};
+
+static const int sizes[] =
+{
+    -1,
+    0,
+    8,
+    12,
+    16,
+    20,
+    24,
+    28,
+    32,
+    36,
+    40,
+    48,
+    52,
+    56,
+    64,
+    148,
+    152,
+    272,
+    276,
+    280,
+    288,
+    296,
+    412,
+    416,
+    576,
+    584,
+    612,
+    616,
+    620,
+    624,
+    704,
+    712,
+    1732,
+    1744,
+    9484,
+    9496,
+    9744,
+    9748,
+    9752,
+    9760,
+    9764,
+    9768,
+    9776,
+    9784,
+    65544,
+    65548,
+    65552,
+    65556,
+    65560,
+    65564,
+    65568,
+    65576,
+    65584,
+    65592,
+    65600,
+    65688,
+    65816,
+    65824,
+    65832,
+    65952,
+    66120,
+    66152,
+    66160,
+    66248,
+    67280,
+    75032,
+    75288,
+    75296,
+    75304,
+    75312,
+    75320,
+};
+
+int main(void)
+{
+    const struct cb_entry *entry;
+    unsigned int i, j, tests = 0, failures = 0;
+    cb_converter expected;
+    int id, win_size;
+
+    for (i = 0; i < sizeof(cb_nums) / sizeof(cb_nums[0]); ++i)
+    {
+        for (j = 0; j < sizeof(sizes) / sizeof(sizes[0]); ++j)
+        {
+            id = cb_nums[i] | (sizes[j] << 16);
+            win_size = 0;
+            expected = switch_converter(id, &win_size);
+            entry = find_cb_converter(id);
+            if (entry ? entry->convert != expected || entry->win_size != win_size : expected != NULL)
+            {
+                printf("callback %d size %d: wrong converter\n", cb_nums[i], sizes[j]);
+                ++failures;
+            }
+
+            expected = switch_getapi(cb_nums[i], sizes[j]);
+            entry = find_cb_getapi_entry(cb_nums[i], sizes[j]);
+            if (entry ? entry->convert != expected || entry->lin_size != switch_callback_len(cb_nums[i])
+                    : expected != NULL || switch_callback_len(cb_nums[i]) != 0)
+            {
+                printf("API call result %d size %d: wrong converter\n", cb_nums[i], sizes[j]);
+                ++failures;
+            }
+            tests += 2;
+        }
+    }
+
+    printf("%u tests, %u failures\n", tests, failures);
+    return failures != 0;
+}
@@ -10,5 +10,6 @@ rm vrclient_x64/struct*.cpp
 
 rm tests/*_autogen.c
 rm tests/*_autogen.h
+rm tests/bench/*_autogen.*
 
-./gen_wrapper.py
+./gen_wrapper.py "$@"
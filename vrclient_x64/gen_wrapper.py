@@ -7,11 +7,16 @@ from __future__ import print_function
 
 CLANG_PATH='/usr/lib/clang/15'
 
-from clang.cindex import CursorKind, Index, Type, TypeKind
+from clang.cindex import Cursor, CursorKind, Index, Type, TypeKind, conf
+from collections import Counter
+import argparse
+import contextlib
+import json
 import pprint
 import sys
 import os
 import re
+import time
 
 sdk_versions = [
     "v1.23.7",
@@ -411,6 +416,17 @@ method_overrides_data = [
     ("IVRClientCore", "struct client_core_data", None),
 ]
 
+#generated wrappers timed by tests/bench/bench_thunks_autogen.c, some called every
+#frame without and with struct conversion
+bench_methods = [
+    ("IVRSystem_022", "GetRecommendedRenderTargetSize"),
+    ("IVRSystem_022", "GetStringTrackedDeviceProperty"),
+    ("IVRInput_010", "UpdateActionState"),
+    ("IVRSystem_022", "PollNextEvent"),
+    ("IVRSystem_022", "GetControllerState"),
+    ("IVRInput_010", "GetPoseActionDataRelativeToNow"),
+]
+
 def display_sdkver(s):
     if s.startswith("v"):
         s = s[1:]
@@ -478,6 +494,8 @@ def handle_method(cfile, classname, winclassname, cppname, method, cpp, cpp_h, e
     do_wrap = None
     do_unwrap = None
     need_convert = []
+    win_params = []
+    win_struct_sizes = None
     for param in get_params(method):
         if param.type.kind == TypeKind.POINTER and \
                 param.type.get_pointee().kind == TypeKind.UNEXPOSED:
@@ -499,6 +517,8 @@ def handle_method(cfile, classname, winclassname, cppname, method, cpp, cpp_h, e
                 elif real_type.get_canonical().kind == TypeKind.RECORD and \
                         struct_needs_conversion(real_type.get_canonical()):
                     do_win_to_lin = (strip_const(strip_ns(real_type.get_canonical().spelling)), param.spelling)
+                    win_struct_sizes = (find_windows_struct(real_type.get_canonical()).get_size(),
+                                        find_windows64_struct(real_type.get_canonical()).get_size())
                     if not real_type.is_const_qualified():
                         do_lin_to_win = (strip_const(strip_ns(real_type.get_canonical().spelling)), param.spelling)
                     #preserve pointers
@@ -512,8 +532,10 @@ def handle_method(cfile, classname, winclassname, cppname, method, cpp, cpp_h, e
             cfile.write(", %s _%s" % (typename, unnamed))
             cpp.write(", %s _%s" % (typename, unnamed))
             cpp_h.write(", %s" % typename)
+            win_params.append((typename, "_%s" % unnamed))
             unnamed = chr(ord(unnamed) + 1)
         else:
+            win_params.append((typename, param.spelling))
             cfile.write(", %s %s" % (typename, param.spelling))
             cpp.write(", %s %s" % (typename, param.spelling))
             cpp_h.write(", %s" % (typename))
@@ -672,6 +694,9 @@ def handle_method(cfile, classname, winclassname, cppname, method, cpp, cpp_h, e
         for i in range(len(path_conv["w2l_names"])):
             if path_conv["w2l_arrays"][i]:
                 cfile.write("    vrclient_free_stringlist(lin_%s);\n" % path_conv["w2l_names"][i])
+    if (iface_version, used_name) in bench_methods:
+        bench_wrappers.append((iface_version, cppname, used_name, method, win_params,
+                               do_win_to_lin, win_struct_sizes))
     if do_lin_to_win:
         if next_is_size and not convert_size_param:
             convert_size_param = ", -1"
@@ -700,6 +725,8 @@ def get_iface_version(classname):
     return (ver, False)
 
 max_c_api_param_count = 0
+bench_wrappers = []
+bench_linux_sides = []
 
 def get_capi_thunk_params(method):
     def toBOOL(x):
@@ -857,6 +884,8 @@ WINE_DEFAULT_DEBUG_CHANNEL(vrclient);
             constructors.write("    {\"FnTable:%s\", &create_%s_FnTable, &destroy_%s_FnTable},\n" % (alias, winclassname, winclassname))
 
     generate_c_api_thunk_tests(winclassname, methods, method_names)
+    if any(iface_version == v for v, _ in bench_methods):
+        generate_bench_linux_side(classnode, iface_version, methods)
 
 def strip_const(typename):
     return typename.replace("const ", "", 1)
@@ -1370,33 +1399,285 @@ int main(void)
 """)
         f.write("    test_capi_thunks_%s();\n" % class_name)
 
+def generate_bench_linux_side(classnode, iface_version, methods):
+    bench_linux_sides.append((iface_version, display_sdkver(sdkver)))
+
+    os.makedirs("tests/bench", exist_ok=True)
+    with open("tests/bench/bench_linux_%s_autogen.cpp" % iface_version, "w") as f:
+        f.write("/* This file is auto-generated, do not edit. */\n")
+        f.write("#include \"vrclient_private.h\"\n")
+        f.write("#include \"vrclient_defs.h\"\n")
+        if os.path.isfile("openvr_%s/ivrclientcore.h" % sdkver):
+            f.write("#include \"openvr_%s/ivrclientcore.h\"\n" % sdkver)
+        else:
+            f.write("#include \"openvr_%s/openvr.h\"\n" % sdkver)
+        f.write("using namespace vr;\n\n")
+        f.write("/* linux side object for bench_thunks_autogen.c, does nothing */\n")
+        f.write("class bench_%s : public %s\n{\npublic:\n" % (iface_version, classnode.spelling))
+        for method in methods:
+            f.write("    %s %s(%s)%s" % (method.result_type.spelling, method.spelling,
+                    ", ".join(param.type.spelling for param in get_params(method)),
+                    " const" if method.is_const_method() else ""))
+            if method.result_type.kind == TypeKind.VOID:
+                f.write(" {}\n")
+            else:
+                f.write(" { return {}; }\n")
+        f.write("};\n\n")
+        f.write("extern \"C\" void *create_bench_linux_%s(void)\n{\n" % iface_version)
+        f.write("    return new bench_%s();\n}\n" % iface_version)
+
+def generate_bench_function(f, name, label, target, thunk_params, return_type, param_types, args):
+    f.write("\nstatic void bench_%s(struct thunk *t, void *this_ptr)\n{\n" % name)
+    f.write("    %s (__stdcall *capi)(%s) = (void *)t;\n" % (return_type, ", ".join(param_types) or "void"))
+    f.write("    %s (__stdcall *volatile direct)(%s) = (void *)%s;\n" % (return_type, ", ".join(["void *"] + param_types), target))
+    f.write("    LARGE_INTEGER start, middle, end;\n")
+    f.write("    unsigned int i;\n\n")
+    f.write("    init_thunk(t, this_ptr, %s, %s);\n" % (target, thunk_params))
+    f.write("    QueryPerformanceCounter(&start);\n")
+    f.write("    for (i = 0; i < BENCH_ITERATIONS; i++)\n")
+    f.write("        capi(%s);\n" % ", ".join(args))
+    f.write("    QueryPerformanceCounter(&middle);\n")
+    f.write("    for (i = 0; i < BENCH_ITERATIONS; i++)\n")
+    f.write("        direct(%s);\n" % ", ".join(["this_ptr"] + args))
+    f.write("    QueryPerformanceCounter(&end);\n")
+    f.write("    report(\"%s\", start, middle, end);\n" % label)
+    f.write("}\n")
+
+def generate_thunk_benchmarks():
+    def toBOOL(x):
+        return "TRUE" if x else "FALSE"
+
+    #every thunk get_call_flat_method_pfn() hands out, with the parameter
+    #count, has_floats and is_4th_float it was picked for
+    shapes = [(i, False, False) for i in range(max_c_api_param_count + 1)]
+    shapes += [(i, True, False) for i in range(1, max_c_api_param_count + 1)]
+    shapes += [(i, True, True) for i in range(4, max_c_api_param_count + 1)]
+
+    cppnames = sorted(set(cppname for _, cppname, _, _, _, _, _ in bench_wrappers))
+    sources = ["%s.cpp" % cppname for cppname in cppnames]
+    sources += sorted(set("struct_converters_%s.cpp" % v for _, v in bench_linux_sides))
+
+    os.makedirs("tests/bench", exist_ok=True)
+    with open("tests/bench/bench_thunks_autogen.c", "w") as f:
+        f.write("""/* This file is auto-generated, do not edit. */
+/* ns/call of the flat API thunks and of some of the wrappers they call. A
+ * program of its own, built from the files in this directory,
+ * vrclient_x64/flatapi.c and:
+%s */
+#include <stdarg.h>
+#include <stdint.h>
+#include <stdio.h>
+
+#include "windef.h"
+#include "winbase.h"
+#include "wine/debug.h"
+
+#include "cxx.h"
+#include "flatapi.h"
+#include "vrclient_defs.h"
+
+#include "capi_thunks.h"
+
+#include "struct_converters.h"
+""" % "".join(" *   vrclient_x64/%s\n" % source for source in sources))
+        for cppname in cppnames:
+            f.write("#include \"%s.h\"\n" % cppname)
+        f.write("""
+WINE_DEFAULT_DEBUG_CHANNEL(vrclient);
+
+#define BENCH_ITERATIONS 10000000
+
+#ifdef __i386__
+# define win_struct_size(size32, size64) (size32)
+#else
+# define win_struct_size(size32, size64) (size64)
+#endif
+
+struct bench_object
+{
+    vtable_ptr *vtable;
+    void *linux_side;
+};
+
+static uint64_t bench_data[512];
+static LARGE_INTEGER frequency;
+
+static void report(const char *name, LARGE_INTEGER start, LARGE_INTEGER middle, LARGE_INTEGER end)
+{
+    printf("%-72s %6.2f ns/call, direct %6.2f ns/call\\n", name,
+            (middle.QuadPart - start.QuadPart) * 1e9 / frequency.QuadPart / BENCH_ITERATIONS,
+            (end.QuadPart - middle.QuadPart) * 1e9 / frequency.QuadPart / BENCH_ITERATIONS);
+}
+""")
+        for iface_version, _ in bench_linux_sides:
+            f.write("\nextern void *create_bench_linux_%s(void);\n" % iface_version)
+
+        shape_names = []
+        for param_count, has_floats, is_4th_float in shapes:
+            suffix = "%s%s" % ("_f" if has_floats else "", "_f" if is_4th_float else "")
+            name = "call_flat_method%s%s" % (param_count, suffix)
+            if param_count <= 3:
+                label = "call_flat_method%s, %s params" % ("_f" if has_floats else "", param_count)
+            else:
+                label = name
+            param_types = []
+            args = []
+            for i in range(1, param_count + 1):
+                if has_floats and i == (4 if is_4th_float else 1):
+                    param_types.append("float")
+                    args.append("%s.0f" % i)
+                else:
+                    param_types.append("void *")
+                    args.append("data_ptr_value")
+            f.write("\nstatic void __thiscall bench_target_%s(void *_this" % name)
+            for i, typename in enumerate(param_types):
+                f.write(", %s a%s" % (typename, i + 1))
+            f.write(")\n{\n}\n")
+            generate_bench_function(f, name, label, "bench_target_%s" % name,
+                    "%s, %s, %s" % (param_count, toBOOL(has_floats), toBOOL(is_4th_float)),
+                    "void", param_types, args)
+            shape_names.append(name)
+
+        for iface_version, cppname, method_name, method, win_params, do_win_to_lin, win_struct_sizes in bench_wrappers:
+            assert method.result_type.get_canonical().kind != TypeKind.RECORD
+            name = "%s_%s" % (iface_version, method_name)
+            return_type = strip_ns(method.result_type.spelling)
+            f.write("\nstatic %s __thiscall bench_target_%s(struct bench_object *_this" % (return_type, name))
+            for typename, param_name in win_params:
+                f.write(", %s %s" % (typename, param_name))
+            f.write(")\n{\n")
+            f.write("    TRACE(\"%p\\n\", _this);\n")
+            f.write("    %s%s_%s(_this->linux_side" % ("" if method.result_type.kind == TypeKind.VOID else "return ", cppname, method_name))
+            for _, param_name in win_params:
+                f.write(", %s" % param_name)
+            f.write(");\n}\n")
+
+            args = []
+            prev_name = None
+            for typename, param_name in win_params:
+                if do_win_to_lin and prev_name == do_win_to_lin[1] and typename == "uint32_t":
+                    args.append("win_struct_size(%s, %s)" % win_struct_sizes)
+                elif "*" in typename:
+                    args.append("(void *)bench_data")
+                elif typename == "float":
+                    args.append("1.0f")
+                else:
+                    args.append("0")
+                prev_name = param_name
+            label = name
+            if do_win_to_lin:
+                label += " (%s)" % do_win_to_lin[0]
+            generate_bench_function(f, name, label, "bench_target_%s" % name,
+                    get_capi_thunk_params(method), return_type, [t for t, _ in win_params], args)
+
+        f.write("\nint main(void)\n{\n")
+        f.write("    struct thunk *t = alloc_thunks(1);\n")
+        for iface_version, _ in bench_linux_sides:
+            f.write("    struct bench_object %s = {NULL, create_bench_linux_%s()};\n" % (iface_version, iface_version))
+        f.write("\n    QueryPerformanceFrequency(&frequency);\n\n")
+        f.write("    printf(\"flat API thunks, %u calls each:\\n\", BENCH_ITERATIONS);\n")
+        for name in shape_names:
+            f.write("    bench_%s(t, this_ptr_value);\n" % name)
+        f.write("\n    printf(\"\\ngenerated wrappers, through the thunks:\\n\");\n")
+        for iface_version, _, method_name, _, _, _, _ in bench_wrappers:
+            f.write("    bench_%s_%s(t, &%s);\n" % (iface_version, method_name, iface_version))
+        f.write("    VirtualFree(t, 0, MEM_RELEASE);\n")
+        f.write("    return 0;\n")
+        f.write("}\n")
+
+
+#--profile: where the time goes for each SDK version, and how many calls into
+#libclang it takes
+sdk_profile = None
+libclang_calls = Counter()
+libclang_call_kinds = {}
+
+@contextlib.contextmanager
+def profile_phase(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases = sdk_profile["phases"]
+        phases[name] = phases.get(name, 0) + time.perf_counter() - start
+
+def count_libclang_calls():
+    def counted(name, func):
+        def call(*args):
+            libclang_calls[name] += 1
+            return func(*args)
+        return call
+
+    #clang.cindex calls everything through the functions it registered on conf.lib
+    lib = conf.lib
+    for name, func in list(vars(lib).items()):
+        if name.startswith("clang_"):
+            argtypes = func.argtypes or [None]
+            if argtypes[0] is Cursor:
+                libclang_call_kinds[name] = "cursor"
+            elif argtypes[0] is Type:
+                libclang_call_kinds[name] = "type"
+            else:
+                libclang_call_kinds[name] = "other"
+            setattr(lib, name, counted(name, func))
+
+def write_profile(filename, profile):
+    total_calls = Counter()
+    for sdk in profile["sdks"].values():
+        sdk["phases"] = {name: round(t, 4) for name, t in sdk["phases"].items()}
+        calls = sdk["libclang_calls"]
+        total_calls.update(calls)
+        sdk["libclang_calls"] = {kind: sum(n for name, n in calls.items() if libclang_call_kinds[name] == kind)
+                                 for kind in ("cursor", "type", "other")}
+    profile["phases"] = {name: round(t, 4) for name, t in profile["phases"].items()}
+    profile["libclang_calls"] = dict(total_calls.most_common())
+
+    with open(filename, "w") as f:
+        json.dump(profile, f, indent=1)
+    print(f"profile written to {filename}")
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--profile", nargs="?", const="profile.json", metavar="FILE",
+                    help="write the time spent in each phase of each SDK version and the number of "
+                    "libclang calls as JSON to FILE (default: %(const)s)")
+args = parser.parse_args()
+
+if args.profile:
+    count_libclang_calls()
+
+start_time = time.perf_counter()
+profile = {"sdks": {}, "phases": {}}
 
 prog = re.compile("^.*const\s*char.* \*?(\w*)_Version.*\"(.*)\"")
 for sdkver in sdk_versions:
     print(f'parsing SDK version {sdkver}...')
     sdkdir = f'openvr_{sdkver}'
 
-    sources = {}
-    iface_versions = {}
-    has_vrclientcore = False
-    for file in os.listdir(sdkdir):
-        x = open(f"{sdkdir}/{file}", "r")
-        if file == "ivrclientcore.h":
-            has_vrclientcore = True
-
-        for l in x:
-            if "_Version" in l:
-                result = prog.match(l)
-                if result:
-                    iface, version = result.group(1, 2)
-                    iface_versions[iface] = version
-
-    if not has_vrclientcore:
-        source = [f'#include "{sdkdir}/openvr.h"']
-    else:
-        source = [f'#include "{sdkdir}/{file}"' for file, _, _ in files]
+    sdk_profile = {"phases": {}}
+    libclang_calls.clear()
+
+    with profile_phase("scan_headers"):
+        sources = {}
+        iface_versions = {}
+        has_vrclientcore = False
+        for file in os.listdir(sdkdir):
+            x = open(f"{sdkdir}/{file}", "r")
+            if file == "ivrclientcore.h":
+                has_vrclientcore = True
+
+            for l in x:
+                if "_Version" in l:
+                    result = prog.match(l)
+                    if result:
+                        iface, version = result.group(1, 2)
+                        iface_versions[iface] = version
+
+        if not has_vrclientcore:
+            source = [f'#include "{sdkdir}/openvr.h"']
+        else:
+            source = [f'#include "{sdkdir}/{file}"' for file, _, _ in files]
 
-    sources["source.cpp"] = "\n".join(source)
+        sources["source.cpp"] = "\n".join(source)
     windows_args = ["-D_WIN32", "-fms-extensions", "-Wno-ignored-attributes",
                     "-mms-bitfields", "-U__linux__", "-Wno-incompatible-ms-struct"]
     windows_args += ['-I' + CLANG_PATH + '/include/']
@@ -1405,23 +1686,27 @@ for sdkver in sdk_versions:
 
     index = Index.create()
 
-    linux_build32 = index.parse("source.cpp", args=linux_args + ["-m32"], unsaved_files=sources.items())
-    diagnostics = list(linux_build32.diagnostics)
+    with profile_phase("parse_linux32"):
+        linux_build32 = index.parse("source.cpp", args=linux_args + ["-m32"], unsaved_files=sources.items())
+        diagnostics = list(linux_build32.diagnostics)
     for diag in diagnostics: print(diag)
     assert len(diagnostics) == 0
 
-    linux_build64 = index.parse("source.cpp", args=linux_args + ["-m64"], unsaved_files=sources.items())
-    diagnostics = list(linux_build64.diagnostics)
+    with profile_phase("parse_linux64"):
+        linux_build64 = index.parse("source.cpp", args=linux_args + ["-m64"], unsaved_files=sources.items())
+        diagnostics = list(linux_build64.diagnostics)
     for diag in diagnostics: print(diag)
     assert len(diagnostics) == 0
 
-    windows_build32 = index.parse("source.cpp", args=windows_args + ["-m32"], unsaved_files=sources.items())
-    diagnostics = list(windows_build32.diagnostics)
+    with profile_phase("parse_windows32"):
+        windows_build32 = index.parse("source.cpp", args=windows_args + ["-m32"], unsaved_files=sources.items())
+        diagnostics = list(windows_build32.diagnostics)
     for diag in diagnostics: print(diag)
     assert len(diagnostics) == 0
 
-    windows_build64 = index.parse("source.cpp", args=windows_args + ["-m64"], unsaved_files=sources.items())
-    diagnostics = list(windows_build64.diagnostics)
+    with profile_phase("parse_windows64"):
+        windows_build64 = index.parse("source.cpp", args=windows_args + ["-m64"], unsaved_files=sources.items())
+        diagnostics = list(windows_build64.diagnostics)
     for diag in diagnostics: print(diag)
     assert len(diagnostics) == 0
 
@@ -1435,21 +1720,31 @@ for sdkver in sdk_versions:
             elif not vr_only:
                 yield child
 
-    windows_structs32 = dict(reversed([(child.type.spelling, child.type) for child
-                                       in enumerate_structs(windows_build32.cursor)]))
-    windows_structs64 = dict(reversed([(child.type.spelling, child.type) for child
-                                       in enumerate_structs(windows_build64.cursor)]))
-    linux_structs64 = dict(reversed([(child.type.spelling, child.type) for child
-                                     in enumerate_structs(linux_build64.cursor)]))
+    with profile_phase("find_structs"):
+        windows_structs32 = dict(reversed([(child.type.spelling, child.type) for child
+                                           in enumerate_structs(windows_build32.cursor)]))
+        windows_structs64 = dict(reversed([(child.type.spelling, child.type) for child
+                                           in enumerate_structs(windows_build64.cursor)]))
+        linux_structs64 = dict(reversed([(child.type.spelling, child.type) for child
+                                         in enumerate_structs(linux_build64.cursor)]))
 
     for child in enumerate_structs(linux_build32.cursor, vr_only=True):
+        #handle_class() writes its output as it goes, so its time includes that
         if child.kind == CursorKind.CLASS_DECL and child.displayname in classes:
-            handle_class(sdkver, child)
+            with profile_phase("handle_class"):
+                handle_class(sdkver, child)
         if child.kind in [CursorKind.STRUCT_DECL, CursorKind.CLASS_DECL]:
-            handle_struct(sdkver, child)
+            with profile_phase("handle_struct"):
+                handle_struct(sdkver, child)
         if child.displayname in print_sizes:
             sys.stdout.write("size of %s is %u\n" % (child.displayname, child.type.get_size()))
 
+    sdk_profile["struct_needs_conversion_cache_misses"] = len(struct_conversion_cache.get(sdkver, {}))
+    sdk_profile["libclang_calls"] = dict(libclang_calls)
+    profile["sdks"][sdkver] = sdk_profile
+
+write_start = time.perf_counter()
+
 for f in cpp_files_need_close_brace:
     m = open(f, "a")
     m.write("\n}\n")
@@ -1459,3 +1754,9 @@ with open("tests/main_autogen.c", "a") as f:
     f.write("}\n")
 
 generate_flatapi_c()
+generate_thunk_benchmarks()
+profile["phases"]["write"] = time.perf_counter() - write_start
+
+if args.profile:
+    profile["phases"]["total"] = time.perf_counter() - start_time
+    write_profile(args.profile, profile)
@@ -0,0 +1,48 @@
+/* This file is auto-generated, do not edit. */
+#include "vrclient_private.h"
+#include "vrclient_defs.h"
+#include "openvr_v1.23.7/ivrclientcore.h"
+using namespace vr;
+
+/* linux side object for bench_thunks_autogen.c, does nothing */
+class bench_IVRInput_010 : public IVRInput
+{
+public:
+    vr::EVRInputError SetActionManifestPath(const char *) { return {}; }
+    vr::EVRInputError GetActionSetHandle(const char *, VRActionSetHandle_t *) { return {}; }
+    vr::EVRInputError GetActionHandle(const char *, VRActionHandle_t *) { return {}; }
+    vr::EVRInputError GetInputSourceHandle(const char *, VRInputValueHandle_t *) { return {}; }
+    vr::EVRInputError UpdateActionState(VRActiveActionSet_t *, uint32_t, uint32_t) { return {}; }
+    vr::EVRInputError GetDigitalActionData(vr::VRActionHandle_t, InputDigitalActionData_t *, uint32_t, vr::VRInputValueHandle_t) { return {}; }
+    vr::EVRInputError GetAnalogActionData(vr::VRActionHandle_t, InputAnalogActionData_t *, uint32_t, vr::VRInputValueHandle_t) { return {}; }
+    vr::EVRInputError GetPoseActionDataRelativeToNow(vr::VRActionHandle_t, vr::ETrackingUniverseOrigin, float, InputPoseActionData_t *, uint32_t, vr::VRInputValueHandle_t) { return {}; }
+    vr::EVRInputError GetPoseActionDataForNextFrame(vr::VRActionHandle_t, vr::ETrackingUniverseOrigin, InputPoseActionData_t *, uint32_t, vr::VRInputValueHandle_t) { return {}; }
+    vr::EVRInputError GetSkeletalActionData(vr::VRActionHandle_t, InputSkeletalActionData_t *, uint32_t) { return {}; }
+    vr::EVRInputError GetDominantHand(ETrackedControllerRole *) { return {}; }
+    vr::EVRInputError SetDominantHand(vr::ETrackedControllerRole) { return {}; }
+    vr::EVRInputError GetBoneCount(vr::VRActionHandle_t, uint32_t *) { return {}; }
+    vr::EVRInputError GetBoneHierarchy(vr::VRActionHandle_t, BoneIndex_t *, uint32_t) { return {}; }
+    vr::EVRInputError GetBoneName(vr::VRActionHandle_t, vr::BoneIndex_t, char *, uint32_t) { return {}; }
+    vr::EVRInputError GetSkeletalReferenceTransforms(vr::VRActionHandle_t, vr::EVRSkeletalTransformSpace, vr::EVRSkeletalReferencePose, VRBoneTransform_t *, uint32_t) { return {}; }
+    vr::EVRInputError GetSkeletalTrackingLevel(vr::VRActionHandle_t, EVRSkeletalTrackingLevel *) { return {}; }
+    vr::EVRInputError GetSkeletalBoneData(vr::VRActionHandle_t, vr::EVRSkeletalTransformSpace, vr::EVRSkeletalMotionRange, VRBoneTransform_t *, uint32_t) { return {}; }
+    vr::EVRInputError GetSkeletalSummaryData(vr::VRActionHandle_t, vr::EVRSummaryType, VRSkeletalSummaryData_t *) { return {}; }
+    vr::EVRInputError GetSkeletalBoneDataCompressed(vr::VRActionHandle_t, vr::EVRSkeletalMotionRange, void *, uint32_t, uint32_t *) { return {}; }
+    vr::EVRInputError DecompressSkeletalBoneData(const void *, uint32_t, vr::EVRSkeletalTransformSpace, VRBoneTransform_t *, uint32_t) { return {}; }
+    vr::EVRInputError TriggerHapticVibrationAction(vr::VRActionHandle_t, float, float, float, float, vr::VRInputValueHandle_t) { return {}; }
+    vr::EVRInputError GetActionOrigins(vr::VRActionSetHandle_t, vr::VRActionHandle_t, VRInputValueHandle_t *, uint32_t) { return {}; }
+    vr::EVRInputError GetOriginLocalizedName(vr::VRInputValueHandle_t, char *, uint32_t, int32_t) { return {}; }
+    vr::EVRInputError GetOriginTrackedDeviceInfo(vr::VRInputValueHandle_t, InputOriginInfo_t *, uint32_t) { return {}; }
+    vr::EVRInputError GetActionBindingInfo(vr::VRActionHandle_t, InputBindingInfo_t *, uint32_t, uint32_t, uint32_t *) { return {}; }
+    vr::EVRInputError ShowActionOrigins(vr::VRActionSetHandle_t, vr::VRActionHandle_t) { return {}; }
+    vr::EVRInputError ShowBindingsForActionSet(VRActiveActionSet_t *, uint32_t, uint32_t, vr::VRInputValueHandle_t) { return {}; }
+    vr::EVRInputError GetComponentStateForBinding(const char *, const char *, const InputBindingInfo_t *, uint32_t, uint32_t, vr::RenderModel_ComponentState_t *) { return {}; }
+    bool IsUsingLegacyInput() { return {}; }
+    vr::EVRInputError OpenBindingUI(const char *, vr::VRActionSetHandle_t, vr::VRInputValueHandle_t, bool) { return {}; }
+    vr::EVRInputError GetBindingVariant(vr::VRInputValueHandle_t, char *, uint32_t) { return {}; }
+};
+
+extern "C" void *create_bench_linux_IVRInput_010(void)
+{
+    return new bench_IVRInput_010();
+}
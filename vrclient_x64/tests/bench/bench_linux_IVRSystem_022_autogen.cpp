@@ -0,0 +1,62 @@
+/* This file is auto-generated, do not edit. */
+#include "vrclient_private.h"
+#include "vrclient_defs.h"
+#include "openvr_v1.23.7/ivrclientcore.h"
+using namespace vr;
+
+/* linux side object for bench_thunks_autogen.c, does nothing */
+class bench_IVRSystem_022 : public IVRSystem
+{
+public:
+    void GetRecommendedRenderTargetSize(uint32_t *, uint32_t *) {}
+    vr::HmdMatrix44_t GetProjectionMatrix(vr::EVREye, float, float) { return {}; }
+    void GetProjectionRaw(vr::EVREye, float *, float *, float *, float *) {}
+    bool ComputeDistortion(vr::EVREye, float, float, DistortionCoordinates_t *) { return {}; }
+    vr::HmdMatrix34_t GetEyeToHeadTransform(vr::EVREye) { return {}; }
+    bool GetTimeSinceLastVsync(float *, uint64_t *) { return {}; }
+    int32_t GetD3D9AdapterIndex() { return {}; }
+    void GetDXGIOutputInfo(int32_t *) {}
+    void GetOutputDevice(uint64_t *, vr::ETextureType, VkInstance_T *) {}
+    bool IsDisplayOnDesktop() { return {}; }
+    bool SetDisplayVisibility(bool) { return {}; }
+    void GetDeviceToAbsoluteTrackingPose(vr::ETrackingUniverseOrigin, float, TrackedDevicePose_t *, uint32_t) {}
+    vr::HmdMatrix34_t GetSeatedZeroPoseToStandingAbsoluteTrackingPose() { return {}; }
+    vr::HmdMatrix34_t GetRawZeroPoseToStandingAbsoluteTrackingPose() { return {}; }
+    uint32_t GetSortedTrackedDeviceIndicesOfClass(vr::ETrackedDeviceClass, vr::TrackedDeviceIndex_t *, uint32_t, vr::TrackedDeviceIndex_t) { return {}; }
+    vr::EDeviceActivityLevel GetTrackedDeviceActivityLevel(vr::TrackedDeviceIndex_t) { return {}; }
+    void ApplyTransform(TrackedDevicePose_t *, const TrackedDevicePose_t *, const HmdMatrix34_t *) {}
+    vr::TrackedDeviceIndex_t GetTrackedDeviceIndexForControllerRole(vr::ETrackedControllerRole) { return {}; }
+    vr::ETrackedControllerRole GetControllerRoleForTrackedDeviceIndex(vr::TrackedDeviceIndex_t) { return {}; }
+    vr::ETrackedDeviceClass GetTrackedDeviceClass(vr::TrackedDeviceIndex_t) { return {}; }
+    bool IsTrackedDeviceConnected(vr::TrackedDeviceIndex_t) { return {}; }
+    bool GetBoolTrackedDeviceProperty(vr::TrackedDeviceIndex_t, vr::ETrackedDeviceProperty, ETrackedPropertyError *) { return {}; }
+    float GetFloatTrackedDeviceProperty(vr::TrackedDeviceIndex_t, vr::ETrackedDeviceProperty, ETrackedPropertyError *) { return {}; }
+    int32_t GetInt32TrackedDeviceProperty(vr::TrackedDeviceIndex_t, vr::ETrackedDeviceProperty, ETrackedPropertyError *) { return {}; }
+    uint64_t GetUint64TrackedDeviceProperty(vr::TrackedDeviceIndex_t, vr::ETrackedDeviceProperty, ETrackedPropertyError *) { return {}; }
+    vr::HmdMatrix34_t GetMatrix34TrackedDeviceProperty(vr::TrackedDeviceIndex_t, vr::ETrackedDeviceProperty, ETrackedPropertyError *) { return {}; }
+    uint32_t GetArrayTrackedDeviceProperty(vr::TrackedDeviceIndex_t, vr::ETrackedDeviceProperty, vr::PropertyTypeTag_t, void *, uint32_t, ETrackedPropertyError *) { return {}; }
+    uint32_t GetStringTrackedDeviceProperty(vr::TrackedDeviceIndex_t, vr::ETrackedDeviceProperty, char *, uint32_t, ETrackedPropertyError *) { return {}; }
+    const char * GetPropErrorNameFromEnum(vr::ETrackedPropertyError) { return {}; }
+    bool PollNextEvent(VREvent_t *, uint32_t) { return {}; }
+    bool PollNextEventWithPose(vr::ETrackingUniverseOrigin, VREvent_t *, uint32_t, vr::TrackedDevicePose_t *) { return {}; }
+    const char * GetEventTypeNameFromEnum(vr::EVREventType) { return {}; }
+    vr::HiddenAreaMesh_t GetHiddenAreaMesh(vr::EVREye, vr::EHiddenAreaMeshType) { return {}; }
+    bool GetControllerState(vr::TrackedDeviceIndex_t, vr::VRControllerState_t *, uint32_t) { return {}; }
+    bool GetControllerStateWithPose(vr::ETrackingUniverseOrigin, vr::TrackedDeviceIndex_t, vr::VRControllerState_t *, uint32_t, TrackedDevicePose_t *) { return {}; }
+    void TriggerHapticPulse(vr::TrackedDeviceIndex_t, uint32_t, unsigned short) {}
+    const char * GetButtonIdNameFromEnum(vr::EVRButtonId) { return {}; }
+    const char * GetControllerAxisTypeNameFromEnum(vr::EVRControllerAxisType) { return {}; }
+    bool IsInputAvailable() { return {}; }
+    bool IsSteamVRDrawingControllers() { return {}; }
+    bool ShouldApplicationPause() { return {}; }
+    bool ShouldApplicationReduceRenderingWork() { return {}; }
+    vr::EVRFirmwareError PerformFirmwareUpdate(vr::TrackedDeviceIndex_t) { return {}; }
+    void AcknowledgeQuit_Exiting() {}
+    uint32_t GetAppContainerFilePaths(char *, uint32_t) { return {}; }
+    const char * GetRuntimeVersion() { return {}; }
+};
+
+extern "C" void *create_bench_linux_IVRSystem_022(void)
+{
+    return new bench_IVRSystem_022();
+}
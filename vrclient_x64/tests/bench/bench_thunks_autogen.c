@@ -0,0 +1,795 @@
+/* This file is auto-generated, do not edit. */
+/* ns/call of the flat API thunks and of some of the wrappers they call. A
+ * program of its own, built from the files in this directory,
+ * vrclient_x64/flatapi.c and:
+ *   vrclient_x64/cppIVRInput_IVRInput_010.cpp
+ *   vrclient_x64/cppIVRSystem_IVRSystem_022.cpp
+ *   vrclient_x64/struct_converters_1237.cpp
+ */
+#include <stdarg.h>
+#include <stdint.h>
+#include <stdio.h>
+
+#include "windef.h"
+#include "winbase.h"
+#include "wine/debug.h"
+
+#include "cxx.h"
+#include "flatapi.h"
+#include "vrclient_defs.h"
+
+#include "capi_thunks.h"
+
+#include "struct_converters.h"
+#include "cppIVRInput_IVRInput_010.h"
+#include "cppIVRSystem_IVRSystem_022.h"
+
+WINE_DEFAULT_DEBUG_CHANNEL(vrclient);
+
+#define BENCH_ITERATIONS 10000000
+
+#ifdef __i386__
+# define win_struct_size(size32, size64) (size32)
+#else
+# define win_struct_size(size32, size64) (size64)
+#endif
+
+struct bench_object
+{
+    vtable_ptr *vtable;
+    void *linux_side;
+};
+
+static uint64_t bench_data[512];
+static LARGE_INTEGER frequency;
+
+static void report(const char *name, LARGE_INTEGER start, LARGE_INTEGER middle, LARGE_INTEGER end)
+{
+    printf("%-72s %6.2f ns/call, direct %6.2f ns/call\n", name,
+            (middle.QuadPart - start.QuadPart) * 1e9 / frequency.QuadPart / BENCH_ITERATIONS,
+            (end.QuadPart - middle.QuadPart) * 1e9 / frequency.QuadPart / BENCH_ITERATIONS);
+}
+
+extern void *create_bench_linux_IVRSystem_022(void);
+
+extern void *create_bench_linux_IVRInput_010(void);
+
+static void __thiscall bench_target_call_flat_method0(void *_this)
+{
+}
+
+static void bench_call_flat_method0(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(void) = (void *)t;
+    void (__stdcall *volatile direct)(void *) = (void *)bench_target_call_flat_method0;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method0, 0, FALSE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi();
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method, 0 params", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method1(void *_this, void * a1)
+{
+}
+
+static void bench_call_flat_method1(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, void *) = (void *)bench_target_call_flat_method1;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method1, 1, FALSE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method, 1 params", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method2(void *_this, void * a1, void * a2)
+{
+}
+
+static void bench_call_flat_method2(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(void *, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, void *, void *) = (void *)bench_target_call_flat_method2;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method2, 2, FALSE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method, 2 params", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method3(void *_this, void * a1, void * a2, void * a3)
+{
+}
+
+static void bench_call_flat_method3(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(void *, void *, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, void *, void *, void *) = (void *)bench_target_call_flat_method3;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method3, 3, FALSE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method, 3 params", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method4(void *_this, void * a1, void * a2, void * a3, void * a4)
+{
+}
+
+static void bench_call_flat_method4(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(void *, void *, void *, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, void *, void *, void *, void *) = (void *)bench_target_call_flat_method4;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method4, 4, FALSE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method4", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method5(void *_this, void * a1, void * a2, void * a3, void * a4, void * a5)
+{
+}
+
+static void bench_call_flat_method5(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(void *, void *, void *, void *, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, void *, void *, void *, void *, void *) = (void *)bench_target_call_flat_method5;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method5, 5, FALSE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method5", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method6(void *_this, void * a1, void * a2, void * a3, void * a4, void * a5, void * a6)
+{
+}
+
+static void bench_call_flat_method6(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(void *, void *, void *, void *, void *, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, void *, void *, void *, void *, void *, void *) = (void *)bench_target_call_flat_method6;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method6, 6, FALSE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method6", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method7(void *_this, void * a1, void * a2, void * a3, void * a4, void * a5, void * a6, void * a7)
+{
+}
+
+static void bench_call_flat_method7(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(void *, void *, void *, void *, void *, void *, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, void *, void *, void *, void *, void *, void *, void *) = (void *)bench_target_call_flat_method7;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method7, 7, FALSE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method7", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method8(void *_this, void * a1, void * a2, void * a3, void * a4, void * a5, void * a6, void * a7, void * a8)
+{
+}
+
+static void bench_call_flat_method8(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(void *, void *, void *, void *, void *, void *, void *, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, void *, void *, void *, void *, void *, void *, void *, void *) = (void *)bench_target_call_flat_method8;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method8, 8, FALSE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method8", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method9(void *_this, void * a1, void * a2, void * a3, void * a4, void * a5, void * a6, void * a7, void * a8, void * a9)
+{
+}
+
+static void bench_call_flat_method9(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(void *, void *, void *, void *, void *, void *, void *, void *, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, void *, void *, void *, void *, void *, void *, void *, void *, void *) = (void *)bench_target_call_flat_method9;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method9, 9, FALSE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method9", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method1_f(void *_this, float a1)
+{
+}
+
+static void bench_call_flat_method1_f(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(float) = (void *)t;
+    void (__stdcall *volatile direct)(void *, float) = (void *)bench_target_call_flat_method1_f;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method1_f, 1, TRUE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(1.0f);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, 1.0f);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method_f, 1 params", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method2_f(void *_this, float a1, void * a2)
+{
+}
+
+static void bench_call_flat_method2_f(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(float, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, float, void *) = (void *)bench_target_call_flat_method2_f;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method2_f, 2, TRUE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(1.0f, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, 1.0f, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method_f, 2 params", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method3_f(void *_this, float a1, void * a2, void * a3)
+{
+}
+
+static void bench_call_flat_method3_f(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(float, void *, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, float, void *, void *) = (void *)bench_target_call_flat_method3_f;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method3_f, 3, TRUE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(1.0f, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, 1.0f, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method_f, 3 params", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method4_f(void *_this, float a1, void * a2, void * a3, void * a4)
+{
+}
+
+static void bench_call_flat_method4_f(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(float, void *, void *, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, float, void *, void *, void *) = (void *)bench_target_call_flat_method4_f;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method4_f, 4, TRUE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(1.0f, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, 1.0f, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method4_f", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method5_f(void *_this, float a1, void * a2, void * a3, void * a4, void * a5)
+{
+}
+
+static void bench_call_flat_method5_f(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(float, void *, void *, void *, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, float, void *, void *, void *, void *) = (void *)bench_target_call_flat_method5_f;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method5_f, 5, TRUE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(1.0f, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, 1.0f, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method5_f", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method6_f(void *_this, float a1, void * a2, void * a3, void * a4, void * a5, void * a6)
+{
+}
+
+static void bench_call_flat_method6_f(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(float, void *, void *, void *, void *, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, float, void *, void *, void *, void *, void *) = (void *)bench_target_call_flat_method6_f;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method6_f, 6, TRUE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(1.0f, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, 1.0f, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method6_f", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method7_f(void *_this, float a1, void * a2, void * a3, void * a4, void * a5, void * a6, void * a7)
+{
+}
+
+static void bench_call_flat_method7_f(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(float, void *, void *, void *, void *, void *, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, float, void *, void *, void *, void *, void *, void *) = (void *)bench_target_call_flat_method7_f;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method7_f, 7, TRUE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(1.0f, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, 1.0f, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method7_f", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method8_f(void *_this, float a1, void * a2, void * a3, void * a4, void * a5, void * a6, void * a7, void * a8)
+{
+}
+
+static void bench_call_flat_method8_f(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(float, void *, void *, void *, void *, void *, void *, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, float, void *, void *, void *, void *, void *, void *, void *) = (void *)bench_target_call_flat_method8_f;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method8_f, 8, TRUE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(1.0f, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, 1.0f, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method8_f", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method9_f(void *_this, float a1, void * a2, void * a3, void * a4, void * a5, void * a6, void * a7, void * a8, void * a9)
+{
+}
+
+static void bench_call_flat_method9_f(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(float, void *, void *, void *, void *, void *, void *, void *, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, float, void *, void *, void *, void *, void *, void *, void *, void *) = (void *)bench_target_call_flat_method9_f;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method9_f, 9, TRUE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(1.0f, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, 1.0f, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method9_f", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method4_f_f(void *_this, void * a1, void * a2, void * a3, float a4)
+{
+}
+
+static void bench_call_flat_method4_f_f(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(void *, void *, void *, float) = (void *)t;
+    void (__stdcall *volatile direct)(void *, void *, void *, void *, float) = (void *)bench_target_call_flat_method4_f_f;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method4_f_f, 4, TRUE, TRUE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(data_ptr_value, data_ptr_value, data_ptr_value, 4.0f);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, data_ptr_value, data_ptr_value, data_ptr_value, 4.0f);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method4_f_f", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method5_f_f(void *_this, void * a1, void * a2, void * a3, float a4, void * a5)
+{
+}
+
+static void bench_call_flat_method5_f_f(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(void *, void *, void *, float, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, void *, void *, void *, float, void *) = (void *)bench_target_call_flat_method5_f_f;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method5_f_f, 5, TRUE, TRUE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(data_ptr_value, data_ptr_value, data_ptr_value, 4.0f, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, data_ptr_value, data_ptr_value, data_ptr_value, 4.0f, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method5_f_f", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method6_f_f(void *_this, void * a1, void * a2, void * a3, float a4, void * a5, void * a6)
+{
+}
+
+static void bench_call_flat_method6_f_f(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(void *, void *, void *, float, void *, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, void *, void *, void *, float, void *, void *) = (void *)bench_target_call_flat_method6_f_f;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method6_f_f, 6, TRUE, TRUE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(data_ptr_value, data_ptr_value, data_ptr_value, 4.0f, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, data_ptr_value, data_ptr_value, data_ptr_value, 4.0f, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method6_f_f", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method7_f_f(void *_this, void * a1, void * a2, void * a3, float a4, void * a5, void * a6, void * a7)
+{
+}
+
+static void bench_call_flat_method7_f_f(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(void *, void *, void *, float, void *, void *, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, void *, void *, void *, float, void *, void *, void *) = (void *)bench_target_call_flat_method7_f_f;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method7_f_f, 7, TRUE, TRUE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(data_ptr_value, data_ptr_value, data_ptr_value, 4.0f, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, data_ptr_value, data_ptr_value, data_ptr_value, 4.0f, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method7_f_f", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method8_f_f(void *_this, void * a1, void * a2, void * a3, float a4, void * a5, void * a6, void * a7, void * a8)
+{
+}
+
+static void bench_call_flat_method8_f_f(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(void *, void *, void *, float, void *, void *, void *, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, void *, void *, void *, float, void *, void *, void *, void *) = (void *)bench_target_call_flat_method8_f_f;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method8_f_f, 8, TRUE, TRUE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(data_ptr_value, data_ptr_value, data_ptr_value, 4.0f, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, data_ptr_value, data_ptr_value, data_ptr_value, 4.0f, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method8_f_f", start, middle, end);
+}
+
+static void __thiscall bench_target_call_flat_method9_f_f(void *_this, void * a1, void * a2, void * a3, float a4, void * a5, void * a6, void * a7, void * a8, void * a9)
+{
+}
+
+static void bench_call_flat_method9_f_f(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(void *, void *, void *, float, void *, void *, void *, void *, void *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, void *, void *, void *, float, void *, void *, void *, void *, void *) = (void *)bench_target_call_flat_method9_f_f;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_call_flat_method9_f_f, 9, TRUE, TRUE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(data_ptr_value, data_ptr_value, data_ptr_value, 4.0f, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, data_ptr_value, data_ptr_value, data_ptr_value, 4.0f, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value, data_ptr_value);
+    QueryPerformanceCounter(&end);
+    report("call_flat_method9_f_f", start, middle, end);
+}
+
+static void __thiscall bench_target_IVRSystem_022_GetRecommendedRenderTargetSize(struct bench_object *_this, uint32_t * pnWidth, uint32_t * pnHeight)
+{
+    TRACE("%p\n", _this);
+    cppIVRSystem_IVRSystem_022_GetRecommendedRenderTargetSize(_this->linux_side, pnWidth, pnHeight);
+}
+
+static void bench_IVRSystem_022_GetRecommendedRenderTargetSize(struct thunk *t, void *this_ptr)
+{
+    void (__stdcall *capi)(uint32_t *, uint32_t *) = (void *)t;
+    void (__stdcall *volatile direct)(void *, uint32_t *, uint32_t *) = (void *)bench_target_IVRSystem_022_GetRecommendedRenderTargetSize;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_IVRSystem_022_GetRecommendedRenderTargetSize, 2, FALSE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi((void *)bench_data, (void *)bench_data);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, (void *)bench_data, (void *)bench_data);
+    QueryPerformanceCounter(&end);
+    report("IVRSystem_022_GetRecommendedRenderTargetSize", start, middle, end);
+}
+
+static uint32_t __thiscall bench_target_IVRSystem_022_GetStringTrackedDeviceProperty(struct bench_object *_this, TrackedDeviceIndex_t unDeviceIndex, ETrackedDeviceProperty prop, char * pchValue, uint32_t unBufferSize, ETrackedPropertyError * pError)
+{
+    TRACE("%p\n", _this);
+    return cppIVRSystem_IVRSystem_022_GetStringTrackedDeviceProperty(_this->linux_side, unDeviceIndex, prop, pchValue, unBufferSize, pError);
+}
+
+static void bench_IVRSystem_022_GetStringTrackedDeviceProperty(struct thunk *t, void *this_ptr)
+{
+    uint32_t (__stdcall *capi)(TrackedDeviceIndex_t, ETrackedDeviceProperty, char *, uint32_t, ETrackedPropertyError *) = (void *)t;
+    uint32_t (__stdcall *volatile direct)(void *, TrackedDeviceIndex_t, ETrackedDeviceProperty, char *, uint32_t, ETrackedPropertyError *) = (void *)bench_target_IVRSystem_022_GetStringTrackedDeviceProperty;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_IVRSystem_022_GetStringTrackedDeviceProperty, 5, FALSE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(0, 0, (void *)bench_data, 0, (void *)bench_data);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, 0, 0, (void *)bench_data, 0, (void *)bench_data);
+    QueryPerformanceCounter(&end);
+    report("IVRSystem_022_GetStringTrackedDeviceProperty", start, middle, end);
+}
+
+static bool __thiscall bench_target_IVRSystem_022_PollNextEvent(struct bench_object *_this, winVREvent_t_1237 * pEvent, uint32_t uncbVREvent)
+{
+    TRACE("%p\n", _this);
+    return cppIVRSystem_IVRSystem_022_PollNextEvent(_this->linux_side, pEvent, uncbVREvent);
+}
+
+static void bench_IVRSystem_022_PollNextEvent(struct thunk *t, void *this_ptr)
+{
+    bool (__stdcall *capi)(winVREvent_t_1237 *, uint32_t) = (void *)t;
+    bool (__stdcall *volatile direct)(void *, winVREvent_t_1237 *, uint32_t) = (void *)bench_target_IVRSystem_022_PollNextEvent;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_IVRSystem_022_PollNextEvent, 2, FALSE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi((void *)bench_data, win_struct_size(64, 64));
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, (void *)bench_data, win_struct_size(64, 64));
+    QueryPerformanceCounter(&end);
+    report("IVRSystem_022_PollNextEvent (VREvent_t)", start, middle, end);
+}
+
+static bool __thiscall bench_target_IVRSystem_022_GetControllerState(struct bench_object *_this, TrackedDeviceIndex_t unControllerDeviceIndex, winVRControllerState001_t_1237 * pControllerState, uint32_t unControllerStateSize)
+{
+    TRACE("%p\n", _this);
+    return cppIVRSystem_IVRSystem_022_GetControllerState(_this->linux_side, unControllerDeviceIndex, pControllerState, unControllerStateSize);
+}
+
+static void bench_IVRSystem_022_GetControllerState(struct thunk *t, void *this_ptr)
+{
+    bool (__stdcall *capi)(TrackedDeviceIndex_t, winVRControllerState001_t_1237 *, uint32_t) = (void *)t;
+    bool (__stdcall *volatile direct)(void *, TrackedDeviceIndex_t, winVRControllerState001_t_1237 *, uint32_t) = (void *)bench_target_IVRSystem_022_GetControllerState;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_IVRSystem_022_GetControllerState, 3, FALSE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(0, (void *)bench_data, win_struct_size(64, 64));
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, 0, (void *)bench_data, win_struct_size(64, 64));
+    QueryPerformanceCounter(&end);
+    report("IVRSystem_022_GetControllerState (VRControllerState001_t)", start, middle, end);
+}
+
+static EVRInputError __thiscall bench_target_IVRInput_010_UpdateActionState(struct bench_object *_this, VRActiveActionSet_t * pSets, uint32_t unSizeOfVRSelectedActionSet_t, uint32_t unSetCount)
+{
+    TRACE("%p\n", _this);
+    return cppIVRInput_IVRInput_010_UpdateActionState(_this->linux_side, pSets, unSizeOfVRSelectedActionSet_t, unSetCount);
+}
+
+static void bench_IVRInput_010_UpdateActionState(struct thunk *t, void *this_ptr)
+{
+    EVRInputError (__stdcall *capi)(VRActiveActionSet_t *, uint32_t, uint32_t) = (void *)t;
+    EVRInputError (__stdcall *volatile direct)(void *, VRActiveActionSet_t *, uint32_t, uint32_t) = (void *)bench_target_IVRInput_010_UpdateActionState;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_IVRInput_010_UpdateActionState, 3, FALSE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi((void *)bench_data, 0, 0);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, (void *)bench_data, 0, 0);
+    QueryPerformanceCounter(&end);
+    report("IVRInput_010_UpdateActionState", start, middle, end);
+}
+
+static EVRInputError __thiscall bench_target_IVRInput_010_GetPoseActionDataRelativeToNow(struct bench_object *_this, VRActionHandle_t action, ETrackingUniverseOrigin eOrigin, float fPredictedSecondsFromNow, winInputPoseActionData_t_1237 * pActionData, uint32_t unActionDataSize, VRInputValueHandle_t ulRestrictToDevice)
+{
+    TRACE("%p\n", _this);
+    return cppIVRInput_IVRInput_010_GetPoseActionDataRelativeToNow(_this->linux_side, action, eOrigin, fPredictedSecondsFromNow, pActionData, unActionDataSize, ulRestrictToDevice);
+}
+
+static void bench_IVRInput_010_GetPoseActionDataRelativeToNow(struct thunk *t, void *this_ptr)
+{
+    EVRInputError (__stdcall *capi)(VRActionHandle_t, ETrackingUniverseOrigin, float, winInputPoseActionData_t_1237 *, uint32_t, VRInputValueHandle_t) = (void *)t;
+    EVRInputError (__stdcall *volatile direct)(void *, VRActionHandle_t, ETrackingUniverseOrigin, float, winInputPoseActionData_t_1237 *, uint32_t, VRInputValueHandle_t) = (void *)bench_target_IVRInput_010_GetPoseActionDataRelativeToNow;
+    LARGE_INTEGER start, middle, end;
+    unsigned int i;
+
+    init_thunk(t, this_ptr, bench_target_IVRInput_010_GetPoseActionDataRelativeToNow, 6, TRUE, FALSE);
+    QueryPerformanceCounter(&start);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        capi(0, 0, 1.0f, (void *)bench_data, win_struct_size(96, 96), 0);
+    QueryPerformanceCounter(&middle);
+    for (i = 0; i < BENCH_ITERATIONS; i++)
+        direct(this_ptr, 0, 0, 1.0f, (void *)bench_data, win_struct_size(96, 96), 0);
+    QueryPerformanceCounter(&end);
+    report("IVRInput_010_GetPoseActionDataRelativeToNow (InputPoseActionData_t)", start, middle, end);
+}
+
+int main(void)
+{
+    struct thunk *t = alloc_thunks(1);
+    struct bench_object IVRSystem_022 = {NULL, create_bench_linux_IVRSystem_022()};
+    struct bench_object IVRInput_010 = {NULL, create_bench_linux_IVRInput_010()};
+
+    QueryPerformanceFrequency(&frequency);
+
+    printf("flat API thunks, %u calls each:\n", BENCH_ITERATIONS);
+    bench_call_flat_method0(t, this_ptr_value);
+    bench_call_flat_method1(t, this_ptr_value);
+    bench_call_flat_method2(t, this_ptr_value);
+    bench_call_flat_method3(t, this_ptr_value);
+    bench_call_flat_method4(t, this_ptr_value);
+    bench_call_flat_method5(t, this_ptr_value);
+    bench_call_flat_method6(t, this_ptr_value);
+    bench_call_flat_method7(t, this_ptr_value);
+    bench_call_flat_method8(t, this_ptr_value);
+    bench_call_flat_method9(t, this_ptr_value);
+    bench_call_flat_method1_f(t, this_ptr_value);
+    bench_call_flat_method2_f(t, this_ptr_value);
+    bench_call_flat_method3_f(t, this_ptr_value);
+    bench_call_flat_method4_f(t, this_ptr_value);
+    bench_call_flat_method5_f(t, this_ptr_value);
+    bench_call_flat_method6_f(t, this_ptr_value);
+    bench_call_flat_method7_f(t, this_ptr_value);
+    bench_call_flat_method8_f(t, this_ptr_value);
+    bench_call_flat_method9_f(t, this_ptr_value);
+    bench_call_flat_method4_f_f(t, this_ptr_value);
+    bench_call_flat_method5_f_f(t, this_ptr_value);
+    bench_call_flat_method6_f_f(t, this_ptr_value);
+    bench_call_flat_method7_f_f(t, this_ptr_value);
+    bench_call_flat_method8_f_f(t, this_ptr_value);
+    bench_call_flat_method9_f_f(t, this_ptr_value);
+
+    printf("\ngenerated wrappers, through the thunks:\n");
+    bench_IVRSystem_022_GetRecommendedRenderTargetSize(t, &IVRSystem_022);
+    bench_IVRSystem_022_GetStringTrackedDeviceProperty(t, &IVRSystem_022);
+    bench_IVRSystem_022_PollNextEvent(t, &IVRSystem_022);
+    bench_IVRSystem_022_GetControllerState(t, &IVRSystem_022);
+    bench_IVRInput_010_UpdateActionState(t, &IVRInput_010);
+    bench_IVRInput_010_GetPoseActionDataRelativeToNow(t, &IVRInput_010);
+    VirtualFree(t, 0, MEM_RELEASE);
+    return 0;
+}